@@ -1,85 +1,859 @@
+import argparse
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import csv
+import glob
+import hashlib
+import json
+from html.parser import HTMLParser
+import importlib.util
+import io
+import logging
+import os
+import pickle
+import re
+import sqlite3
+import sys
+import time
+import tracemalloc
 from bs4 import BeautifulSoup
 from bs4.element import TemplateString
 import numpy as np
 import pandas as pd
+# resource (for peak memory and the CPU time of worker processes) only exists on Unix
+if importlib.util.find_spec("resource") is not None:
+    import resource
+else:
+    resource = None
+
+
+# Everything this script reports goes through this logger, set up by configure_logging:
+# per-entry chatter at DEBUG, progress and the report at INFO, and anything that needs a
+# second look at WARNING
+logger = logging.getLogger("DGB2021entries")
+# SNITCHING and INTERPRETATION warnings about particular entries are written to this file in
+# each page's output folder (unless main is given one file for them all), one JSON object per line
+WARNINGS_FILE_NAME = "contest_warnings.jsonl"
+
+
+class ConsoleHandler(logging.StreamHandler):
+    """ Prints each message as-is to whatever sys.stdout is at the time,
+    so the output looks just like it did with print, and
+    contextlib.redirect_stdout still catches it.
+    """
 
+    def emit(self, record):
+        self.stream = sys.stdout
+        super().emit(record)
 
-def entry_scraper(source_html):
-    """Provided a string for a source html page (saved to disk, rather than queried
-    from a site), this function scrapes contest entry comments by identifying comments
-    which are 8+ lines long into a list of authors and comments. Returns two lists,
-    one being the authors of each comment and the other being the comments. As an
-    example, authors[14] wrote comments[14]. This function will check for duplicated 
-    author names, and will update any duplicates by appending the index of their 
-    comment to the author name. A list of duplicate authors will be printed as a 
-    warning to the user.
+
+class WarningsFileHandler(logging.Handler):
+    """ Writes each contest warning (see contest_warning) to a JSON Lines
+    file: the page it came from (if given), its kind, its message, and
+    whatever details came with it (the author, the question or column,
+    etc.). Other messages are ignored. The file is started over, unless
+    append is set.
+    """
+
+    def __init__(self, warnings_path, page=None, append=False):
+        super().__init__(level=logging.WARNING)
+        self.addFilter(is_contest_warning)
+        self.page = page
+        self.warnings_file = open(warnings_path, "a" if append else "w", encoding="utf-8")
+
+    def emit(self, record):
+        warning = {"kind": record.warning_kind, "message": record.getMessage(), **record.warning_details}
+        if self.page is not None:
+            warning = {"page": self.page, **warning}
+        self.warnings_file.write(json.dumps(warning, default=str) + "\n")
+
+    def close(self):
+        self.warnings_file.close()
+        super().close()
+
+
+class WarningsCollector(logging.Handler):
+    """ Keeps each contest warning (see contest_warning) in a list, in the
+    same form WarningsFileHandler writes it (kind, message, details), so it
+    can be saved somewhere else and logged again later (see
+    replay_warnings). Other messages are ignored.
+    """
+
+    def __init__(self):
+        super().__init__(level=logging.WARNING)
+        self.addFilter(is_contest_warning)
+        self.warnings = []
+
+    def emit(self, record):
+        self.warnings.append({"kind": record.warning_kind, "message": record.getMessage(),
+                              **record.warning_details})
+
+
+@contextlib.contextmanager
+def collected_warnings():
+    """ Within a with block, sends every message to a WarningsCollector
+    instead of the usual handlers (so nothing is printed or saved), and
+    gives back the collector's list of warnings.
+    """
+    collector = WarningsCollector()
+    handlers = logger.handlers
+    logger.handlers = [collector]
+    try:
+        yield collector.warnings
+    finally:
+        logger.handlers = handlers
+
+
+def replay_warnings(warnings):
+    """ Logs warnings kept by a WarningsCollector again, through
+    contest_warning, so they reach the console and the warnings file just
+    as if they'd been logged the first time.
+    """
+    for warning in warnings:
+        details = dict(warning)
+        contest_warning(details.pop("kind"), details.pop("message"), **details)
+
+
+def is_contest_warning(record):
+    """ Whether a log record came from contest_warning. """
+    return hasattr(record, "warning_kind")
+
+
+def contest_warning(kind, message, **details):
+    """ Logs a warning about a particular entry, like SNITCHING (more than
+    five answers to a question) or INTERPRETATION (an answer that had to be
+    read one way or another). The details (author, question, etc.) are
+    kept with it, for the warnings file set up by configure_logging.
+    """
+    logger.warning(message, extra={"warning_kind": kind, "warning_details": details})
+
+
+def configure_logging(level=logging.INFO, quiet=False, warnings_path=None, page=None, append=False):
+    """ Sets up the logger this script reports through. Messages at level
+    and above are printed (INFO by default; DEBUG brings back the line for
+    every entry handled and every fix made, which is slow at scale). With
+    quiet, only warnings are printed. If a warnings_path is given, contest
+    warnings (see contest_warning) are written there as JSON Lines instead
+    of being printed, each marked with the page they came from, if given
+    (see WarningsFileHandler). Can be called again to change any of this.
+    """
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    logger.setLevel(logging.WARNING if quiet else level)
+    logger.propagate = False
+    console = ConsoleHandler()
+    console.setFormatter(logging.Formatter("%(message)s"))
+    if warnings_path is not None:
+        console.addFilter(lambda record: not is_contest_warning(record))
+        logger.addHandler(WarningsFileHandler(warnings_path, page=page, append=append))
+    logger.addHandler(console)
+
+
+# Until main says otherwise, print everything from INFO up, like plain print calls did
+configure_logging()
+
+
+# HTML elements that never have a closing tag, and so never contain any text
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input",
+                 "link", "meta", "param", "source", "track", "wbr"}
+# BeautifulSoup (with "html.parser" or "lxml") turns any piece of text that's nothing but
+# whitespace into a single newline (or a space, if it has no newline), except inside these
+# tags. The other parsers keep the whitespace as it is, so they do the same by hand to match
+WHITESPACE_PRESERVING_TAGS = {"pre", "textarea"}
+ASCII_WHITESPACE = " \n\t\f\r"
+
+
+# Spellings of "marc-andre fleury" that get rewritten to "fleury" by generate_dataframe,
+# in order of precedence (longer spellings first). These have to be handled before
+# hyphens are turned into commas, or they'd be split up into several answers.
+# Special situation - "marc-andre fleury" messes up replacing '-' with ','
+# Also have to account for 'andré', and for "fluery", apparently
+# Also apparently have to account for hypenation between "andre" and "fleury", I guess
+# Also apparently have to account for "marc-andre f", I guess
+# Also apparently have to account for "marc andre-flurry" too, I guess
+# Also apparently have to account for "andre-fleury" too, I guess
+# Also apparently have to account for "m-a fleury" too, I guess
+# Also apparently have to account for "marc andre-feury" too, I guess
+# If Flower retires, that'd be convenient...
+FLEURY_SPELLINGS = [
+    "marc-andre fleury",
+    "marc-andré fleury",
+    "marc-andre fluery",
+    "marc-andré fluery",
+    "marc andre-fleury",
+    "marc andré-fleury",
+    "marc andre-fluery",
+    "marc andré-fluery",
+    "marc andre-feury",
+    "marc-andre f",
+    "marc andré-f",
+    "marc andre-flurry",
+    "andre-fleury",
+    "m-a fleury",
+]
+# All of the spellings are compiled into one pattern, so a line is scanned once no
+# matter how many spellings there are. Python tries alternatives left to right, so
+# longer spellings listed first still win over shorter ones starting at the same spot
+FLEURY_PATTERN = re.compile("|".join(re.escape(x) for x in FLEURY_SPELLINGS))
+# A handful of people used '&', ';', '-' or '/' instead of ',', those all become commas
+SEPARATORS = ["&", ";", "-", "/"]
+
+
+# Answer columns for each question, as laid out by generate_dataframe
+QUESTION_COLUMNS = {f"q{q}": [f"q{q}a{a}" for a in range(1, 6)] for q in range(1, 10)}
+QUESTION_COLUMNS["q10"] = ["q10a1"]
+# Points given for each correct pick, and taken away for each wrong pick, unless the
+# answer key says otherwise. Blank answers and repeated picks never score
+DEFAULT_POINTS = 1
+DEFAULT_PENALTY = 0
+# Folder holding the alias tables used to standardize answers, one .csv file per table
+ALIAS_TABLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "alias_tables")
+# Which alias tables are used to standardize each question. When a question uses
+# more than one table, they're applied one after another in the order listed
+QUESTION_ALIAS_TABLES = {
+    # Team cities to three letter abbreviation, then team names, then other criteria
+    # (combined city & team name, misspellings, etc.)
+    "q1": ["city_name", "team_name", "teams_other"],
+    "q2": ["city_name", "team_name", "teams_other"],
+    # Variations of coaches names
+    "q3": ["coaches"],
+    # Variations of GM names
+    "q4": ["gms"],
+    # Variations of goalie names
+    "q5": ["goalie"],
+    # Variations of rookie (calder candidate) names
+    "q6": ["rookie"],
+    # Variations of defense (norris candidate) names
+    "q7": ["dmen"],
+    # Variations of hart candidate names
+    "q8": ["hart"],
+    # Variations of names of players to be traded
+    "q9": ["trade"],
+    # Variations of 100-point scorer's names
+    "q10": ["bonus"],
+}
+# Answers that could mean more than one person, by question, along with the answer
+# each should be read as. These are checked after the question is standardized.
+# 2021-22: "d armstrong" of St Louis is an eligible GM, "b armstrong" of Arizona is not
+AMBIGUOUS_ALIASES = {
+    "q4": {"armstrong": "d armstrong"},
+}
+# How each question is described in the reports
+QUESTION_DESCRIPTIONS = {
+    "q1": "Question 1 (teams to make the playoffs)",
+    "q2": "Question 2 (teams to miss the playoffs)",
+    "q3": "Question 3 (coaches to not lose their jobs)",
+    "q4": "Question 4 (GMs to not lose their jobs)",
+    "q5": "Question 5 (goalies to start 60% of team's games)",
+    "q6": "Question 6 (Top 10 Calder Voting)",
+    "q7": "Question 7 (Top 10 Norris Voting)",
+    "q8": "Question 8 (Top 15 Hart Voting)",
+    "q9": "Question 9 (NHL roster players to change teams)",
+    "q10": "Bonus Question 10 (earn 100+ points, not including McDavid)",
+}
+# How many answers come true for the award voting questions, which score every answer
+# that finishes in the top N of the voting (see load_season_odds). Anything else is 1
+QUESTION_PLACES = {
+    "q6": 10,
+    "q7": 10,
+    "q8": 15,
+}
+# The season odds give the chance that something happens (a team makes the playoffs, a
+# coach or GM is fired), but for these questions an answer is right when it doesn't:
+# q2 is teams that miss the playoffs, q3 and q4 are coaches and GMs that keep their jobs.
+# load_season_odds flips their odds, so every question is given the odds of the event itself
+ODDS_AGAINST_QUESTIONS = {"q2", "q3", "q4"}
+# Compiled alias indexes already loaded during this run, by alias table version
+LOADED_ALIAS_INDEXES = {}
+# The fix ledger, which holds every hand fix to the entries keyed by who wrote them and
+# what they wrote, rather than by where they landed in the scrape (see build_fix_ledger)
+FIX_LEDGER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fix_ledger.json")
+# entry_scraper renames repeat commenters to "name entry # index", which isn't stable
+DUPLICATE_AUTHOR_SUFFIX = re.compile(r" entry # \d+$")
+# The stage cache, which keeps parsed and standardized rows between runs. Bump the
+# version whenever parsing or standardizing changes, so old rows aren't reused
+STAGE_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stage_cache.sqlite")
+STAGE_CACHE_VERSION = "2"
+
+
+def collapse_whitespace(text):
+    """ Turns a piece of text that's nothing but whitespace into a single
+    newline (or a space, if it has no newline), the way BeautifulSoup does.
+    Any other text is returned as it is.
+    """
+    if not text or text.strip(ASCII_WHITESPACE):
+        return text
+    return "\n" if "\n" in text else " "
+
+
+def normalize_separators(line):
+    """ Rewrites every spelling in FLEURY_SPELLINGS to "fleury" in a single
+    scan, then turns every one of the SEPARATORS into a comma, and returns
+    the rewritten line. Every one of the spellings has a hyphen in it, so
+    lines without a hyphen (nearly all of them) skip the spellings entirely.
+    """
+    if "-" in line:
+        line = FLEURY_PATTERN.sub("fleury", line)
+    for separator in SEPARATORS:
+        if separator in line:
+            line = line.replace(separator, ",")
+    return line
+
+
+class CommentStreamParser(HTMLParser):
+    """ An event-driven parser that pulls comment authors and comment text
+    out of a saved comment page as it is fed, without building a tree of
+    the whole page. Only text found inside the "parent-comment-container"
+    element is collected, matching what entry_scraper pulls out with
+    BeautifulSoup. Finished authors and comments are placed in the
+    authors and comments queues, in page order, to be picked up by the
+    caller as parsing goes along. Alongside each comment, the details
+    queue gets its DOM id and timestamp (see comment_id).
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        # Stack of currently open tags, so we know when an element closes
+        self.open_tags = []
+        # The comment ID (if any, see comment_element_id) of each currently open tag
+        self.open_ids = []
+        # The most recent comment timestamp, waiting for its comment text
+        self.timestamp = ""
+        # Depth of the comment container in the stack, once we've found it
+        self.container_depth = None
+        # Once the comment container closes, there's nothing left to collect
+        self.finished = False
+        # Elements we're currently collecting text for, as [depth, kind, pieces]
+        self.captures = []
+        # Skip text inside scripts and styles, which isn't part of any comment
+        self.skip_depth = None
+        # Text since the last tag, which can come in several pieces when it's split
+        # across chunks of the page, held until the next tag so it's handled as one
+        self.pending_text = []
+        self.authors = deque()
+        self.comments = deque()
+        self.details = deque()
+
+    def handle_starttag(self, tag, attrs):
+        self.flush_text()
+        if self.finished:
+            return
+        if tag in VOID_ELEMENTS:
+            return
+        attrs = dict(attrs)
+        self.open_tags.append(tag)
+        self.open_ids.append(comment_element_id(attrs))
+        depth = len(self.open_tags)
+        if self.container_depth is None:
+            if attrs.get("id") == "parent-comment-container":
+                self.container_depth = depth
+            return
+        if self.skip_depth is None and tag in ("script", "style"):
+            self.skip_depth = depth
+        classes = (attrs.get("class") or "").split()
+        if "comment-author-text" in classes:
+            self.captures.append([depth, "author", []])
+        if "comment-time-text" in classes:
+            self.captures.append([depth, "timestamp", []])
+        if "comment-text-container" in classes:
+            # The comment's DOM id is on the text itself, or the closest element around it that gives one
+            dom_id = attrs.get("id") or next((x for x in reversed(self.open_ids[self.container_depth:]) if x), None)
+            self.captures.append([depth, "comment", [], dom_id])
+
+    def handle_startendtag(self, tag, attrs):
+        # Self-closing tags (e.g. <br/>) never hold text, so nothing to track
+        if tag not in VOID_ELEMENTS:
+            self.handle_starttag(tag, attrs)
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        self.flush_text()
+        if self.finished or tag not in self.open_tags:
+            return
+        # Close everything up to and including the most recent matching tag
+        while self.open_tags:
+            closed = self.open_tags.pop()
+            self.open_ids.pop()
+            self.close_depth(len(self.open_tags) + 1)
+            if closed == tag:
+                break
+
+    def close_depth(self, depth):
+        """ Wrap up anything that was opened at the given stack depth."""
+        if self.skip_depth == depth:
+            self.skip_depth = None
+        while self.captures and self.captures[-1][0] == depth:
+            capture = self.captures.pop()
+            kind = capture[1]
+            text = "".join(capture[2])
+            if kind == "author":
+                self.authors.append(text)
+            elif kind == "timestamp":
+                self.timestamp = text.strip()
+            else:
+                self.comments.append(text.lstrip().lower())
+                self.details.append((capture[3], self.timestamp))
+                self.timestamp = ""
+        if self.container_depth == depth:
+            self.finished = True
+
+    def handle_comment(self, data):
+        # An HTML comment splits the text around it in two, like a tag does
+        self.flush_text()
+
+    def close(self):
+        super().close()
+        self.flush_text()
+
+    def handle_data(self, data):
+        if self.captures and self.skip_depth is None:
+            self.pending_text.append(data)
+
+    def flush_text(self):
+        """ Adds the text since the last tag to everything being collected,
+        with whitespace collapsed the way BeautifulSoup does it (see
+        collapse_whitespace).
+        """
+        if not self.pending_text:
+            return
+        text = "".join(self.pending_text)
+        self.pending_text = []
+        if WHITESPACE_PRESERVING_TAGS.isdisjoint(self.open_tags):
+            text = collapse_whitespace(text)
+        for capture in self.captures:
+            capture[2].append(text)
+
+
+def comment_element_id(attrs):
+    """ Given the attributes of an element around a comment's text, returns
+    the ID it gives that comment, if any: its data-comment-id, or its id if
+    it's the comment's own element (class "comment"). Any other id belongs
+    to something shared by many comments (e.g. a "comment-list" wrapper),
+    so it says nothing about which comment this is and is ignored.
+    """
+    classes = attrs.get("class") or []
+    if isinstance(classes, str):
+        classes = classes.split()
+    if attrs.get("data-comment-id"):
+        return attrs["data-comment-id"]
+    if "comment" in classes:
+        return attrs.get("id")
+    return None
+
+
+def comment_id(dom_id, author, timestamp, comment):
+    """ Returns a stable ID for a comment, which doesn't change when the
+    page is saved again or comments around it are added or filtered out:
+    the comment's DOM id if the page gives it one (see comment_element_id),
+    otherwise a hash of its author, timestamp and text. Repeats are handled
+    by unique_comment_ids.
+    """
+    if dom_id:
+        return dom_id
+    digest = hashlib.sha256("\x1f".join([author, timestamp, comment]).encode('utf8'))
+    return "c" + digest.hexdigest()[:16]
+
+
+def unique_comment_ids(comment_ids):
+    """ Given the comment IDs for a page, in page order, adds "-2", "-3" and
+    so on to any ID that's already been used (e.g. someone who posted the
+    exact same comment twice), so every comment's ID is unique.
+    """
+    id_counts = Counter()
+    unique_ids = []
+    for x in comment_ids:
+        id_counts[x] += 1
+        unique_ids.append(x if id_counts[x] == 1 else f"{x}-{id_counts[x]}")
+    return unique_ids
+
+
+def paired_comment(parser):
+    """ Takes the next author and comment off of a CommentStreamParser,
+    and returns them along with the comment's ID.
+    """
+    author = parser.authors.popleft()
+    comment = parser.comments.popleft()
+    dom_id, timestamp = parser.details.popleft()
+    return author, comment, comment_id(dom_id, author, timestamp, comment)
+
+
+def stream_comments(source_html, chunk_size=1024 * 1024):
+    """ Provided a string for a source html page saved to disk, this
+    generator reads the page a chunk at a time and yields (author, comment,
+    comment ID) as soon as the author and comment are both found. Memory
+    use stays flat no matter how large the page is, as no tree of the page
+    is ever built. Comments are stripped of leading whitespace and
+    lowercased, as in entry_scraper, and the IDs are made by comment_id.
+    Raises a ValueError at the end of the page if the number of authors
+    and comments found do not match.
+    """
+    parser = CommentStreamParser()
+    authors_found = 0
+    comments_found = 0
+    with open(source_html, 'r', encoding='utf8') as raw:
+        while not parser.finished:
+            chunk = raw.read(chunk_size)
+            if not chunk:
+                parser.close()
+                break
+            parser.feed(chunk)
+            while parser.authors and parser.comments:
+                authors_found += 1
+                comments_found += 1
+                yield paired_comment(parser)
+    while parser.authors and parser.comments:
+        authors_found += 1
+        comments_found += 1
+        yield paired_comment(parser)
+    authors_found += len(parser.authors)
+    comments_found += len(parser.comments)
+    if authors_found != comments_found:
+        raise ValueError(
+            f"Found {authors_found} authors but {comments_found} comments")
+
+
+# Parser backends that entry_scraper knows how to use, along with the module each
+# one needs. "html.parser" is built into Python and is always available.
+PARSER_BACKENDS = {
+    "html.parser": None,
+    "lxml": "lxml",
+    "html5lib": "html5lib",
+    "selectolax": "selectolax",
+}
+
+
+def available_parser(parser):
+    """ Given the name of a parser backend, returns that name if the backend
+    is installed. If the backend is unknown or not installed, a notice is
+    printed and "html.parser" is returned instead, so scraping can carry on.
+    """
+    if parser not in PARSER_BACKENDS:
+        logger.warning(f"NOTICE: Unknown parser '{parser}', using 'html.parser' instead")
+        return "html.parser"
+    module_name = PARSER_BACKENDS[parser]
+    if module_name is not None and importlib.util.find_spec(module_name) is None:
+        logger.warning(f"NOTICE: Parser '{parser}' is not installed, using 'html.parser' instead")
+        return "html.parser"
+    return parser
+
+
+def extract_comments(contents, parser="html.parser"):
+    """ Given the contents of a saved comment page and the name of a parser
+    backend, pulls the comment authors and comment text out of the
+    "parent-comment-container" element. Returns three lists, the authors,
+    their comments (stripped of leading whitespace and lowercased) and the
+    comments' IDs (see comment_id). The BeautifulSoup backends ("html.parser",
+    "lxml", "html5lib") all build a BeautifulSoup tree, while "selectolax" uses
+    the much faster selectolax C parser (its lexbor engine) directly.
+    """
+    if parser == "selectolax":
+        from selectolax.lexbor import LexborHTMLParser
+        tree = LexborHTMLParser(contents)
+        # Scripts and styles are not part of any comment's text
+        tree.strip_tags(["script", "style"])
+        comment_tree = tree.css_first("#parent-comment-container")
+        authors = [lexbor_text(x) for x in comment_tree.css(".comment-author-text")]
+        comments = []
+        details = []
+        timestamp = ""
+        for x in comment_tree.css(".comment-time-text, .comment-text-container"):
+            if "comment-time-text" in (x.attributes.get("class") or "").split():
+                timestamp = lexbor_text(x).strip()
+                continue
+            comments.append(lexbor_text(x).lstrip().lower())
+            dom_id = x.attributes.get("id")
+            node = x
+            while not dom_id and node is not None and node.attributes.get("id") != "parent-comment-container":
+                dom_id = comment_element_id(node.attributes)
+                node = node.parent
+            details.append((dom_id, timestamp))
+            timestamp = ""
+        return authors, comments, comment_ids_for(authors, comments, details)
+    # Make some soup out of those contents
+    soup = BeautifulSoup(contents, parser)
+    # Pull only the comments from the entire HTML page
+    comment_soup = soup.find(id="parent-comment-container")
+    if parser == "html5lib":
+        # html5lib's soup keeps the text of scripts and styles, and whitespace as it is,
+        # so take those out to match what "html.parser" and "lxml" give
+        for x in comment_soup.find_all(["script", "style"]):
+            x.decompose()
+        for x in comment_soup.find_all(string=True):
+            if (not x.strip(ASCII_WHITESPACE)
+                    and not any(parent.name in WHITESPACE_PRESERVING_TAGS for parent in x.parents)):
+                x.replace_with(collapse_whitespace(x))
+    # Extract comment author names from the comments
+    authors = [x.get_text()
+               for x in comment_soup.find_all(class_="comment-author-text")]
+    # Extract comment text from the comments, along with each one's DOM id and timestamp
+    comments = []
+    details = []
+    timestamp = ""
+    for x in comment_soup.find_all(class_=["comment-time-text", "comment-text-container"]):
+        if "comment-time-text" in x.get("class", []):
+            timestamp = x.get_text().strip()
+            continue
+        comments.append(x.get_text().lstrip().lower())
+        dom_id = x.get("id")
+        for node in [x] + list(x.parents):
+            if dom_id or node is comment_soup:
+                break
+            dom_id = comment_element_id(node.attrs)
+        details.append((dom_id, timestamp))
+        timestamp = ""
+    return authors, comments, comment_ids_for(authors, comments, details)
+
+
+def lexbor_text(node):
+    """ Returns all of the text in a selectolax (lexbor) node, the way
+    BeautifulSoup's get_text would, with whitespace collapsed the same way
+    (see collapse_whitespace).
+    """
+    pieces = []
+    for x in node.traverse(include_text=True):
+        if x.tag != "-text":
+            continue
+        text = x.text_content
+        if not text.strip(ASCII_WHITESPACE):
+            parent = x.parent
+            while parent is not None and parent.tag not in WHITESPACE_PRESERVING_TAGS:
+                parent = parent.parent
+            if parent is None:
+                text = collapse_whitespace(text)
+        pieces.append(text)
+    return "".join(pieces)
+
+
+def comment_ids_for(authors, comments, details):
+    """ Makes the comment IDs for extract_comments, given the authors, the
+    comments and each comment's (DOM id, timestamp). If there are more
+    comments than authors (which entry_scraper will stop on anyway), the
+    extra comments are given a blank author.
+    """
+    padded_authors = list(authors) + [""] * (len(comments) - len(authors))
+    return [comment_id(dom_id, author, timestamp, comment)
+            for author, comment, (dom_id, timestamp) in zip(padded_authors, comments, details)]
+
+
+def compare_parser_backends(source_html):
+    """ Provided a string for a source html page saved to disk, this function
+    runs every installed parser backend over the page, and checks that each
+    one pulls out exactly the same authors and comments as "html.parser".
+    Prints and returns a dataframe with one row per backend, holding the
+    parse time, the parse time per MB of page, and whether the backend's
+    results matched. The streaming parser is included as "stream".
     """
-    # Pulling data from file, rather than requerying web page each attempt
     with open(source_html, 'r', encoding='utf8') as raw:
-        # Read contents of web page
         contents = raw.read()
-        # Make some soup out of those contents
-        soup = BeautifulSoup(contents, "html.parser")
-        # Pull only the comments from the entire HTML page
-        comment_soup = soup.find(id="parent-comment-container")
-        # Extract comment author names from the comments
-        authors = [x.get_text()
-                   for x in comment_soup.find_all(class_="comment-author-text")]
-        # Extract comment text from the comments
-        comments = [x.get_text().lstrip().lower()
-                    for x in comment_soup(class_="comment-text-container")]
-        print(f"This comment section has {len(authors)} authors")
-        print(f"This comment section has {len(comments)} comments")
+    page_mb = os.path.getsize(source_html) / (1024 * 1024)
+    results = []
+    expected = None
+    for parser in list(PARSER_BACKENDS) + ["stream"]:
+        if parser != "stream" and available_parser(parser) != parser:
+            continue
+        start = time.perf_counter()
+        if parser == "stream":
+            triples = list(stream_comments(source_html))
+            extracted = tuple([x[i] for x in triples] for i in range(3))
+        else:
+            extracted = extract_comments(contents, parser)
+        seconds = time.perf_counter() - start
+        if expected is None:
+            expected = extracted
+        results.append({"parser": parser,
+                        "seconds": seconds,
+                        "seconds_per_mb": seconds / page_mb if page_mb else np.nan,
+                        "comments": len(extracted[1]),
+                        "matches_html_parser": extracted == expected})
+    results = pd.DataFrame(results).set_index("parser")
+    logger.info(f"Parser comparison for {source_html} ({page_mb:.2f} MB):")
+    logger.info(results)
+    return results
+
+
+def chained_normalize_separators(line):
+    """ Does normalize_separators' job the way generate_dataframe used to,
+    one "if x in line: line = line.replace(...)" check after another. It's
+    only kept so benchmark_normalize_separators has something to compare
+    against.
+    """
+    if "&" in line:
+        line = line.replace("&", ",")
+    if ";" in line:
+        line = line.replace(";", ",")
+    if "marc-andre fleury" in line:
+        line = line.replace("marc-andre fleury", "fleury")
+    if "marc-andré fleury" in line:
+        line = line.replace("marc-andré fleury", "fleury")
+    if "marc-andre fluery" in line:
+        line = line.replace("marc-andre fluery", "fleury")
+    if "marc-andré fluery" in line:
+        line = line.replace("marc-andré fluery", "fleury")
+    if "marc andre-fleury" in line:
+        line = line.replace("marc andre-fleury", "fleury")
+    if "marc andré-fleury" in line:
+        line = line.replace("marc andré-fleury", "fleury")
+    if "marc andre-fluery" in line:
+        line = line.replace("marc andre-fluery", "fleury")
+    if "marc andré-fluery" in line:
+        line = line.replace("marc andré-fluery", "fleury")
+    if "marc andre-feury" in line:
+        line = line.replace("marc andre-feury", "fleury")
+    if "marc-andre f" in line:
+        line = line.replace("marc-andre f", "fleury")
+    if "marc andré-f" in line:
+        line = line.replace("marc andré-f", "fleury")
+    if "marc andre-flurry" in line:
+        line = line.replace("marc andre-flurry", "fleury")
+    if "andre-fleury" in line:
+        line = line.replace("andre-fleury", "fleury")
+    if "m-a fleury" in line:
+        line = line.replace("m-a fleury", "fleury")
+    if "-" in line:
+        line = line.replace("-", ",")
+    if "/" in line:
+        line = line.replace("/", ",")
+    return line
+
+
+def benchmark_normalize_separators(lines=None, repeat=5):
+    """ Times normalize_separators against the old chain of replace checks
+    (see chained_normalize_separators) over the same lines, and checks
+    that both rewrite every line the same way. By default the lines are
+    the answer lines of the 2021-22 entries that comment_fixer rewrites by
+    hand (it's run over blank comments to get them), which are real
+    answers from real entrants. Each way is timed repeat times, and the
+    best time is kept. Prints and returns a dataframe with one row for each
+    way, holding the time per line in nanoseconds, the speedup over the
+    replace chain, and whether its results matched the replace chain's.
+    """
+    if lines is None:
+        # Enough blank comments to cover every position comment_fixer rewrites
+        with collected_warnings():
+            _, _, fixed_comments = comment_fixer([""] * 2000, [""] * 2000)
+        lines = [line for comment in fixed_comments for line in comment.splitlines() if line.strip()]
+    expected = [chained_normalize_separators(line) for line in lines]
+    results = []
+    for name, normalizer in [("replace_chain", chained_normalize_separators),
+                             ("normalize_separators", normalize_separators)]:
+        best = np.inf
+        for _ in range(repeat):
+            start = time.perf_counter()
+            normalized = [normalizer(line) for line in lines]
+            best = min(best, time.perf_counter() - start)
+        results.append({"normalizer": name,
+                        "ns_per_line": best / len(lines) * 1e9,
+                        "matches_replace_chain": normalized == expected})
+    results = pd.DataFrame(results).set_index("normalizer")
+    results.insert(1, "speedup", results.loc["replace_chain", "ns_per_line"] / results["ns_per_line"])
+    logger.info(f"Separator normalization over {len(lines)} lines:")
+    logger.info(results)
+    return results
+
+
+def entry_scraper(source_html, streaming=False, parser="html.parser", min_lines=8):
+    """Provided a string for a source html page (saved to disk, rather than queried
+    from a site), this function scrapes contest entry comments by identifying comments
+    which are 8+ lines long (see min_lines) into a list of authors and comments.
+    Returns three lists, the authors of each comment, the comments, and each
+    comment's stable ID (see comment_id). As an example, authors[14] wrote
+    comments[14], which has the ID comment_ids[14]. This function will check for
+    duplicated author names, and will update any duplicates by appending the index
+    of their comment to the author name. A list of duplicate authors will be printed
+    as a warning to the user. Also returns a scrape report dictionary, where
+    "duplicated_authors" maps each duplicated name to the indexes of its comments,
+    and "dropped_comments" lists each comment removed for being too short (with
+    its author, its index on the page, its ID and how many line breaks it had).
+
+    min_lines sets how many line breaks a comment needs to count as an entry.
+
+    If streaming is True, the page is read a chunk at a time with stream_comments
+    instead of being parsed into one BeautifulSoup tree, which keeps memory use
+    low for very large saved pages. Both ways produce the same authors and comments.
+    Otherwise, parser picks the backend used to parse the page (see PARSER_BACKENDS),
+    falling back to "html.parser" if the requested backend isn't installed.
+    """
+    if streaming:
+        # Pull authors and comments as the page is read, without building the whole tree
+        authors = []
+        comments = []
+        comment_ids = []
+        try:
+            for author, comment, this_id in stream_comments(source_html):
+                authors.append(author)
+                comments.append(comment)
+                comment_ids.append(this_id)
+        except ValueError as error:
+            raise ValueError("List of Authors and List of Comments are not equal length, "
+                             "something seems to be wrong") from error
+        logger.info(f"This comment section has {len(authors)} authors")
+        logger.info(f"This comment section has {len(comments)} comments")
+    else:
+        # Pulling data from file, rather than requerying web page each attempt
+        with open(source_html, 'r', encoding='utf8') as raw:
+            # Read contents of web page
+            contents = raw.read()
+        # Parse the page and pull out the authors and their comments
+        authors, comments, comment_ids = extract_comments(contents, available_parser(parser))
+        logger.info(f"This comment section has {len(authors)} authors")
+        logger.info(f"This comment section has {len(comments)} comments")
         # Before continuing, verify both lists are equal in length for joining
-        # If not, script quits running
+        # If not, stop here (main reports it and carries on with any other pages)
         if len(authors) != len(comments):
-            print("List of Authors and List of Comments are not equal length")
-            print("Something seems to be wrong, ending script")
-            quit()
-        # Remove comments that are not at least 8 lines long, by finding
-        # Index of each failing case and placing them in a list to be handled
-        filter_index = 0
-        indexes_to_pop = []
-        print("Searching for comments of less than 8 lines...")
-        for comment in comments:
-            new_lines = comment.count('\n')
-            if new_lines < 8:
-                indexes_to_pop.append(filter_index)
-            filter_index += 1
-        # Notify how many comments are to be removed
-        print(f"{len(indexes_to_pop)} comments found with less than 8 lines.")
-        print("Removing those comments...")
-        # Reverse list of indexes, so we pop from the back, not the front
-        # This avoids moving the list's indexes as we're removing items
-        indexes_to_pop.reverse()
-        # Iterate through list to pop, and remove corresponding items
-        # From both comments and authors
-        for pop_index in indexes_to_pop:
-            comments.pop(pop_index)
-            authors.pop(pop_index)
-        # Check for duplicate authors, to avoid overwriting any authors w same name
-        # If duplicate author name exists, rename the author
-        temp_index = 0
-        duped_authors = []
-        for author in authors:
-            if authors.count(author) > 1:
-                duped_authors.append(author)
-                mod_author = author + " entry # " + str(temp_index)
-                authors[temp_index] = mod_author
-            elif author in duped_authors:
-                mod_author = author + " entry # " + str(temp_index)
-                authors[temp_index] = mod_author
-            temp_index += 1
-        # If duplicate authors exist, notify of such
-        if len(duped_authors) > 0:
-            print("NOTICE: Duplicated authors were found.")
-            print("The following authors have been modified due to duplicates:")
-            print(set(duped_authors))
-        # Comment gathering is finished
-        print("This is the end of comment gathering operations.")
-        print(f"A total of {len(authors)} authors have been pulled.")
-        print(f"These authors made {len(comments)} comments in this set.")
-        return authors, comments
+            raise ValueError("List of Authors and List of Comments are not equal length, "
+                             "something seems to be wrong")
+    # Give every comment a stable ID, which stays with it through filtering and fixing
+    comment_ids = unique_comment_ids(comment_ids)
+    # Remove comments that are not at least min_lines lines long, in a single pass that
+    # keeps each author lined up with their comment. Dropped comments are kept aside
+    # (with their original index) so they can be checked later without re-scraping
+    logger.info(f"Searching for comments of less than {min_lines} lines...")
+    kept_authors = []
+    kept_comments = []
+    kept_ids = []
+    dropped_comments = []
+    for filter_index, (author, comment, this_id) in enumerate(zip(authors, comments, comment_ids)):
+        new_lines = comment.count('\n')
+        if new_lines < min_lines:
+            dropped_comments.append({"index": filter_index,
+                                     "id": this_id,
+                                     "author": author,
+                                     "new_lines": new_lines,
+                                     "comment": comment})
+        else:
+            kept_authors.append(author)
+            kept_comments.append(comment)
+            kept_ids.append(this_id)
+    authors = kept_authors
+    comments = kept_comments
+    comment_ids = kept_ids
+    # Notify how many comments were removed
+    logger.info(f"{len(dropped_comments)} comments found with less than {min_lines} lines.")
+    logger.info("Those comments have been removed.")
+    # Check for duplicate authors, to avoid overwriting any authors w same name
+    # Count every name once up front, then rename any author whose name is used more than once
+    author_counts = Counter(authors)
+    duped_authors = {}
+    for temp_index, author in enumerate(authors):
+        if author_counts[author] > 1:
+            duped_authors.setdefault(author, []).append(temp_index)
+            authors[temp_index] = author + " entry # " + str(temp_index)
+    # Keep track of what was changed, so the caller can see it without reading the printout
+    scrape_report = {"duplicated_authors": duped_authors,
+                     "dropped_comments": dropped_comments}
+    # If duplicate authors exist, notify of such
+    if len(duped_authors) > 0:
+        # The names go in the warning itself, so they're still shown with --quiet
+        logger.warning("NOTICE: Duplicated authors were found.\n"
+                       "The following authors have been modified due to duplicates:\n"
+                       + ", ".join(sorted(duped_authors)))
+    # Comment gathering is finished
+    logger.info("This is the end of comment gathering operations.")
+    logger.info(f"A total of {len(authors)} authors have been pulled.")
+    logger.info(f"These authors made {len(comments)} comments in this set.")
+    return authors, comments, comment_ids, scrape_report
 
 
 def comment_fixer(authors, comments):
@@ -100,32 +874,32 @@ def comment_fixer(authors, comments):
     # Many entries are poorly formatted and done in such a way that trying
     # to identify them through an if/then will end up negatively impacting other entries
     # These readers' entries must be manually edited, and their names cursed for all time
-    print("Manually editing certain comments to fix issues that otherwise cannot be filtered...")
+    logger.info("Manually editing certain comments to fix issues that otherwise cannot be filtered...")
     # Julian M dropped extra line breaks in answers, I'll have to rewrite the entry
-    print("Julian M, I fixed your entry")
+    logger.debug("Julian M, I fixed your entry")
     major_surgery_count += 1
     comments[73] = "1. veg, col, nyi, tbl, tor\n2. buf, ari, ana, sjs, cbj\n3. cooper, brind'amour, quenneville, trotz, smith\n4. lamoriello, francis, yzerman, guerin, brisebois\n5. demko, vasilevskiy, lehner, markstrom, hellebuyck\n6. caufield, seider, zegras, knight, byram\n7. fox, makar, hedman, ekblad\n8. mcdavid, mackinnon, hellebuyck, makar, pettersson\n9. eichel, kessel, rakell, korpisalo, juolevi\n10. 0"
     # Philipp R. had commentary before his entry which was interpreted as an answer.
     # Cutting out the front of his entry to start at his answers.
-    print("Philipp R, I fixed your entry")
+    logger.debug("Philipp R, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[135]
     temp_comment = temp_comment[134:]
     comments[135] = temp_comment
     # Michael L had extra line breaks in his entry, which messed up reading it by line
-    print("Michael L, I fixed your entry")
+    logger.debug("Michael L, I fixed your entry")
     major_surgery_count += 1
     comments[149] = "1. tbl, fla, nyi, veg, col\n2. buf, ott, cbj, ana, det\n3. cooper, trotz, quenneville, cassidy, maurice\n4. brisebois, sakic, lamoriello, sweeney, mclellan\n5. hart, lehner, shesterkin, vasilevskiy, hellebuyck\n6. caufield, seider, pinto, knight, zegras\n7. hedman, heiskanen, makar, fox, mcavoy\n8. mcdavid, mackinnon, matthews, kucherov, panarin\n9. eichel, gaudreau, kessel\n10. draisaitl"
     # Evan L got his questions mixed up and listed GM's for question 3 (not coaches)
     # and listed coaches for question 4 instead of GM's. I'll be generous and fix it.
-    print("Evan L, I saved your entry!")
+    logger.debug("Evan L, I saved your entry!")
     major_surgery_count += 1
-    print("You swapped Q3 & Q4 and I fixed it for you.")
-    print("I can't help you with the fact that you specifically picked Bill Armstrong, though")
+    logger.debug("You swapped Q3 & Q4 and I fixed it for you.")
+    logger.debug("I can't help you with the fact that you specifically picked Bill Armstrong, though")
     comments[170] = "1. col, tor, veg, tbl, fla\n2. buf, ari, det, ana, cbj\n3. cooper, keefe, quenneville, brind'amour, trotz\n4. yzerman, brisebois, dorion, guerin, b armstrong\n5. vasilevskiy, kuemper, lehner, gibson, hellebuyck\n6. zegras, knight, nedeljkovic\n7. makar, hedman, ekblad, hamilton\n8. crosby, matthews, mcdavid, mackinnon, hellebuyck\n9. dermott, beagle, galchenyuk, hertl\n10. mackinnon"
     # Mitch G used spaces as his separator for only the first two lines of his entry
     # Cannot use spaces without inadvertently handling other non-answer first lines
-    print("Mitch G, I fixed your entry")
+    logger.debug("Mitch G, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[174]
     temp_comment = temp_comment.replace(
@@ -135,34 +909,34 @@ def comment_fixer(authors, comments):
     comments[174] = temp_comment
     # Rick C used periods as his separator for the entire entry. Cannot use periods
     # without inadvertently handling other non-answer first lines
-    print("Rick C, I fixed your entry")
+    logger.debug("Rick C, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[218]
     temp_comment = temp_comment.replace(".", ",")
     comments[218] = temp_comment
     # Shahzaib Hassain I. included a bunch of new lines in his entry
     # I need each answer on a line, not straddling two
-    print("Shahzaib Hassain I., I fixed your entry")
+    logger.debug("Shahzaib Hassain I., I fixed your entry")
     comments[229] = "1. tbl, col, veg, tor, edm\n2. buf, det, ari, cbj, ana\n3. trotz, cooper, ducharme, brind'amour, gallant\n4. yerman, sakic, brisebois, guerin, zito\n5. saros, gibson, hellebuyck, vasilevskiy\n6. caufield, knight, zegras\n7. hedman, makar, fox, mcavoy, q hughes\n8. mcdavid, matthews, mackinnon, kucherov, draisaitl\n9. forsberg, giroux, domi, hertl, kessel\n10. draisaitl"
     # Ryan L used both "-" and "," in his entry, I will replace the leading "-"
-    print("Ryan L, I fixed your entry")
+    logger.debug("Ryan L, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[263]
     temp_comment = temp_comment.replace("-", "")
     comments[263] = temp_comment
     # Matthew K used spaces as his separator for the entire entry, cannot use spaces
     # without inadvertently causing a whooooooole bunch of other problems
-    print("Matthew K, I fixed your entry")
+    logger.debug("Matthew K, I fixed your entry")
     major_surgery_count += 1
     comments[264] = "1. tbl, col, tor, nyi, fla\n2. buf, ott, ari, lak, det\n3. cooper, smith, cassidy, ducharme, bednar\n4. sweeney, brisebois, bergevin, zito, dubas\n5. vasilevskiy, fleury, hellebuyck, demko, bobrovsky, lehner\n6. raymond, raddysh, vilardi, kahkonen, cal foote\n7. hedman, fox, josi, carlson, mcavoy\n8. mcdavid, kucherov, mackinnon, vasilevskiy, draisaitl\n9.eichel, w nylander, ullmark, pk subban, byfield\n10. kucherov"
     # Joseph T used spaces as his separator for the entire entry, cannot use spaces
     # without inadvertently causing a whooooooole bunch of other problems
-    print("Joseph T, I fixed your entry")
+    logger.debug("Joseph T, I fixed your entry")
     major_surgery_count += 1
     comments[266] = "1. tbl, tor, veg, col, edm\n2. buf, ari, det, ana, ott\n3. keefe, cooper, trotz, brind'amour, quenneville\n4. brisebois, yzerman, dorion, cheveldayoff, mccrimmon\n5. vasilevskiy, fleury, hellebuyck, binnington, saros\n6. caufield, seider\n7. makar, hamilton, hedman, mcavoy\n8. mcdavid, matthews, draisaitl, mackinnon\n9. kessel, stralman, eichel\n10. marner"
     # Danny D used spaces as his separator for half of his entry, cannot use spaces
     # without inadvertently causing a whooooooole bunch of other problems
-    print("Danny D, I fixed your entry")
+    logger.debug("Danny D, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[282]
     temp_comment = temp_comment[138:]
@@ -170,84 +944,84 @@ def comment_fixer(authors, comments):
     comments[282] = temp_comment
     # Alex K used spaces as his separator for the entire entry, cannot use spaces
     # without inadvertently causing a whooooooole bunch of other problems
-    print("Alex K, I fixed your entry")
+    logger.debug("Alex K, I fixed your entry")
     major_surgery_count += 1
     comments[306] = "1. col, veg, tor, fla, wpg\n2. det, buf, ana, ari, cbj\n3. trotz, cooper, brind'amour, quenneville, smith\n4. sakic, brisebois, mccrimmon, yzerman, blake\n5. vasilevskiy, grubauer, demko, hellebuyck, markstrom\n6. caufield, knight\n7. makar, mcavoy, fox\n8. mcdavid, matthews, mackinnon, barkov\n9. tarasenko, kessel, pk subban\n10. draisaitl"
     # Arthur M put extra line breaks in his entry, added extra '-', etc.
-    print("Arthur M, I fixed your entry")
+    logger.debug("Arthur M, I fixed your entry")
     major_surgery_count += 1
     comments[340] = "1. tbl, veg, nyi, col, edm\n2. ana, arz, buf, cbj, det\n3. cooper, trotz, brind'amour, quenneville, evason\n4. sakic, guerin, brisebois, yzerman, lamoriello\n5. hellebuyck, vasilevskiy, saros, lehner, fleury\n6. caufield, zegras\n7. makar, josi, hedman, mcavoy\n8. mcdavid, matthews, mackinnon, panarin, draisaitl\n9. eichel, kessel\n10. draisaitl"
     # Lewis D used spaces as his separator for the entire entry, cannot use spaces
     # without inadvertently causing a whooooooole bunch of other problems
-    print("Lewis D, I fixed your entry")
+    logger.debug("Lewis D, I fixed your entry")
     major_surgery_count += 1
     comments[344] = "1. tbl, veg, col, bos, edm\n2. det, lak, buf, ott, ana\n3. cooper, trotz, deboer, bednar, cassidy\n4. brisebois, lamoriello, mccrimmon, sakic, sweeney\n5. hellebuyck, grubauer, vasilevskiy\n6. caufield, zegras\n7. hedman, makar, fox\n8. mcdavid, mackinnon, draisaitl, matthew, kane\n9. eichel, kessel\n10. mackinnon"
     # Rob B used a pile of '-' and ',' in his entry
     # I just have to rewrite the comment
-    print("Rob B, I fixed your entry")
+    logger.debug("Rob B, I fixed your entry")
     major_surgery_count += 1
     comments[354] = "1. tbl, tor, fla, col, nyi\n2. buf, ari, ana, cbj, ott\n3. cooper, bednar, trotz, brind'amour, quenneville\n4. guerin, francis, yzerman, lamoriello, dubas\n5. vasilevskiy, lehner, hellebuyck, grubauer, kuemper\n6. bunting, rossi, byfield, zegras, caufield\n7. mcavoy, theodore, muzzin, makar, slavin\n8. mcdavid, matthews, mckinnon, kucherov, draisaitl\n9. eichel, hertl, c brown"
     # Curtis R used both "-" and "," in his entry, I will replace the leading "-"
-    print("Curtis R, I fixed your entry")
+    logger.debug("Curtis R, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[366]
     temp_comment = temp_comment.replace("-", "")
     comments[366] = temp_comment
     # Garret F uses periods and commas as separators in his entry,
     # I can't fix this without doing it manually, so here we go...
-    print("Garret F, I fixed your entry")
+    logger.debug("Garret F, I fixed your entry")
     major_surgery_count += 1
     comments[390] = "1. col, veg, tbl, nyi\n2. buf, det, ari, ana\n3. cooper, trotz, brind'amour, sullivan\n4. sakic, yzerman, lamoriello, francis, brisebois\n5. vasilevskiy, saros, fleury, lehner\n6. caufield, newhook, rossi\n7. makar, fox, mcavoy, ekblad\n8. mcdavid, mackinnon, hellebuyck, crosby, makar\n9. kessel, forsberg"
     # Bernhard J started each line with "# - ", and the "-" got caught as a separator
     # for part of the answers. Removing "-" from entry
-    print("Bernhard J, I fixed your entry")
+    logger.debug("Bernhard J, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[391]
     temp_comment = temp_comment.replace("-", "")
     comments[391] = temp_comment
     # Jeff C. randomly interspersed his entry with periods and commas and misnumbered the questions.
     # I can't fix this without doing it manually, so here we go...
-    print("Jeff C, I fixed your entry")
+    logger.debug("Jeff C, I fixed your entry")
     major_surgery_count += 1
     comments[392] = "1. tbl, col, veg, edm, tor\n2. buf, ari, ott, det, cbj\n3. trotz, cooper, cassidy, quenneville, brind'amour\n4. sakic, yzerman, francis, guerin, drury\n5. hellebuyck, saros, vasilevskiy, demko, markstrom\n6. caufield, zegras, swayman, seider\n7. hedman, fox, makar, hamilton, nurse\n8. mcdavid, draisaitl, mackinnon, kucherov, matthews\n9. eichel, tarasenko\n10. draisaitl"
     # James H used spaces as his separator for the entire entry, cannot use spaces
     # without inadvertently causing a whooooooole bunch of other problems
-    print("James H, I fixed your entry")
+    logger.debug("James H, I fixed your entry")
     major_surgery_count += 1
-    print("INTERPRETATION WARNING: James H wrote in 'Brisbois Montreal GM Sweeney'")
-    print("This was read as 'Montreal GM' (Bergevin) rather than George McPhee")
+    contest_warning("INTERPRETATION", "INTERPRETATION WARNING: James H wrote in 'Brisbois Montreal GM Sweeney'\n"
+                    "This was read as 'Montreal GM' (Bergevin) rather than George McPhee", author="James H")
     comments[404] = "1. tbl, nyi, veg, col, pit\n2. det, buf, van, ari\n3. sullivan, trotz, cassidy\n4. brisebois, bergevin, sweeney\n5. hellebuyck, kuemper\n6. caufield\n7. hedman, makar\n8. mcdavid, crosby, matthews, mackinnon\n9. eichel"
     # Nick Z stopped using commas partway through his entry, only using spaces.
     # Can't filter for spaces effectively without causing other problems.
-    print("Nick Z, I saved your entry")
+    logger.debug("Nick Z, I saved your entry")
     major_surgery_count += 1
-    print("INTERPRETATION WARNING: Nick Z selected 'armstrong' as a GM")
-    print("This was read as 'd armstrong' (eligible) instead of 'b armstrong' (ineligible)")
+    contest_warning("INTERPRETATION", "INTERPRETATION WARNING: Nick Z selected 'armstrong' as a GM\n"
+                    "This was read as 'd armstrong' (eligible) instead of 'b armstrong' (ineligible)", author="Nick Z")
     comments[451] = "1. edm, tbl, col, fla, bos\n2. buf, det, ott, ana, sjs\n3. cooper, maurice, quenneville, brind'amour, trotz\n4. holland, d armstrong, mcphee, sakic, sweeney\n5. hellebuyck, vasilevskiy, peterson, demko, gibson\n6. newhook, podkolzin, zegras, caufield\n7. nurse, fox, makar, doughty, pietrangelo\n8. mcdavid, draisaitl, mackinnon, kucherov\n9. eichel, lebanc, bjork, m staal\n10. draisaitl"
     # Michael F. had commentary before his entry which was interpreted as an answer.
     # Cutting out the front of his entry to start at his answers.
-    print("Michael F, I fixed your entry")
+    logger.debug("Michael F, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[455]
     temp_comment = temp_comment[41:]
     comments[455] = temp_comment
     # Félix F. entered his label ahead of his entry, and used a "-" to do
     # which got read as part of an answer
-    print("Félix F., I fixed your entry")
+    logger.debug("Félix F., I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[461]
     temp_comment = temp_comment[10:]
     comments[461] = temp_comment
     # Jonathan Willis had commentary before his entry which was interpreted as an answer.
     # Cutting out the front of his entry to start at his answers.
-    print("Jonathan Willis, I fixed your entry")
+    logger.debug("Jonathan Willis, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[511]
     temp_comment = temp_comment[152:]
     comments[511] = temp_comment
     # Kevin J used spaces as his separator for only the first two lines of his entry
     # Cannot use spaces without inadvertently handling other non-answer first lines
-    print("Kevin J, I fixed your entry")
+    logger.debug("Kevin J, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[526]
     temp_comment = temp_comment.replace(
@@ -257,47 +1031,47 @@ def comment_fixer(authors, comments):
     comments[526] = temp_comment
     # Александр started each line with "# - ", and the "-" got caught as a separator
     # for part of the answers. Removing "-" from entry
-    print("Александр, I fixed your entry")
+    logger.debug("Александр, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[535]
     temp_comment = temp_comment.replace("-", "")
     comments[535] = temp_comment
     # Craig C started each line with "# - ", and the "-" got caught as a separator
     # for part of the answers. Removing "-" from entry
-    print("Craig C, I fixed your entry")
+    logger.debug("Craig C, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[542]
     temp_comment = temp_comment.replace("-", "")
     comments[542] = temp_comment
     # Taylor R used spaces as his separator for the entire entry, cannot use spaces
     # without inadvertently causing a whooooooole bunch of other problems
-    print("Taylor R, I fixed your entry")
+    logger.debug("Taylor R, I fixed your entry")
     major_surgery_count += 1
     comments[583] = "1. nyi, col, veg, tbl, car\n2. buf, cbj, det, ari, ana\n3. cooper, brind'amour, trotz, quenneville, deboer\n4. lamoriello, yzerman, cheveldayoff, blake, sakic\n5. hellebuyck, fleury, kuemper, vasilevskiy, lehner\n6. caufield, knight, zegras, nedeljkovic, drysdale\n7. hedman, pietrangelo, fox, makar, hamilton\n8. mcdavid, mackinnon, vasilevskiy, matthews, stone\n9. hertl, korpisalo, forsberg, carter, leddy\n10. draisaitl"
     # David S. started each line with "# - ", and the "-" got caught as a separator
     # for part of the answers. Removing "-" from entry
-    print("David S, I fixed your entry")
+    logger.debug("David S, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[600]
     temp_comment = temp_comment.replace("-", "")
     comments[600] = temp_comment
     # Drew D used spaces as his separator for the entire entry, cannot use spaces
     # without inadvertently causing a whooooooole bunch of other problems
-    print("Drew D, I fixed your entry")
+    logger.debug("Drew D, I fixed your entry")
     major_surgery_count += 1
     comments[605] = "1. tbl, col, veg, tor, car\n2. buf, ari, ana, det, ott\n3. cooper, trotz, hakstol, deboer, bednar\n4. b armstrong, d armstrong, mccrimmon, sakic, waddell\n5. binnington, lehner, hellebuyck, gibson, demko\n6. caufield\n7. pietrangelo, fox, makar\n8. mcdavid, kucherov, mackinnon, crosby\n9. eichel, tarasenko\n10. kucherov"
     # MIKE R included extra line breaks in an answer, which didn't play nice with
     # my line by line iteration
-    print("MIKE R, I fixed your entry")
+    logger.debug("MIKE R, I fixed your entry")
     major_surgery_count += 1
     comments[622] = "1. nyi, tbl, col, veg\n2. buf, ari, sjs, cbj\n3. trot, quenneville, cooper, bednar\n4. lamoriello, yzerman, sakic, brisebois\n5. vasilevskiy, hellebuyck, gibson\n6. caufield, knight, zegras, seider\n7. makar, fox, hedman\n8. mcdavid, matthews, mackinnon\n9. leddy, tierney, hertl\n10. mackinnon"
     # Kevin D included extra line breaks in questions, breaks the automatic handling of successive lines
-    print("Kevin D, I fixed your entry")
+    logger.debug("Kevin D, I fixed your entry")
     major_surgery_count += 1
     comments[649] = "1. col, veg, tbl, tor, nyi\n2. ari, buf, ana\n3. cooper, bednar, trotz, cassidy\n4. doug armstrong, yzerman, sakic, sweeney, lamoriello\n5. binnington, vasilevskiy, hellebuyck, saros\n6. caufield, zegras\n7. pietrangelo, fox, makar, hedman\n8. mcdavid, mackinnon, matthews, draisaitl\n9. eichel, hertl\n10. draisaitl"
     # Andy D. had commentary before his entry which was interpreted as an answer.
     # Cutting out the front of his entry to start at his answers.
-    print("Andy D, I fixed your entry")
+    logger.debug("Andy D, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[666]
     temp_comment = temp_comment[17:]
@@ -305,155 +1079,155 @@ def comment_fixer(authors, comments):
     # Levi T has 2 coaches, 3 GMs in Q2, and 3 GMs 2 coaches in Q3
     # I feel merciful (and don't have permission to start scrapping people's answers)
     # So I'll swap them around (the sixth GM will get picked up by the cheat filter)
-    print("Levi T, I saved your entry!")
+    logger.debug("Levi T, I saved your entry!")
     major_surgery_count += 1
-    print("I can't change the fact that you picked an ineligible GM though")
+    logger.debug("I can't change the fact that you picked an ineligible GM though")
     comments[679] = "1. tbl, fla, col, veg, bos\n2. det, ari, buf, ana, lak\n3. cooper, keefe, quenneville, deboer\n4. zito, yzerman, mccrimmon, sakic, brisebois, dubas\n5. binnington, hellebuyck, gibson, vasilevskiy, lehner\n6. caufield, zegras, newhook\n7. makar, hedman, mcavoy, fox\n8. mcdavid, matthews, barkov, hellebuyck\n9. eichel, tarasenko, kessel, holtby, mikheyev\n10. mackinnon"
     # James S. used a "-" while tagging at the start of his entry, which got read as an
     # Answer. Cutting out the front of his entry to start at his answers.
-    print("James S, I fixed your entry")
+    logger.debug("James S, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[719]
     temp_comment = temp_comment[5:]
     comments[719] = temp_comment
     # Jack F used spaces as his separator for half of his entry, cannot use spaces
     # without inadvertently causing a whoooole bunch of other problems
-    print("Jack F, I fixed your entry")
+    logger.debug("Jack F, I fixed your entry")
     major_surgery_count += 1
     comments[728] = "1. tbl, col, veg\n2. buf, det, ari, sjs, cbj\n3. cooper, trotz\n4. brisebois, sakic, yzerman\n5. vasilevskiy, fleury, hellebuyck\n6. caufield, seider, knight\n7. hedman, makar, fox, hamilton\n8. mcdavid, kucherov, pastrnak, matthews\n9. eichel, hertl, kessel"
     # Kyle A included a comment before his entry that got interpreted as
     # his answer to question 1
-    print("Kyle A, I fixed your entry")
+    logger.debug("Kyle A, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[778]
     temp_comment = temp_comment[27:]
     comments[778] = temp_comment
     # Jeff N. used a "-" in his first line which got read as an answer, fixing this
-    print("Jeff N, I fixed your entry")
+    logger.debug("Jeff N, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[784]
     temp_comment = temp_comment[13:]
     comments[784] = temp_comment
     # Brian L. used "1.)" instead of one or the other. He also has a bunch of periods for first initials.
     # Replacing all "." with "" in his entry
-    print("Brian L, I fixed your entry")
+    logger.debug("Brian L, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[858]
     temp_comment = temp_comment.replace(".", "")
     comments[858] = temp_comment
     # Bill E had extra periods, commas, and line breaks in his entry
     # I could fix the other stuff, but I can't fix the line breaks easily
-    print("Bill E, I fixed your entry")
+    logger.debug("Bill E, I fixed your entry")
     major_surgery_count += 1
     comments[864] = "1. tbl, col, veg, fla, tor\n2. buf, cbj, ana, det, ari\n3. brind'amour, cooper, trotz, quenneville, bednar\n4. guerin, yzerman\n5. vasilevskiy, hellebuyck, shesterkin\n6. caufield, zegras, newhook\n7. makar, fox, q hughes\n8. mcdavid, mackinnon, matthews, kucherov, point\n9. tarasenko, hertl\n10. draisaitl"
     # Tyler V. used "1.)" instead of one or the other.
     # Replacing all ")" with "" in his entry
-    print("Tyler V, I fixed your entry")
+    logger.debug("Tyler V, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[869]
     temp_comment = temp_comment.replace(")", "")
     comments[869] = temp_comment
     # James L entered every single answer on a new line and did not follow the rules.
     # I will be generous and fix his entry.
-    print("James L, I saved your entry. Next time, read the rules.")
+    logger.debug("James L, I saved your entry. Next time, read the rules.")
     major_surgery_count += 1
     comments[899] = "1. col, tor, tbl, veg\n2. ari, buf, det\n3. trotz, cooper, bednar\n4. sakic, yzerman, blake, brisebois\n5. vasilevskiy, hellebuyck, talbot\n6. caufield\n7. makar, hedman, fox, heiskanen\n8. mcdavid, draisaitl, mackinnon, barkov, vasilevskiy\n9. tarasenko, eichel"
     # Josh P used spaces as his separator for the entire entry, cannot use spaces
     # without inadvertently causing a whooooooole bunch of other problems
-    print("Josh P, I fixed your entry")
+    logger.debug("Josh P, I fixed your entry")
     major_surgery_count += 1
-    print("INTERPRETATION WARNING: Josh P selected 'armstrong' as a GM")
-    print("This was read as 'd armstrong' (eligible) instead of 'b armstrong' (ineligible)")
+    contest_warning("INTERPRETATION", "INTERPRETATION WARNING: Josh P selected 'armstrong' as a GM\n"
+                    "This was read as 'd armstrong' (eligible) instead of 'b armstrong' (ineligible)", author="Josh P")
     comments[941] = "1. tbl, col, tor, veg, nyi\n2. buf, ott, det, ana, ari\n3. cooper, bednar, keefe, trotz, brind'amour\n4. yzerman, brisebois, sakic, d armstrong, waddell\n5. hellebuyck, vasilevskiy, gibson, lehner, saros\n6. podkolzin, caufield, zegras\n7. hedman, makar, hamilton, mcavoy, theodore\n8. matthews, mcdavid, mackinnon, barkov, stone\n9. glendening\n 10. draisaitl"
     # Cal G stopped using commas and used "and" partway through the questions, I'm just gonna
     # Rewrite the entry in a usable format
-    print("Cal G, I fixed your entry")
+    logger.debug("Cal G, I fixed your entry")
     major_surgery_count += 1
     comments[1010] = "1. col, veg, tbl, tor, nyi\n2. buf, cbj, ari, ana, ott\n3. cooper, quenneville, maurice, evason, cassidy\n4. mccrimmon, yzerman, brisebois, guerin, francis\n5. vasilevskiy, lehner, fleury, hellebuyck, binnington\n6. caufield, seider, zegras\n7. makar, hedman, theodore\n8. mcdavid, crosby, mackinnon, stone, point\n9. hertl, rakell, kessel, fleury, ekholm\n"
     # R W. didn't follow the rules and copied the entire question into his answers
     # I will be generous and fix his entry
-    print("R W. I saved your entry. Next time, read the rules.")
+    logger.debug("R W. I saved your entry. Next time, read the rules.")
     major_surgery_count += 1
     comments[1020] = "1. tor, nyi, fla, veg, col\n2. buf, sea, det, ari\n3. trotz, cooper, keefe\n4. sakic, yzerman, lamoriello\n5. hellebuyck, vasilevskiy, bobrovsky\n6. sillinger, caufield, zegras\n7. werenski, fox, makar, ekblad \n8. mcdavid, matthews, barkov\n9. eichel, domi, tarasenko\n10. marner"
     # Jeffrey M stopped using commas and used "and" partway through the questions, and had
     # numerous illegible answers, entering this one by hand
-    print("Jeffrey M, I fixed your entry")
+    logger.debug("Jeffrey M, I fixed your entry")
     major_surgery_count += 1
-    print("INTERPRETATION WARNING: Jeffrey M listed coach 'bed are' norris trophy 'herman', and traded player 'jessel'")
-    print("These were interpreted as 'bednar', 'hamilton', and 'kessel'")
-    print("You were thiiiiiis close to getting noah juulsen instead of kessel because I was looking at names starting with j")
+    contest_warning("INTERPRETATION", "INTERPRETATION WARNING: Jeffrey M listed coach 'bed are' norris trophy 'herman', and traded player 'jessel'\n"
+                    "These were interpreted as 'bednar', 'hamilton', and 'kessel'\n"
+                    "You were thiiiiiis close to getting noah juulsen instead of kessel because I was looking at names starting with j", author="Jeffrey M")
     comments[1032] = "1. tbl, col, veg, edm, wpg\n2. buf, ari, cbj, det, ana\n3. bednar, cooper, quenneville, trotz, tippett\n4. yzerman, sakic, mccrimmon, cheveldayoff, brisebois\n5. vasilevskiy, hellebuyck, saros, markstrom, kuemper\n6. zegras, caufield\n7. makar, hamilton, theodore\n8. mcdavid, mackinnon, barkov, kucherov\n9. kessel, eichel\n10. draisaitl"
     # Sean McIndoe entered a bunch of commentary before his entry, which got interpreted
     # as an answer. Fixing your answer, Sean!
-    print("Down Goes Brown, I fixed your entry")
+    logger.debug("Down Goes Brown, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[1046]
     temp_comment = temp_comment[120:]
     comments[1046] = temp_comment
     # Cole R used both "-" and "," in his entry, I will replace the leading "-"
-    print("Cole R, I fixed your entry")
+    logger.debug("Cole R, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[1048]
     temp_comment = temp_comment.replace("-", "")
     comments[1048] = temp_comment
     # Gordon C used spaces as his separator for the entire entry, cannot use spaces
     # without inadvertently causing a whooooooole bunch of other problems
-    print("Gordon C, I fixed your entry")
+    logger.debug("Gordon C, I fixed your entry")
     major_surgery_count += 1
     comments[1052] = "1. col, veg, fla, tgl, nyi\n2. buf, det, ari, sjs, ana\n3. quenneville, cooper, trotz, brind'amour, bednar\n4. brisebois, sakic, yzerman, zito, lamoriello\n5. lehner, vasilevskiy, hellebuyck, demko, saros\n6. caufield, seider, a kaliyev, knight, rossi\n7. makar, fox, hedman, hamilton, theodore\n8. mcdavid, matthews, mckinnon, draisaitl, barkov\n9. kessel, hertl, palat, manson, pavelski\n10. draisaitl"
     # Ellay H started each line with "# - ", and the "-" got caught as a separator
     # for part of the answers. Removing "-" from entry
-    print("Ellay H, I fixed your entry")
+    logger.debug("Ellay H, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[1127]
     temp_comment = temp_comment.replace("-", "")
     comments[1127] = temp_comment
     # John G. used periods off and on throughout his entry, along with comma separators.
     # Cannot filter through this as his separator for the entire entry. I'll just rewrite it.
-    print("John G, I fixed your entry")
+    logger.debug("John G, I fixed your entry")
     major_surgery_count += 1
-    print("INTERPRETATION WARNING: John G selected 'armstrong' as a GM")
-    print("I chose 'd armstrong' (eligible) instead of 'b armstrong' (inelgible)")
+    contest_warning("INTERPRETATION", "INTERPRETATION WARNING: John G selected 'armstrong' as a GM\n"
+                    "I chose 'd armstrong' (eligible) instead of 'b armstrong' (inelgible)", author="John G")
     comments[1143] = "1. col, veg, fla, tor, nyi\n2. buf, ari, cbj, ana, det\n3. cooper, quenneville, trotz, brind'amour, berube\n4. brisebois, zito, lamoriello, waddell, d armstrong\n5. saros, hellebuyck, demko, markstrom, kuemper\n6. caufield, zegras, seider, newhook\n7. makar, hughes, theodore. fox\n8. mcdavid, matthews, point, mackinnon\n9. borowiecki, leddy, c miller, crouse, edler"
     # Daryl H used both ")" and "." after his numbers, I'll replace the ")" with ""
-    print("Daryl H, I fixed your entry")
+    logger.debug("Daryl H, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[1148]
     temp_comment = temp_comment.replace(")", "")
     comments[1148] = temp_comment
     # Jesse H used a pile of commas and semicolons to identify all of his players and teams
     # I just have to rewrite the whole comment
-    print("Jesse H, I fixed your entry")
+    logger.debug("Jesse H, I fixed your entry")
     major_surgery_count += 1
     comments[1171] = "1. tbl, fla, veg, col, tor\n2. buf, ana, ari, sjs, det\n3. cooper,\n4. yzerman, brisebois, sakic, kekalainen, lamoriello\n5. gibson, hellebuyck, markstrom, kuemper, lehner\n6. caufield, zegras, knight\n7. makar, fox, mcavoy, hamilton, theodore\n8. mcdavid, mackinnon, marchand, barkov, matthews\n9. eichel, kessel, hertl\n10. draisaitl"
     # Bradley P somehow had tabs inserted into the start of his answers. He also wrote numbers like
     # "1.)" rather than using one or the other
-    print("Bradley P, I fixed your entry")
+    logger.debug("Bradley P, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[1214]
     temp_comment = temp_comment.replace("\t", "")
     temp_comment = temp_comment.replace(")", "")
     comments[1214] = temp_comment
     # David F used both "-" and "," in his entry, I will replace the leading "-"
-    print("David F, I fixed your entry")
+    logger.debug("David F, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[1227]
     temp_comment = temp_comment.replace("-", "")
     comments[1227] = temp_comment
     # Steven B skipped a question and put a bunch of stuff in the wrong slots
     # I just gotta write this one out manually
-    print("Steven B, I fixed your entry")
+    logger.debug("Steven B, I fixed your entry")
     major_surgery_count += 1
     comments[1261] = "1. tbl, nyi, tor, wsh, col\n2. det, buf, ari, ott, sjs\n3. cooper, quenneville, trotz, laviolette, deboer\n4. yzerman, waddell, sakic, guerin, blake\n5. vasilevskiy, hellebuyck\n6. 0 \n7. makar, hedman, carlson\n8. mcdavid, mackinnon, draisaitl\n9. gaudreau, eichel, kessel"
     # Nick D used both "-" and "," in his entry, I will replace the leading "-"
-    print("Nick D, I fixed your entry")
+    logger.debug("Nick D, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[1271]
     temp_comment = temp_comment.replace("-", "")
     comments[1271] = temp_comment
     # Matt B made two entries in one comment, one for him and one for his dad
     # I'm inclined to not allow this, but it's ultimately DGB's call. I'll generate them for now.
-    print("Matt B, I fixed your entry (and your dad's)")
+    logger.debug("Matt B, I fixed your entry (and your dad's)")
     major_surgery_count += 1
     comments[1282] = "1. col, veg, tbl, tor, car\n2. njd, ana, sjs, buf, ari\n3. cooper, bednar, keefe, brind'amour, cassidy\n4. brisebois, sweeney, mccrimmon, dubas, lamoriello\n5. vasilevskiy, hellebuyck, gibson, lehner, fleury\n6. caufield, zegras, seider, raymond, drysdale\n7. fox, hedman, makar, hamilton, mcavoy\n8. panarin, mcdavid, mackinnon, kucherov, draisaitl\n10. kucherov"
     matts_dad = "Matt B entry # 1282's dad"
@@ -463,58 +1237,217 @@ def comment_fixer(authors, comments):
     comments.append(matts_dad_entry)
     # Taralynn D. used both spaces and periods as separators, cannot use spaces without causing
     # lots of other problems, I'm fixing it
-    print("Taralynn D, I fixed your entry")
+    logger.debug("Taralynn D, I fixed your entry")
     major_surgery_count += 1
     comments[1316] = "tbl, col, veg, tor, nyi\n2. buf, ari, ana, det, cbj\n3. cooper, brind'amour, smith, quenneville, hakstol\n4. brisebois, francis, dorion, sakic, blake\n5. vasilevskiy, hellebuyck, saros, markstrom, demko\n6. caufield, zegras, knight, seider, drysdale\n7. hedman, fox, makar, hamilton, mcavoy\n8. mcdavid, mackinnon, matthews, barkov, draisaitl\n9. eichel, roussel, c miller, manson, stetcher\n10. draisaitl"
     # Scott D had multiple lines of commentary before his entry
-    print("Scott D, I fixed your entry")
+    logger.debug("Scott D, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[1335]
     temp_comment = temp_comment[66:]
     comments[1335] = temp_comment
     # Nav S used periods as the separator for the entire entry, cannot use periods
     # without inadvertently causing some other problems
-    print("Nav S, I fixed your entry")
+    logger.debug("Nav S, I fixed your entry")
     major_surgery_count += 1
     comments[1348] = "1. car, col, tbl, tor, veg\n2. ana, ari, buf, det, ott\n3. brind'amour, cooper, trotz, evason, keefe\n4. francis, yzerman, brisebois, lamoriello, blake\n5. demko, vasilevskiy, hellebuyck, saros, markstrom\n6. caufield, knight, zegras, byram\n7. makar, hedman, fox, ekblad, slavin\n8. mcdavid, matthews, draisaitl, mackinnon\n9. eichel, hertl, c miller, m staal, leddy"
     # JEFFREY R made only one pick per question, which I can't work around, so
     # I'll fix his entry for him
-    print("JEFFREY R, I fixed your entry")
+    logger.debug("JEFFREY R, I fixed your entry")
     major_surgery_count += 1
     comments[1366] = "1. veg, \n2. buf,\n3. trotz,\n4. sakic,\n5. hellebuyck,\n6. zegras,\n7. makar,\n8. mcdavid,\n9. rakell,"
     # Andrew James L. used spaces and commas as separators throughout his entry, cannot use spaces
     # without inadvertently causing a whooooooole bunch of other problems
-    print("Andrew James L., I fixed your entry")
+    logger.debug("Andrew James L., I fixed your entry")
     major_surgery_count += 1
     comments[1389] = "1. col, tbl, vgk, tor, min\n2. buf, ana, cbj, det, ari\n3. cooper, trotz, maurice, keefe, brind'amour\n4. brisebois, guerin, yzerman, d armstrong\n5. hellebuyck, vasilevskiy, markstrom, saros\n6. caufield, zegras, seider\n7. makar, hedman, mcavoy, fox, weegar\n8. mcdavid, matthews, mackinnon, kucherov, marchand\n9. kessel\n10. rantanen"
     # George K started each line with "# - ", and the "-" got caught as a separator
     # for part of the answers. Removing "-" from entry
-    print("George K, I fixed your entry")
+    logger.debug("George K, I fixed your entry")
     major_surgery_count += 1
     temp_comment = comments[1432]
     temp_comment = temp_comment.replace("-", "")
     comments[1432] = temp_comment
     # Christopher B added comments before his entry.
-    print("Christopher B, I fixed your entry")
+    logger.debug("Christopher B, I fixed your entry")
     major_surgery_count += 1
     comments[1462] = "1. tbl, col, veg, fla, car\n2. buf, ana, det, ari, sjs\n3. cooper, deboer, trotz, quenneville, brind'amour\n4. yzerman, maclellan, sakic, blake, lamoriello\n5. hellebuyck, vasilevskiy, saros, kuemper, gibson\n6. caufield, knight, zegras, seider, krebs\n7. makar, fox, hedman, pietrangelo, hughes\n8. mcdavid, mackinnon, draisaitl, crosby, pastrnak\n9. kessel, nyquist, henrique, leddy, zucker\n10. draisaitl"
     # Phil G used spaces as his separator for the entire entry, cannot use spaces
     # without inadvertently causing a whooooooole bunch of other problems
-    print("Phil G, I fixed your entry")
+    logger.debug("Phil G, I fixed your entry")
     major_surgery_count += 1
     comments[1495] = "1. tbl, tor, col, veg\n2. ott, det, buf, ari, ana\n3. brind'amour, trotz, cooper, maurice\n4. francis, sakic, brisebois, yzerman, blake\n5. vasilevskiy, hellebuyck, demko\n6. zegras, caufield, knight\n7. makar, mcavoy, hamilton\n8. mcdavid, mackinnon, kucherov, matthews\n9. kessel, hertl, forsberg, eichel\n10. matthews"
     # Elliott W made only one pick per question, which I can't work around, so
     # I'll fix his entry for him
-    print("Elliott W, I fixed your entry")
+    logger.debug("Elliott W, I fixed your entry")
     major_surgery_count += 1
     comments[1552] = "1. nyi,\n2. buf,\n3. cooper,\n4. yzerman,\n5. vasilevskiy,\n6. byram,\n7. fox,\n8. matthews,\n9. kessel,\n10. marner "
-    print("All 'major surgery' operations performed on comments")
-    print(f"{major_surgery_count} comments had to be handled in this fashion.")
-    print("All comments are now ready to be programmatically handled as contest entries.")
+    logger.info("All 'major surgery' operations performed on comments")
+    logger.info(f"{major_surgery_count} comments had to be handled in this fashion.")
+    logger.info("All comments are now ready to be programmatically handled as contest entries.")
     return major_surgery_count, authors, comments
 
 
-def generate_dataframe(authors, comments):
+def parse_entry(i, author, comment):
+    """ Reads one comment (comment i, by author) into a list of the author
+    and their answers, in the same order as generate_dataframe's columns.
+    Rather than logging its notices (blank lines, too many answers), it
+    returns them as a list of messages along with the entry, so they can be
+    logged in order even when entries are read in other processes, or
+    reused from the stage cache. Each message is a (kind, template,
+    details) tuple: the details (author, entry, question...) are filled
+    into the template when it's logged (see log_entry_messages), so the
+    entry number can be brought up to date first.
+    """
+    messages = []
+    # Start list with author name, list to eventually be placed in dataframe
+    this_entry = [author]
+    # Track which question we're on for specific filtering operations
+    question_line = 0
+    # Handling x author, handle x comment as well, and split that comment
+    # into lines to be processed one at a time
+    for line in comment.splitlines():
+        # If stripped line is empty, skip to next line
+        if not line.strip():
+            continue
+        # Swap out the various separators people used for commas, and rewrite
+        # the many spellings of "marc-andre fleury" (see FLEURY_SPELLINGS)
+        line = normalize_separators(line)
+        # If we aren't in the middle of question lines AND no commas
+        # are present, skip to next line
+        if (question_line == 0) and (line.find(",") == -1):
+            continue
+        # If we haven't failed out, this line is an answer to a question
+        # Increment the question counter to reflect active question
+        question_line += 1
+        # Now that we know we're in the answers, substitute " and " that people
+        # included in their answers. Including spaces saves names like "andy", "andrei", etc.
+        # Replacing " and " done with an oxford comma (good grammar!)
+        if ", and " in line:
+            line = line.replace(", and ", ", ")
+        # Replacing " and " done without an oxford comma, if it wasn't already replaced above
+        if " and " in line:
+            line = line.replace(" and ", ",")
+        # Someone managed to insert a "hard" space in their entry instead of a normal space
+        # Turning any hard space encountered into a normal space
+        if "\xa0" in line:
+            line = line.replace("\xa0", " ")
+        # Some people added lines to the bottom of their entry, if we're in
+        # these lines, get out!
+        if question_line > 10:
+            continue
+        # If line starts with "10", then slice off first 3 characters
+        if line.startswith("10"):
+            line = line[3:]
+        # If line starts with "bonus" instead of "10" (some people did this)
+        # Then slice off the first 6 characters
+        if line.startswith("bonus"):
+            line = line[6:]
+        # Placed this check into a try block because some people wrote in Q10
+        # but left it blank, causing a crash
+        try:
+            # If line starts off with a digit (and wasn't already identified as
+            # '10'), then slice off first 2 characters
+            if line[0].isdigit():
+                line = line[2:]
+        except:
+            messages.append((None,
+                             "NOTIFICATION: line appears blank, cannot slice index 0\n"
+                             "Please check index {entry} by author {author} to verify this behavior",
+                             {"author": author, "entry": i}))
+        # Remove any trailing/leading spaces
+        line = line.strip()
+        # Edge case: If line ends with comma, remove it to prevent creating
+        # additional list elements that are empty (I did this)
+        if line.endswith(","):
+            line = line[:-1]
+        # Edge case: If line ends with period, remove it so I don't have to fix it later
+        if line.endswith("."):
+            line = line[:-1]
+        # Split the line into its constituent answers, by comma
+        answers = line.split(",")
+        # Make sure line does not have more than five answers
+        # If so, take only their first 5 answers and snitch on them
+        if len(answers) > 5:
+            messages.append(("SNITCHING",
+                             "SNITCHING: {author} on entry {entry} had more than 5 entries in question {question}!\n"
+                             "Only taking their first 5 answers for this question",
+                             {"author": this_entry[0], "entry": i, "question": question_line, "answers": len(answers)}))
+            answers = answers[0:5]
+        # If we are not on question # 10 (only 1 possible answer), then
+        # check if there aren't 5 answers in the line, and if there are not,
+        # pad it out to contain 5 answers with NaN values
+        if question_line != 10:
+            while len(answers) < 5:
+                answers.append(np.nan)
+        # If we are on question 10 and for some reason you used a comma in your
+        # entry (e.g. "nope, not trying"), take only first element of the list
+        if question_line == 10 and len(answers) > 1:
+            answers = answers[:1]
+        # Now take the five answers and append each to this_entry list
+        for answer in answers:
+            # Some people's formatting led to white space inside list, strip it
+            # Checking for type == string to avoid trying to strip NaNs and crashing
+            if type(answer) == str:
+                answer = answer.strip()
+            this_entry.append(answer)
+
+    # Some people didn't include a line for Q10 if they didn't answer it
+    # Check for if we've finished and are still on Q9
+    # If so, add a NaN for Q10
+    if question_line == 9:
+        this_entry.append(np.nan)
+    return this_entry, messages
+
+
+def parse_entry_chunk(positions, authors, comments):
+    """ Runs parse_entry over one chunk of the authors and comments, given
+    each one's position on the page. This is what each worker process runs
+    for parse_entries.
+    """
+    return [parse_entry(i, author, comment) for i, author, comment in zip(positions, authors, comments)]
+
+
+def parse_entries(authors, comments, workers=1, positions=None):
+    """ Runs parse_entry over every comment, and returns its (entry,
+    messages) for each one, in order. With workers above 1, the comments
+    are split into chunks and read by that many processes. positions are
+    where each comment is on the page (0, 1, 2... unless given), for
+    parse_entry's messages.
+    """
+    if positions is None:
+        positions = range(len(authors))
+    positions = list(positions)
+    # Read the comments in contiguous chunks, one process per worker. Results come back in
+    # chunk order, so every entry keeps its original index and the fixes in dataframe_fixer
+    # still line up
+    if workers > 1 and len(authors) > 1:
+        chunk_size = -(-len(authors) // (workers * 4))
+        starts = list(range(0, len(authors), chunk_size))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parsed_chunks = executor.map(parse_entry_chunk,
+                                         [positions[x:x + chunk_size] for x in starts],
+                                         [authors[x:x + chunk_size] for x in starts],
+                                         [comments[x:x + chunk_size] for x in starts])
+            return [parsed for chunk in parsed_chunks for parsed in chunk]
+    return parse_entry_chunk(positions, authors, comments)
+
+
+def log_entry_messages(messages, i):
+    """ Logs the messages parse_entry returned for the entry at position i
+    (see parse_entry), as contest warnings (or plain warnings, for a kind
+    of None).
+    """
+    for kind, template, details in messages:
+        details = {**details, "entry": i}
+        message = template.format(**details)
+        if kind is None:
+            logger.warning(message)
+        else:
+            contest_warning(kind, message, **details)
+
+
+def generate_dataframe(authors, comments, workers=1, comment_ids=None):
     """ This function takes a list of authors and a corresponding and
     equal list of comments and generates a dataframe from the two. Each
     line consists of the author (e.g. author[42]) and the 46 potential
@@ -523,177 +1456,179 @@ def generate_dataframe(authors, comments):
     the first "answer" line (some entries are preceded by non-answers), 
     and iterating through the lines to generate all 46 answers to 10
     questions. Returns a dataframe with each contest entry on a row.
-    This function will print out lots of information about its handling
-    of each new index, including certain edge cases that apply.
+    This function will log lots of information about its handling
+    of each new index (at DEBUG level), including certain edge cases
+    that apply (as warnings).
 
     Note that this function includes numerous special-case handling 
     operations, due to a *wide* variety of entry formats in the absence
     of an enforced standard. This function may be rewritten with an 
     enforced formatting standard, which may also dramatically reduce
     the number of entries needing manual intervention. 
+
+    Each comment is read on its own (see parse_entry), so with workers
+    above 1 the comments are split into chunks and read by that many
+    processes. The dataframe and the printed output come out the same as
+    with one worker, in the original order and with the original indices.
+
+    If comment_ids (from entry_scraper) are given, they become the index of
+    the dataframe, so each entry can be found by its ID no matter where it
+    ends up. Entries past the end of comment_ids (like ones added by
+    comment_fixer) get an ID made from their author and comment. Without
+    comment_ids, the index is just each entry's position.
+    """
+    parsed_entries = parse_entries(authors, comments, workers=workers)
+    return entries_dataframe(authors, parsed_entries, entry_index(authors, comments, comment_ids))
+
+
+def entries_dataframe(authors, parsed_entries, index=None):
+    """ Builds generate_dataframe's dataframe from each author's parsed
+    entry and messages (see parse_entries), in page order, logging each
+    entry's messages along the way. index becomes the dataframe's index.
     """
     # Generate a dataframe, which we'll add the answers to
     col_names = ['author', 'q1a1', 'q1a2', 'q1a3', 'q1a4', 'q1a5', 'q2a1', 'q2a2', 'q2a3', 'q2a4', 'q2a5', 'q3a1', 'q3a2', 'q3a3', 'q3a4', 'q3a5', 'q4a1', 'q4a2', 'q4a3', 'q4a4', 'q4a5', 'q5a1', 'q5a2', 'q5a3', 'q5a4',
                  'q5a5', 'q6a1', 'q6a2', 'q6a3', 'q6a4', 'q6a5', 'q7a1', 'q7a2', 'q7a3', 'q7a4', 'q7a5', 'q8a1', 'q8a2', 'q8a3', 'q8a4', 'q8a5', 'q9a1', 'q9a2', 'q9a3', 'q9a4', 'q9a5', 'q10a1']
-    df = pd.DataFrame(columns=col_names)
-    # Iterate through the lists of authors and corresponding comments, together:
-    for i in range(len(authors)):
-        print(f"Handling index {i}, author: {authors[i]}...")
-        # Start list with author name, list to eventually be placed in dataframe
-        this_entry = [authors[i]]
-        # Track which question we're on for specific filtering operations
-        question_line = 0
-        # Handling x author, handle x comment as well, and split that comment
-        # into lines to be processed one at a time
-        for line in comments[i].splitlines():
-            # If stripped line is empty, skip to next line
-            if not line.strip():
-                continue
-            # A handful of people used '&' instead of ',', replace those
-            if "&" in line:
-                line = line.replace("&", ",")
-            # Another handful of people used ';' instead of ',', replace those
-            if ";" in line:
-                line = line.replace(";", ",")
-            # Special situation - "marc-andre fleury" messes up replacing '-' with ','
-            # Also have to account for 'andré', and for "fluery", apparently
-            # Also apparently have to account for hypenation between "andre" and "fleury", I guess
-            # Also apparently have to account for "marc-andre f", I guess
-            # Also apparently have to account for "marc andre-flurry" too, I guess
-            # Also apparently have to account for "andre-fleury" too, I guess
-            # Also apparently have to account for "m-a fleury" too, I guess
-            # Also apparently have to account for "marc andre-feury" too, I guess
-            # If Flower retires, that'd be convenient...
-            if "marc-andre fleury" in line:
-                line = line.replace("marc-andre fleury", "fleury")
-            if "marc-andré fleury" in line:
-                line = line.replace("marc-andré fleury", "fleury")
-            if "marc-andre fluery" in line:
-                line = line.replace("marc-andre fluery", "fleury")
-            if "marc-andré fluery" in line:
-                line = line.replace("marc-andré fluery", "fleury")
-            if "marc andre-fleury" in line:
-                line = line.replace("marc andre-fleury", "fleury")
-            if "marc andré-fleury" in line:
-                line = line.replace("marc andré-fleury", "fleury")
-            if "marc andre-fluery" in line:
-                line = line.replace("marc andre-fluery", "fleury")
-            if "marc andré-fluery" in line:
-                line = line.replace("marc andré-fluery", "fleury")
-            if "marc andre-feury" in line:
-                line = line.replace("marc andre-feury", "fleury")
-            if "marc-andre f" in line:
-                line = line.replace("marc-andre f", "fleury")
-            if "marc andré-f" in line:
-                line = line.replace("marc andré-f", "fleury")
-            if "marc andre-flurry" in line:
-                line = line.replace("marc andre-flurry", "fleury")
-            if "andre-fleury" in line:
-                line = line.replace("andre-fleury", "fleury")
-            if "m-a fleury" in line:
-                line = line.replace("m-a fleury", "fleury")
-            # Yet another handful of people used '-' instead of ',', replace those
-            if "-" in line:
-                line = line.replace("-", ",")
-            # And yet more people used '/' instead of ',', replace those
-            if "/" in line:
-                line = line.replace("/", ",")
-            # If we aren't in the middle of question lines AND no commas
-            # are present, skip to next line
-            if (question_line == 0) and (line.find(",") == -1):
-                continue
-            # If we haven't failed out, this line is an answer to a question
-            # Increment the question counter to reflect active question
-            question_line += 1
-            # Now that we know we're in the answers, substitute " and " that people
-            # included in their answers. Including spaces saves names like "andy", "andrei", etc.
-            # Replacing " and " done with an oxford comma (good grammar!)
-            if ", and " in line:
-                line = line.replace(", and ", ", ")
-            # Replacing " and " done without an oxford comma, if it wasn't already replaced above
-            if " and " in line:
-                line = line.replace(" and ", ",")
-            # Someone managed to insert a "hard" space in their entry instead of a normal space
-            # Turning any hard space encountered into a normal space
-            if "\xa0" in line:
-                line = line.replace("\xa0", " ")
-            # Some people added lines to the bottom of their entry, if we're in
-            # these lines, get out!
-            if question_line > 10:
-                continue
-            # If line starts with "10", then slice off first 3 characters
-            if line.startswith("10"):
-                line = line[3:]
-            # If line starts with "bonus" instead of "10" (some people did this)
-            # Then slice off the first 6 characters
-            if line.startswith("bonus"):
-                line = line[6:]
-            # Placed this check into a try block because some people wrote in Q10
-            # but left it blank, causing a crash
-            try:
-                # If line starts off with a digit (and wasn't already identified as
-                # '10'), then slice off first 2 characters
-                if line[0].isdigit():
-                    line = line[2:]
-            except:
-                print(
-                    "NOTIFICATION: line appears blank, cannot slice index 0")
-                print(
-                    f"Please check index {i} by author {authors[i]} to verify this behavior")
-            # Remove any trailing/leading spaces
-            line = line.strip()
-            # Edge case: If line ends with comma, remove it to prevent creating
-            # additional list elements that are empty (I did this)
-            if line.endswith(","):
-                line = line[:-1]
-            # Edge case: If line ends with period, remove it so I don't have to fix it later
-            if line.endswith("."):
-                line = line[:-1]
-            # Split the line into its constituent answers, by comma
-            answers = line.split(",")
-            # Make sure line does not have more than five answers
-            # If so, take only their first 5 answers and snitch on them
-            if len(answers) > 5:
-                print(
-                    f"SNITCHING: {this_entry[0]} on entry {i} had more than 5 entries in question {question_line}!")
-                print("Only taking their first 5 answers for this question")
-                answers = answers[0:5]
-            # If we are not on question # 10 (only 1 possible answer), then
-            # check if there aren't 5 answers in the line, and if there are not,
-            # pad it out to contain 5 answers with NaN values
-            if question_line != 10:
-                while len(answers) < 5:
-                    answers.append(np.nan)
-            # If we are on question 10 and for some reason you used a comma in your
-            # entry (e.g. "nope, not trying"), take only first element of the list
-            if question_line == 10 and len(answers) > 1:
-                answers = answers[:1]
-            # Now take the five answers and append each to this_entry list
-            for answer in answers:
-                # Some people's formatting led to white space inside list, strip it
-                # Checking for type == string to avoid trying to strip NaNs and crashing
-                if type(answer) == str:
-                    answer = answer.strip()
-                this_entry.append(answer)
-
-        # Some people didn't include a line for Q10 if they didn't answer it
-        # Check for if we've finished and are still on Q9
-        # If so, add a NaN for Q10
-        if question_line == 9:
-            this_entry.append(np.nan)
-
-        # With all answers now packaged in list with author, convert list
-        # To Series, using df.column names as index
-        entry_line = pd.Series(this_entry, index=df.columns)
-        print("Appending entry to dataframe...")
-        # Append the Series to the DF
-        df = df.append(entry_line, ignore_index=True)
+    # Collect answers into one buffer per column, and build the dataframe once at the end
+    # Appending rows to a dataframe copies the whole frame each time, which gets slow fast
+    column_buffers = {col_name: [] for col_name in col_names}
+    # The line for every entry is only put together if it's going to be shown
+    # (see configure_logging), since that's a lot of lines at scale
+    debugging = logger.isEnabledFor(logging.DEBUG)
+    # Iterate through the lists of authors and their parsed comments, together:
+    for i, (this_entry, messages) in enumerate(parsed_entries):
+        if debugging:
+            logger.debug("Handling index %s, author: %s...", i, authors[i])
+        log_entry_messages(messages, i)
+        # With all answers now packaged in list with author, make sure the entry
+        # lines up with the columns before adding it to the column buffers
+        if len(this_entry) != len(col_names):
+            raise ValueError(
+                f"Entry {i} by author {authors[i]} has {len(this_entry)} values, expected {len(col_names)}")
+        if debugging:
+            logger.debug("Appending entry to dataframe...")
+        # Add each value to the buffer for its column
+        for col_name, value in zip(col_names, this_entry):
+            column_buffers[col_name].append(value)
+    # Build the dataframe from the column buffers in a single step
+    df = pd.DataFrame(column_buffers, columns=col_names, dtype=object, index=index)
     # Notify that dataframe generation is complete
-    print("**********DATAFRAME HAS BEEN GENERATED**********")
-    print(f"This dataframe contains {df.shape[0]} lines!")
+    logger.info("**********DATAFRAME HAS BEEN GENERATED**********")
+    logger.info(f"This dataframe contains {df.shape[0]} lines!")
     return df
 
 
+def entry_index(authors, comments, comment_ids=None):
+    """ Returns the index for generate_dataframe: the comment IDs, with an
+    ID made from the author and comment for any entry past the end of
+    comment_ids (like ones added by comment_fixer). Returns None (so the
+    index is just each entry's position) if there are no comment_ids.
+    """
+    if comment_ids is None:
+        return None
+    added_ids = [comment_id(None, author, "", comment)
+                 for author, comment in zip(authors[len(comment_ids):], comments[len(comment_ids):])]
+    return pd.Index(unique_comment_ids(list(comment_ids) + added_ids), name="comment_id")
+
+
+def benchmark_generate_dataframe(authors, comments, worker_counts=None):
+    """ Times generate_dataframe over the same authors and comments with
+    different numbers of worker processes (by default 1, 2, 4... up to the
+    number of cores), and checks that each gives exactly the same dataframe
+    as one worker. Prints and returns a dataframe with one row per worker
+    count, holding the time taken, the speedup over one worker, and whether
+    the results matched. generate_dataframe's own printing is hidden while
+    it's being timed.
+    """
+    if worker_counts is None:
+        core_count = os.cpu_count() or 1
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= core_count:
+            worker_counts.append(worker_counts[-1] * 2)
+        if worker_counts[-1] != core_count:
+            worker_counts.append(core_count)
+    results = []
+    expected = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            df = generate_dataframe(authors, comments, workers=workers)
+        seconds = time.perf_counter() - start
+        if expected is None:
+            expected = (df, seconds)
+        results.append({"workers": workers,
+                        "seconds": seconds,
+                        "speedup": expected[1] / seconds,
+                        "matches_one_worker": df.equals(expected[0])})
+    results = pd.DataFrame(results).set_index("workers")
+    logger.info(f"generate_dataframe over {len(comments)} comments on {os.cpu_count()} cores:")
+    logger.info(results)
+    return results
+
+
+def synthetic_entries(entry_count, seed=0, table_dir=ALIAS_TABLE_DIR):
+    """ Makes up entry_count contest entries for benchmarking, laid out the
+    way entrants write them ("1. tbl, col, ...", one question per line).
+    Each question gets one to five answers (at least two for question 1,
+    since generate_dataframe starts reading at the first line with a comma,
+    and one for question 10), picked at random from the spellings in that
+    question's alias tables, so the answers look like real ones and
+    standardize like real ones. Only spellings that are plain words are
+    used, so none of them get split up by the separators. Returns a list of
+    authors and a list of comments, like entry_scraper.
+    """
+    rng = np.random.default_rng(seed)
+    plain_spelling = re.compile(r"[a-z][a-z' ]*")
+    spellings = {}
+    for question, table_names in QUESTION_ALIAS_TABLES.items():
+        aliases = {}
+        for table_name in table_names:
+            aliases.update(read_alias_table(os.path.join(table_dir, table_name + ".csv")))
+        spellings[question] = np.array(sorted(
+            alias for alias, standard in aliases.items()
+            if pd.notna(standard) and plain_spelling.fullmatch(alias) and " and " not in alias), dtype=object)
+    authors = [f"Entrant {i}" for i in range(entry_count)]
+    comments = []
+    for _ in range(entry_count):
+        lines = []
+        for question_number, (question, columns) in enumerate(QUESTION_COLUMNS.items(), start=1):
+            answer_count = rng.integers(2 if question_number == 1 else 1, len(columns) + 1)
+            answers = spellings[question][rng.integers(0, len(spellings[question]), answer_count)]
+            lines.append(f"{question_number}. " + ", ".join(answers))
+        comments.append("\n".join(lines))
+    return authors, comments
+
+
+def benchmark_entry_scaling(entry_counts=(1_000, 10_000, 100_000), seed=0):
+    """ Times generate_dataframe (with one worker) over synthetic entries
+    (see synthetic_entries) of each size in entry_counts, to show how its
+    time grows with the number of entries. Prints and returns a dataframe
+    with one row per size, holding the time taken, the time per 1,000
+    entries, and the time relative to growing linearly from the smallest
+    size (about 1 all the way down if it scales linearly, and growing with
+    the size if it doesn't). generate_dataframe's own printing is hidden
+    while it's being timed.
+    """
+    results = []
+    for entry_count in entry_counts:
+        authors, comments = synthetic_entries(entry_count, seed=seed)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            df = generate_dataframe(authors, comments)
+        seconds = time.perf_counter() - start
+        if not results:
+            smallest = (entry_count, seconds)
+        results.append({"entries": entry_count,
+                        "rows": len(df),
+                        "seconds": seconds,
+                        "seconds_per_1000": seconds / entry_count * 1000,
+                        "vs_linear": seconds / (smallest[1] * entry_count / smallest[0])})
+    results = pd.DataFrame(results).set_index("entries")
+    logger.info("generate_dataframe scaling over synthetic entries:")
+    logger.info(results)
+    return results
+
+
 def dataframe_fixer(df):
     """ While some entries had formatting issues that prevented
     programmatic handling and required 'major surgery' as a
@@ -707,45 +1642,51 @@ def dataframe_fixer(df):
 
     Again, this function was customized to correct these issues 
     and would have to be rewritten for subsequent contests. 
+
+    The fixes below go by each entry's position, so if the dataframe is
+    indexed by comment ID, the IDs are set aside while fixing and put back
+    on afterwards.
     """
+    comment_ids = df.index
+    df = df.reset_index(drop=True)
     minor_surgery_count = 0
     # Luca D included multiple lines of commentary in his answer
-    print("Luca D, I fixed your entry")
+    logger.debug("Luca D, I fixed your entry")
     minor_surgery_count += 1
     df.at[1, 'q8a4'] = np.nan
     df.at[1, 'q9a1'] = np.nan
     df.at[1, 'q9a2'] = np.nan
     df.at[1, 'q10a1'] = "giroux"
     # Emma G selected "bernard" as a coach
-    print("Emma G, I fixed your entry")
+    logger.debug("Emma G, I fixed your entry")
     minor_surgery_count += 1
-    print("INTERPRETATION WARNING: Emma G wrote in 'bernard' as one of her coaches")
-    print("Not sure if this is Bednar (seems like an autocorrect) or Berube (same start of word)")
-    print("Bednar is the more popular pick, so she gets Bednar")
+    contest_warning("INTERPRETATION", "INTERPRETATION WARNING: Emma G wrote in 'bernard' as one of her coaches\n"
+                    "Not sure if this is Bednar (seems like an autocorrect) or Berube (same start of word)\n"
+                    "Bednar is the more popular pick, so she gets Bednar", author="Emma G")
     df.at[7, 'q3a4'] = "bednar"
     # Anthony F forgot a comma
-    print("Anthony F, I fixed your entry")
+    logger.debug("Anthony F, I fixed your entry")
     minor_surgery_count += 1
     df.at[16, 'q6a3'] = "rossi"
     df.at[16, 'q6a5'] = "newhook"
     # Brendan M dropped an extra period into one of his answers
-    print("Brendan M, I fixed your entry")
+    logger.debug("Brendan M, I fixed your entry")
     minor_surgery_count += 1
     df.at[24, 'q4a1'] = "sakic"
     df.at[24, 'q4a2'] = "dubas"
     # Brandon K dropped an extra period into two of his answers
-    print("Brandon K, I fixed your entry")
+    logger.debug("Brandon K, I fixed your entry")
     minor_surgery_count += 1
     df.at[31, 'q2a4'] = "ari"
     df.at[31, 'q2a5'] = "cbj"
     df.at[31, 'q3a1'] = "cooper"
     df.at[31, 'q3a5'] = "trotz"
     # David B had an explanation of picking ron francis
-    print("David B, I fixed your entry")
+    logger.debug("David B, I fixed your entry")
     minor_surgery_count += 1
     df.at[36, 'q4a1'] = "francis"
     # Brant G. tagged each line with a prompt ("playoffs:", etc., along with some commentary)
-    print("Brant G, I fixed your entry")
+    logger.debug("Brant G, I fixed your entry")
     minor_surgery_count += 1
     df.at[45, "q1a1"] = "tbl"
     df.at[45, "q1a5"] = "car"
@@ -763,69 +1704,69 @@ def dataframe_fixer(df):
     # Joe R also stated he wasn't sure if Panarin is calder-eligible but maybe would select him
     # Not adding him to his entry, I've been being very permissive on keeping people in the contest
     # Without any directions from Sean to the contrary
-    print("Joe R, I fixed your entry")
+    logger.debug("Joe R, I fixed your entry")
     minor_surgery_count += 1
     df.at[52, 'q6a3'] = "podkolzin"
     df.at[52, 'q6a4'] = np.nan
     df.at[52, 'q6a5'] = np.nan
     # Ben H didn't enter anything for Q9 or Q10
-    print("Ben H, I fixed your entry")
+    logger.debug("Ben H, I fixed your entry")
     minor_surgery_count += 1
     df.at[63, 'q9a1'] = np.nan
     df.at[63, 'q9a2'] = np.nan
     df.at[63, 'q10a1'] = np.nan
     # Paul G dropped an extra period in an answer
-    print("Paul G, I fixed your entry")
+    logger.debug("Paul G, I fixed your entry")
     minor_surgery_count += 1
     df.at[93, 'q6a1'] = "zegras"
     df.at[93, 'q6a3'] = "caufield"
     # Damian H added commentary to some of his answers
-    print("Damian H, I fixed your entry")
+    logger.debug("Damian H, I fixed your entry")
     df.at[156, 'q6a3'] = np.nan
     df.at[156, 'q9a1'] = "eichel"
     df.at[156, 'q10a1'] = "kucherov"
     # Dylan C had an explanation of picking ron francis
-    print("Dylan C, I fixed your entry")
+    logger.debug("Dylan C, I fixed your entry")
     minor_surgery_count += 1
     df.at[180, 'q4a5'] = "francis"
     # Alexx M dropped a semicolon into one of his answers and used some mysterious punctuation on Markstrom
-    print("Alexx M, I fixed your entry")
+    logger.debug("Alexx M, I fixed your entry")
     minor_surgery_count += 1
     df.at[188, 'q2a2'] = "ari"
     df.at[188, 'q2a5'] = "sjs"
     df.at[188, 'q5a3'] = "markstrom"
     # Andre D dropped an extra period into one of his answers
-    print("Andre D, I fixed your entry")
+    logger.debug("Andre D, I fixed your entry")
     minor_surgery_count += 1
     df.at[200, 'q2a1'] = "buf"
     df.at[200, 'q2a5'] = "ari"
     # Tim S included commentary in an answer
-    print("Tim S, I fixed your entry")
+    logger.debug("Tim S, I fixed your entry")
     minor_surgery_count += 1
     df.at[228, 'q8a5'] = "marchand"
     # Nick L didn't enter anything for Q9 or Q10
-    print("Nick L, I fixed your entry")
+    logger.debug("Nick L, I fixed your entry")
     minor_surgery_count += 1
     df.at[233, 'q9a1'] = np.nan
     # Max A selected "miller" as a player to be traded
     # There are two active Millers, I've been interpreting these as the more popular one, in this case colin miller
-    print("Max A, I fixed your entry")
+    logger.debug("Max A, I fixed your entry")
     minor_surgery_count += 1
-    print("INTERPRETATION WARNING: Entry specifies 'miller' to get traded, this is interpreted as c miller")
+    contest_warning("INTERPRETATION", "INTERPRETATION WARNING: Entry specifies 'miller' to get traded, this is interpreted as c miller", author="Max A")
     df.at[270, 'q9a4'] = "c miller"
     # Liam A dropped a period in instead of a comma
-    print("Liam A, I fixed your entry")
+    logger.debug("Liam A, I fixed your entry")
     minor_surgery_count += 1
     df.at[278, 'q8a2'] = "matthews"
     df.at[278, 'q8a5'] = "mackinnon"
     # Julien G dropped extra commas in an answer
-    print("Julien G, I fixed your entry")
+    logger.debug("Julien G, I fixed your entry")
     minor_surgery_count += 1
     df.at[304, 'q8a3'] = "draisaitl"
     df.at[304, 'q8a4'] = np.nan
     df.at[304, 'q10a1'] = np.nan
     # ED P. used a letter to start each line, instead of a number
-    print("ED P, I fixed your entry")
+    logger.debug("ED P, I fixed your entry")
     minor_surgery_count += 1
     df.at[309, "q1a1"] = "col"
     df.at[309, "q2a1"] = "buf"
@@ -838,20 +1779,20 @@ def dataframe_fixer(df):
     df.at[309, "q9a1"] = "hertl"
     df.at[309, "q10a1"] = "draisaitl"
     # Edward A dropped an extra comma in an answer
-    print("Edward A, I fixed your entry")
+    logger.debug("Edward A, I fixed your entry")
     minor_surgery_count += 1
     df.at[315, 'q8a1'] = "mcdavid"
     df.at[315, 'q8a2'] = "barkov"
     # Chris H dropped an extra period in an answer
-    print("Chris H, I fixed your entry")
+    logger.debug("Chris H, I fixed your entry")
     minor_surgery_count += 1
     df.at[316, 'q6a2'] = "zegras"
     df.at[316, 'q6a4'] = "knight"
     # Jacob G couldn't be bothered to list his coaches or gm's and just said "the ones from the teams in Q1"
     # Fortunately for Jacob G, I'm not eliminating anyone, that's up to Sean
-    print("Jacob G, I'm fixing your entry... reluctantly")
+    logger.debug("Jacob G, I'm fixing your entry... reluctantly")
     minor_surgery_count += 1
-    print("I can't help that you ended up with an ineligible GM though")
+    logger.debug("I can't help that you ended up with an ineligible GM though")
     df.at[328, 'q3a1'] = "cooper"
     df.at[328, 'q3a2'] = "cassidy"
     df.at[328, 'q3a3'] = "bednar"
@@ -863,88 +1804,88 @@ def dataframe_fixer(df):
     df.at[328, 'q4a4'] = "mccrimmon"
     df.at[328, 'q4a5'] = "zito"
     # Chayim S didn't enter anything for Q9
-    print("Chayim S, I fixed your entry")
+    logger.debug("Chayim S, I fixed your entry")
     minor_surgery_count += 1
     df.at[332, 'q9a1'] = np.nan
     # Alex W left question 5 blank
-    print("Alex W, I fixed your entry")
+    logger.debug("Alex W, I fixed your entry")
     minor_surgery_count += 1
     df.at[347, 'q5a1'] = np.nan
     # Derek R had a leading space before his numbering in Q9
-    print("Derek R, I fixed your entry")
+    logger.debug("Derek R, I fixed your entry")
     minor_surgery_count += 1
     df.at[352, 'q9a1'] = "eichel"
     df.at[352, 'q10a1'] = np.nan
     # Jesse E didn't enter anything for Q9 or Q10
-    print("Jesse E, I fixed your entry")
+    logger.debug("Jesse E, I fixed your entry")
     minor_surgery_count += 1
     df.at[355, 'q9a1'] = np.nan
     df.at[355, 'q10a1'] = np.nan
     # Jordi A dropped an extra period into an answer
-    print("Jordi A, I fixed your entry")
+    logger.debug("Jordi A, I fixed your entry")
     minor_surgery_count += 1
     df.at[377, 'q4a1'] = "sweeney"
     df.at[377, 'q4a5'] = "bowman"
     # Whistler B picked marner for Q10
-    print("Whistler B, I fixed your entry")
+    logger.debug("Whistler B, I fixed your entry")
     minor_surgery_count += 1
     df.at[387, 'q10a1'] = "marner"
     # David B listed one of his nonplayoff teams as "set"
-    print("David B, I fixed your entry")
+    logger.debug("David B, I fixed your entry")
     minor_surgery_count += 1
-    print("INTERPRETATION WARNING: David B listed one of his non-playoff teams as 'set'")
-    print("This is being interpreted as Seattle")
+    contest_warning("INTERPRETATION", "INTERPRETATION WARNING: David B listed one of his non-playoff teams as 'set'\n"
+                    "This is being interpreted as Seattle", author="David B")
     df.at[393, 'q2a2'] = "sea"
     # Ryder S forgot a couple of commas in his answers
-    print("Ryder S, I fixed your entry")
+    logger.debug("Ryder S, I fixed your entry")
     minor_surgery_count += 1
     df.at[410, 'q3a4'] = "brind'amour"
     df.at[410, 'q3a5'] = "keefe"
     df.at[410, 'q4a4'] = "lamoriello"
     df.at[410, 'q4a5'] = "mccrimmon"
     # Andrew B didn't answer multiple questions
-    print("Andrew B, I fixed your entry")
+    logger.debug("Andrew B, I fixed your entry")
     minor_surgery_count += 1
     df.at[422, 'q6a1'] = np.nan
     df.at[422, 'q7a1'] = np.nan
     df.at[422, 'q9a1'] = np.nan
     # Steven E included commentary on some answers
-    print("Steven E, I fixed your entry")
+    logger.debug("Steven E, I fixed your entry")
     minor_surgery_count += 1
     df.at[423, 'q5a2'] = np.nan
     df.at[423, 'q10a1'] = np.nan
     # Michael S had an explanation of picking ron francis
-    print("Michael S, I fixed your entry")
+    logger.debug("Michael S, I fixed your entry")
     minor_surgery_count += 1
     minor_surgery_count += 1
     df.at[445, 'q4a5'] = "francis"
     # David J dropped an extra comma in Q9
-    print("David J, I fixed your entry")
+    logger.debug("David J, I fixed your entry")
     minor_surgery_count += 1
     df.at[462, 'q9a3'] = "rakell"
     df.at[462, 'q9a4'] = np.nan
     # Daniel A passed on a couple of questions
-    print("Daniel A, I fixed your entry")
+    logger.debug("Daniel A, I fixed your entry")
     minor_surgery_count += 1
     df.at[472, 'q6a1'] = np.nan
     df.at[472, 'q10a1'] = np.nan
     # Tyler S dropped an extra period into an answer
-    print("Tyler S, I fixed your entry")
+    logger.debug("Tyler S, I fixed your entry")
     minor_surgery_count += 1
     df.at[491, 'q4a4'] = "lamoriello"
     df.at[491, 'q4a5'] = "hextall"
     # Zachary P. picked caufield and then lamented Calder trophy voting
-    print("Zachary P, I fixed your entry")
+    logger.debug("Zachary P, I fixed your entry")
     minor_surgery_count += 1
     df.at[503, 'q6a1'] = "caufield"
     df.at[503, 'q6a2'] = np.nan
     # Chris S did not answer Q9
-    print("Chris S, I fixed your entry")
+    logger.debug("Chris S, I fixed your entry")
     minor_surgery_count += 1
     df.at[507, 'q9a1'] = np.nan
     # Mike M looks like he swapped his answers for question 7 (norris) and question 8 (hart)
     # I'll fix it for him
-    print("Mike M, I fixed your entry")
+    logger.debug("Mike M, I fixed your entry")
     minor_surgery_count += 1
     df.at[541, 'q7a1'] = "makar"
     df.at[541, 'q7a2'] = "hedman"
@@ -958,18 +1899,18 @@ def dataframe_fixer(df):
     df.at[541, 'q8a5'] = "kucherov"
     # Hank F didn't name specific goalies and instead named "tb g" and "nyr g"
     # I think this is cheating and wouldn't give credit, but I'll be kind until Sean tells me different
-    print("Hank F, I fixed your entry")
+    logger.debug("Hank F, I fixed your entry")
     minor_surgery_count += 1
-    print("INTERPRETATION WARNING: Hank listed goalies 'tb g' and 'nyr g', I think this is cheating")
-    print("But I'm generously interpreting these as 'vasilevskiy' and 'shesterkin' unless Sean says otherwise")
+    contest_warning("INTERPRETATION", "INTERPRETATION WARNING: Hank listed goalies 'tb g' and 'nyr g', I think this is cheating\n"
+                    "But I'm generously interpreting these as 'vasilevskiy' and 'shesterkin' unless Sean says otherwise", author="Hank F")
     df.at[556, 'q5a1'] = "vasilevskiy"
     df.at[556, 'q5a2'] = "shesterkin"
     # Samuel T insisted on using numerous different types of ' & " on brind'amour
-    print("Samuel T, I fixed your entry")
+    logger.debug("Samuel T, I fixed your entry")
     minor_surgery_count += 1
     df.at[569, 'q3a2'] = "brind'amour"
     # Brendan G mixed up questions 6 and 7, I'll fix it
-    print("Brendan G, I fixed your entry")
+    logger.debug("Brendan G, I fixed your entry")
     minor_surgery_count += 1
     df.at[604, 'q6a1'] = "caufield"
     df.at[604, 'q6a2'] = "zegras"
@@ -982,24 +1923,24 @@ def dataframe_fixer(df):
     df.at[604, 'q7a4'] = "hamilton"
     df.at[604, 'q7a5'] = "fox"
     # Matt S dropped an extra period into one of his answers
-    print("Matt S, I fixed your entry")
+    logger.debug("Matt S, I fixed your entry")
     minor_surgery_count += 1
     df.at[610, 'q2a2'] = "ott"
     df.at[610, 'q2a5'] = "ana"
     # Ryan M included commentary on his pick of Ron Francis
-    print("Ryan M, I fixed your entry")
+    logger.debug("Ryan M, I fixed your entry")
     minor_surgery_count += 1
     df.at[615, 'q4a2'] = "francis"
     df.at[615, 'q4a3'] = "brisebois"
     # Erin H selected "richelieu" to be traded
     # There is no richelieu on hockey reference or on elite prospects
     # I'm going to be kind and interpret this as rickard rakell, cause I can't think of anything else
-    print("Erin H, I fixed your entry")
+    logger.debug("Erin H, I fixed your entry")
     minor_surgery_count += 1
-    print("INTERPRETATION WARNING: Entry specifies 'richelieu' to get traded, this is interpreted as rakell")
+    contest_warning("INTERPRETATION", "INTERPRETATION WARNING: Entry specifies 'richelieu' to get traded, this is interpreted as rakell", author="Erin H")
     df.at[619, 'q9a1'] = "rakell"
     # Joseph B skipped a comma when picking both doug and bill armstrong
-    print("Joseph B, I fixed your entry")
+    logger.debug("Joseph B, I fixed your entry")
     minor_surgery_count += 1
     df.at[621, 'q4a1'] = "d armstrong"
     df.at[621, 'q4a2'] = "b armstrong"
@@ -1007,12 +1948,12 @@ def dataframe_fixer(df):
     # There are four active Smiths, I've been interpreting these as the more popular one, in this case r smith
     # I initially thought Mike Smith would be the one people thought would get traded (and assumed this meant Mike)
     # But it seems that Reilly Smith is a somewhat popular pick to get traded, so that's the call here
-    print("Jonathan M, I fixed your entry")
+    logger.debug("Jonathan M, I fixed your entry")
     minor_surgery_count += 1
-    print("INTERPRETATION WARNING: Entry specifies 'smith' to get traded, this is interpreted as r smith")
+    contest_warning("INTERPRETATION", "INTERPRETATION WARNING: Entry specifies 'smith' to get traded, this is interpreted as r smith", author="Jonathan M")
     df.at[623, 'q9a5'] = "r smith"
     # John F left a prompt ("playoffs:") in one question
-    print("John F, I fixed your entry")
+    logger.debug("John F, I fixed your entry")
     minor_surgery_count += 1
     df.at[698, 'q5a1'] = "hellebuyck"
     df.at[698, 'q5a2'] = "vasilevskiy"
@@ -1020,82 +1961,82 @@ def dataframe_fixer(df):
     df.at[698, 'q5a4'] = np.nan
     df.at[698, 'q5a5'] = np.nan
     # Michael R included commentary on his pick
-    print("Michael R, I fixed your entry")
+    logger.debug("Michael R, I fixed your entry")
     minor_surgery_count += 1
     df.at[700, 'q9a3'] = "hart"
     # Anthony B dropped a period into one of his answers
-    print("Anthony B, I fixed your entry")
+    logger.debug("Anthony B, I fixed your entry")
     minor_surgery_count += 1
     df.at[701, 'q2a3'] = "det"
     df.at[701, 'q2a5'] = "ari"
     # Ray M included commentary on one answer
-    print("Ray M, I fixed your entry")
+    logger.debug("Ray M, I fixed your entry")
     minor_surgery_count += 1
     df.at[706, 'q6a3'] = "tomasino"
     df.at[706, 'q6a4'] = np.nan
     # David R accidentally dropped in a space on answer 2 that didn't play nice
-    print("David R, I fixed your entry")
+    logger.debug("David R, I fixed your entry")
     minor_surgery_count += 1
     df.at[715, 'q2a1'] = "det"
     # Joe C didn't enter anything for Q9
-    print("Joe C, I fixed your entry")
+    logger.debug("Joe C, I fixed your entry")
     minor_surgery_count += 1
     df.at[735, 'q9a1'] = np.nan
     # Jérémie R included an extra comma
-    print("Jérémie R, I fixed your entry")
+    logger.debug("Jérémie R, I fixed your entry")
     minor_surgery_count += 1
     df.at[766, 'q8a4'] = "kucherov"
     df.at[766, 'q8a5'] = np.nan
     # Kevin C had some lines starting with a ' '
-    print("Kevin C, I fixed your entry")
+    logger.debug("Kevin C, I fixed your entry")
     minor_surgery_count += 1
     df.at[771, 'q5a1'] = 'hellebuyck'
     df.at[771, 'q6a1'] = 'caufield'
     # Uziel S had an explanation of picking ron francis
-    print("Uziel S, I fixed your entry")
+    logger.debug("Uziel S, I fixed your entry")
     minor_surgery_count += 1
     df.at[798, 'q4a1'] = "francis"
     # Kyle B forgot a comma
-    print("Kyle B, I fixed your entry")
+    logger.debug("Kyle B, I fixed your entry")
     minor_surgery_count += 1
     df.at[802, 'q9a3'] = "ekholm"
     df.at[802, 'q9a5'] = "kessel"
     # Johnny M dropped an extra space in an answer
-    print("Johnny M, I fixed your entry")
+    logger.debug("Johnny M, I fixed your entry")
     minor_surgery_count += 1
     df.at[820, 'q8a1'] = "mcdavid"
     # Cal R forgot a comma
-    print("Cal R, I fixed your entry")
+    logger.debug("Cal R, I fixed your entry")
     minor_surgery_count += 1
     df.at[859, 'q9a1'] = "forsberg"
     df.at[859, 'q9a3'] = "domi"
     # Jeffrey C. used a period instead of a comma once
-    print("Jeffrey C, I fixed your entry")
+    logger.debug("Jeffrey C, I fixed your entry")
     minor_surgery_count += 1
     df.at[860, "q1a4"] = "edm"
     df.at[860, "q1a5"] = "tbl"
     # Sean Shapiro entered commentary for Q9
-    print("Sean Shapiro, I fixed your entry")
+    logger.debug("Sean Shapiro, I fixed your entry")
     minor_surgery_count += 1
     df.at[897, 'q9a1'] = np.nan
     # Benjamin N forgot a comma
-    print("Benjamin N, I fixed your entry")
+    logger.debug("Benjamin N, I fixed your entry")
     minor_surgery_count += 1
     df.at[909, 'q7a4'] = "mcavoy"
     df.at[909, 'q7a5'] = "theodore"
     # C J. added commentary to a selection of Ron Francis
-    print("C J., I fixed your entry")
+    logger.debug("C J., I fixed your entry")
     minor_surgery_count += 1
     df.at[926, 'q4a4'] = "francis"
     df.at[926, 'q4a5'] = "d armstrong"
     # Hai T selected "pitlick" as a player to be traded
     # There are two active Pitlicks, I've been interpreting these as the more popular one, in this case t pitlick
-    print("Hai T, I fixed your entry")
+    logger.debug("Hai T, I fixed your entry")
     minor_surgery_count += 1
-    print("INTERPRETATION WARNING: Entry specifies 'pitlick' to get traded, this is interpreted as t pitlick")
+    contest_warning("INTERPRETATION", "INTERPRETATION WARNING: Entry specifies 'pitlick' to get traded, this is interpreted as t pitlick", author="Hai T")
     df.at[931, 'q9a5'] = "t pitlick"
     # Matthew F forgot some commas throughout several answers
-    print("Matthew F, I fixed your entry")
+    logger.debug("Matthew F, I fixed your entry")
     minor_surgery_count += 1
     df.at[936, 'q7a1'] = "hedman"
     df.at[936, 'q7a2'] = "josi"
@@ -1109,54 +2050,54 @@ def dataframe_fixer(df):
     df.at[936, 'q9a2'] = "kessel"
     df.at[936, 'q9a3'] = "rakell"
     # Kevin S entered commentary for Q9 & Q10
-    print("Kevin S, I fixed your entry")
+    logger.debug("Kevin S, I fixed your entry")
     minor_surgery_count += 1
     df.at[942, 'q9a1'] = np.nan
     df.at[942, 'q10a1'] = np.nan
     # Logan F skipped Question 9 entirely, so #10 became #9 when read by the script
-    print("Logan F, I fixed your entry")
+    logger.debug("Logan F, I fixed your entry")
     minor_surgery_count += 1
     df.at[947, 'q9a1'] = np.nan
     df.at[947, 'q10a1'] = "draisaitl"
     # Ryan M used accents or dashes that my filtering didn't recognize for Fleury
-    print("Ryan M, I fixed your entry")
+    logger.debug("Ryan M, I fixed your entry")
     minor_surgery_count += 1
     df.at[954, 'q5a2'] = "kuemper"
     df.at[954, 'q5a5'] = np.nan
     # Matt H forgot a comma
-    print("Matt H, I fixed your entry")
+    logger.debug("Matt H, I fixed your entry")
     minor_surgery_count += 1
     df.at[980, 'q5a1'] = "hellebuyck"
     df.at[980, 'q5a5'] = "vasilevskiy"
     # Daniel F dropped an extra period in an answer
-    print("Daniel F, I fixed your entry")
+    logger.debug("Daniel F, I fixed your entry")
     minor_surgery_count += 1
     df.at[993, 'q5a4'] = "saros"
     df.at[993, 'q5a5'] = "fleury"
     # Andrew R included commentary amongst answers
-    print("Andrew R, I fixed your entry")
+    logger.debug("Andrew R, I fixed your entry")
     minor_surgery_count += 1
     df.at[1012, 'q6a2'] = "seider"
     df.at[1012, 'q9a4'] = "stepan"
     df.at[1012, 'q9a5'] = np.nan
     # Kevin L forgot a comma in one of his answers
-    print("Kevin L, I fixed your entry")
+    logger.debug("Kevin L, I fixed your entry")
     minor_surgery_count += 1
     df.at[1029, 'q4a2'] = "yzerman"
     df.at[1029, 'q4a5'] = "blake"
     # Ryan L forgot a comma
-    print("Ryan L, I fixed your entry")
+    logger.debug("Ryan L, I fixed your entry")
     minor_surgery_count += 1
     df.at[1035, 'q6a4'] = "seider"
     df.at[1035, 'q6a5'] = "podkolzin"
     # Glenn I selected "miller" as a player to be traded
     # There are two active Millers, I've been interpreting these as the more popular one, in this case colin miller
-    print("Glenn I, I fixed your entry")
+    logger.debug("Glenn I, I fixed your entry")
     minor_surgery_count += 1
-    print("INTERPRETATION WARNING: Entry specifies 'miller' to get traded, this is interpreted as c miller")
+    contest_warning("INTERPRETATION", "INTERPRETATION WARNING: Entry specifies 'miller' to get traded, this is interpreted as c miller", author="Glenn I")
     df.at[1075, 'q9a4'] = "c miller"
     # ALEXANDER W included some extra periods, made some commentary, etc.
-    print("ALEXANDER W, I fixed your entry")
+    logger.debug("ALEXANDER W, I fixed your entry")
     minor_surgery_count += 1
     df.at[1080, 'q4a1'] = "guerin"
     df.at[1080, 'q4a2'] = "sakic"
@@ -1168,16 +2109,16 @@ def dataframe_fixer(df):
     df.at[1080, 'q6a4'] = np.nan
     df.at[1080, 'q6a5'] = np.nan
     # David S included some extra periods in answers
-    print("David S, I fixed your entry")
+    logger.debug("David S, I fixed your entry")
     minor_surgery_count += 1
     df.at[1087, 'q5a1'] = "hellebuyck"
     # Joe M forgot a comma in an answer
-    print("Joe M, I fixed your entry")
+    logger.debug("Joe M, I fixed your entry")
     minor_surgery_count += 1
     df.at[1092, 'q4a3'] = "guerin"
     df.at[1092, 'q4a5'] = "sakic"
     # Neil W. tagged each line with how many answers he was giving ("(5)", etc.)
-    print("Neil W, I fixed your entry")
+    logger.debug("Neil W, I fixed your entry")
     minor_surgery_count += 1
     df.at[1102, "q1a1"] = "col"
     df.at[1102, "q2a1"] = "buf"
@@ -1190,30 +2131,30 @@ def dataframe_fixer(df):
     df.at[1102, "q9a1"] = "eichel"
     df.at[1102, "q10a1"] = "marner"
     # Jason Z dropped an extra period in an answer, generated a blank answer
-    print("Jason Z, I fixed your entry")
+    logger.debug("Jason Z, I fixed your entry")
     minor_surgery_count += 1
     df.at[1137, 'q6a4'] = np.nan
     # Bret L didn't enter anything for Q9
-    print("Bret L, I fixed your entry")
+    logger.debug("Bret L, I fixed your entry")
     minor_surgery_count += 1
     df.at[1142, 'q9a1'] = np.nan
     # John G accidentally used a period instead of a comma
-    print("John G, I fixed your entry")
+    logger.debug("John G, I fixed your entry")
     minor_surgery_count += 1
     df.at[1143, 'q7a3'] = "theodore"
     df.at[1143, 'q7a4'] = "fox"
     # Jared M didn't enter anything for Q9
-    print("Jared M, I fixed your entry")
+    logger.debug("Jared M, I fixed your entry")
     minor_surgery_count += 1
     df.at[1147, 'q9a1'] = np.nan
     # Bobby B selected "staal" as a player to be traded
     # There are quite famously 3 Staals, I've been interpreting these as the more popular one, in this case m staal
-    print("Bobby B, I fixed your entry")
+    logger.debug("Bobby B, I fixed your entry")
     minor_surgery_count += 1
-    print("INTERPRETATION WARNING: Entry specifies 'staal' to get traded, this is interpreted as m staal")
+    contest_warning("INTERPRETATION", "INTERPRETATION WARNING: Entry specifies 'staal' to get traded, this is interpreted as m staal", author="Bobby B")
     df.at[1158, 'q9a2'] = "m staal"
     # Anthony T. tagged each line with a prompt ("playoffs:", etc.)
-    print("Anthony T, I fixed your entry")
+    logger.debug("Anthony T, I fixed your entry")
     minor_surgery_count += 1
     df.at[1179, "q1a1"] = "col"
     df.at[1179, "q2a1"] = "det"
@@ -1226,11 +2167,11 @@ def dataframe_fixer(df):
     df.at[1179, "q9a1"] = "eichel"
     df.at[1179, "q10a1"] = "draisaitl"
     # Sean B accidentally dropped an extra comma in Q9
-    print("Sean B, I fixed your entry")
+    logger.debug("Sean B, I fixed your entry")
     minor_surgery_count += 1
     df.at[1212, 'q9a4'] = "leddy"
     # James B. tagged each line with a prompt ("playoffs:", etc.) and did so inconsistently
-    print("James B, I fixed your entry")
+    logger.debug("James B, I fixed your entry")
     minor_surgery_count += 1
     df.at[1228, "q1a1"] = "car"
     df.at[1228, "q2a1"] = "cbj"
@@ -1245,72 +2186,72 @@ def dataframe_fixer(df):
     df.at[1228, "q9a1"] = "hertl"
     df.at[1228, "q10a1"] = np.nan
     # Peter G forgot a comma
-    print("Peter G, I fixed your entry")
+    logger.debug("Peter G, I fixed your entry")
     minor_surgery_count += 1
     df.at[1241, 'q8a4'] = "marchand"
     df.at[1241, 'q8a5'] = "draisaitl"
     # Connor N put a space in before numbering
-    print("Connor N, I fixed your entry")
+    logger.debug("Connor N, I fixed your entry")
     minor_surgery_count += 1
     df.at[1246, 'q8a1'] = "mcdavid"
     # Chris S forgot a comma
-    print("Chris S, I fixed your entry")
+    logger.debug("Chris S, I fixed your entry")
     minor_surgery_count += 1
     df.at[1247, 'q7a4'] = "slavin"
     df.at[1247, 'q7a5'] = "josi"
     # Bryan l included commentary in one of his answers
-    print("Bryan L, I fixed your entry")
+    logger.debug("Bryan L, I fixed your entry")
     minor_surgery_count += 1
     df.at[1257, 'q6a4'] = np.nan
     # Samantha P used a '-' in brind'amour, which split it into two answers
-    print("Samantha P, I fixed your entry")
+    logger.debug("Samantha P, I fixed your entry")
     minor_surgery_count += 1
     df.at[1278, 'q3a2'] = "brind'amour"
     df.at[1278, 'q3a3'] = "smith"
     # Matt B skipped Question 9 entirely, so #10 became #9 when read by the script
-    print("Matt B, I fixed your entry")
+    logger.debug("Matt B, I fixed your entry")
     minor_surgery_count += 1
     df.at[1282, 'q9a1'] = np.nan
     df.at[1282, 'q10a1'] = "kucherov"
     # Morgan J left multiple questions blank
-    print("Morgan J, I fixed your entry")
+    logger.debug("Morgan J, I fixed your entry")
     minor_surgery_count += 1
     df.at[1295, 'q5a1'] = np.nan
     df.at[1295, 'q6a1'] = np.nan
     # Clint R dropped an extra period in an answer
-    print("Clint R, I fixed your entry")
+    logger.debug("Clint R, I fixed your entry")
     minor_surgery_count += 1
     df.at[1296, 'q8a5'] = np.nan
     # Cam P forgot a comma, two of his answers got combined
-    print("Cam P, I fixed your entry")
+    logger.debug("Cam P, I fixed your entry")
     df.at[1322, 'q3a2'] = "cooper"
     df.at[1322, 'q3a5'] = "keefe"
     # Suraj D dropped an extra period into one of his answers
-    print("Suraj D, I fixed your entry")
+    logger.debug("Suraj D, I fixed your entry")
     minor_surgery_count += 1
     df.at[1324, 'q3a3'] = "bednar"
     df.at[1324, 'q3a5'] = "cooper"
     # Jon H used a '-' in brind'amour, which split it into two answers
-    print("Jon H, I fixed your entry")
+    logger.debug("Jon H, I fixed your entry")
     minor_surgery_count += 1
     df.at[1338, 'q3a2'] = "brind'amour"
     df.at[1338, 'q3a3'] = "maurice"
     # Will B left a question empty
-    print("Will B, I fixed your entry")
+    logger.debug("Will B, I fixed your entry")
     minor_surgery_count += 1
     df.at[1353, 'q6a1'] = np.nan
     df.at[1353, 'q10a1'] = np.nan
     # David S used a '-' in brind'amour, which split it into two answers
-    print("David S, I fixed your entry")
+    logger.debug("David S, I fixed your entry")
     minor_surgery_count += 1
     df.at[1374, 'q3a2'] = "brind'amour"
     df.at[1374, 'q3a3'] = "smith"
     # Brian H didn't enter anything for Q9
-    print("Brian H, I fixed your entry")
+    logger.debug("Brian H, I fixed your entry")
     minor_surgery_count += 1
     df.at[1378, 'q9a1'] = np.nan
     # A.J. M. tagged each line with a prompt ("playoffs:", etc., along with some extra notes)
-    print("A. J. M., I fixed your entry")
+    logger.debug("A. J. M., I fixed your entry")
     minor_surgery_count += 1
     df.at[1381, "q1a1"] = "tbl"
     df.at[1381, "q2a1"] = "ari"
@@ -1326,16 +2267,16 @@ def dataframe_fixer(df):
     df.at[1381, "q9a1"] = "kessel"
     df.at[1381, "q10a1"] = "draisaitl"
     # Tony M dropped an extra comma in an answer
-    print("Tony M, I fixed your entry")
+    logger.debug("Tony M, I fixed your entry")
     minor_surgery_count += 1
     df.at[1382, 'q5a5'] = "saros"
     # Sandy K forgot a comma and got teams merged together as a result
-    print("Sandy K, I fixed your entry")
+    logger.debug("Sandy K, I fixed your entry")
     minor_surgery_count += 1
     df.at[1383, "q1a2"] = "col"
     df.at[1383, "q1a5"] = "tor"
     # James B. tagged each line with a prompt ("playoffs:", etc.)
-    print("James B, I fixed your entry")
+    logger.debug("James B, I fixed your entry")
     minor_surgery_count += 1
     df.at[1406, "q1a1"] = "col"
     df.at[1406, "q2a1"] = "cbj"
@@ -1348,30 +2289,30 @@ def dataframe_fixer(df):
     df.at[1406, "q9a1"] = "eichel"
     df.at[1406, "q10a1"] = "draisaitl"
     # Pete D dropped an extra comma in his answers
-    print("Pete D, I fixed your entry")
+    logger.debug("Pete D, I fixed your entry")
     minor_surgery_count += 1
     df.at[1445, 'q3a4'] = "brind'amour"
     # Pat E forgot a comma between two answers
-    print("Pat E, I fixed your entry")
+    logger.debug("Pat E, I fixed your entry")
     minor_surgery_count += 1
     df.at[1452, "q1a1"] = "tor"
     df.at[1452, "q1a5"] = "col"
     # Josh M dropped a period into one of his answers
-    print("Josh M, I fixed your entry")
+    logger.debug("Josh M, I fixed your entry")
     minor_surgery_count += 1
     df.at[1457, 'q2a3'] = "buf"
     df.at[1457, 'q2a5'] = "cbj"
     # Mike V included an explanation of his picking ron francis
-    print("Mike V, I fixed your entry")
+    logger.debug("Mike V, I fixed your entry")
     minor_surgery_count += 1
     df.at[1414, 'q4a5'] = "francis"
     # Dylan J dropped an extra comma into one of his answers
-    print("Dylan J, I fixed your entry")
+    logger.debug("Dylan J, I fixed your entry")
     minor_surgery_count += 1
     df.at[1501, 'q4a3'] = "mccrimmon"
     df.at[1501, 'q4a4'] = "sweeney"
     # Peter E had no spaces or ".", ")", etc. after his numbering, cutting off the first letter of each set of answers
-    print("Peter E, I fixed your entry")
+    logger.debug("Peter E, I fixed your entry")
     minor_surgery_count += 1
     df.at[1520, 'q1a1'] = "tbl"
     df.at[1520, 'q2a1'] = "van"
@@ -1384,3823 +2325,1263 @@ def dataframe_fixer(df):
     df.at[1520, 'q9a1'] = "kessel"
     df.at[1520, 'q10a1'] = np.nan
     # David S used an emoji that I dont think will work in my dictionaries
-    print("David S, I fixed your entry")
+    logger.debug("David S, I fixed your entry")
     minor_surgery_count += 1
     df.at[1524, 'q10a1'] = "draisaitl"
     # Faizal S dropped an extra period in one of his answers
-    print("Faizal S, I fixed your entry")
+    logger.debug("Faizal S, I fixed your entry")
     minor_surgery_count += 1
     df.at[1525, 'q2a1'] = "buf"
     # Steve M led some lines with spaces
-    print("Steve M, I fixed your entry")
+    logger.debug("Steve M, I fixed your entry")
     minor_surgery_count += 1
     df.at[1526, 'q5a1'] = "hellebuyck"
     # Ian B chose "kuemper" among his norris selections
     # The only active "kuemper" in the league is Darcy Kuemper
     # This doesnt appear to be a mistake of swapping answers - Ian correctly put goalies (3 of them) in question 5,
     # Rookies in 6 (1 of them), and defense in 7 (3, including Kuemper). I'll put it in 5 for him.
-    print("Ian B, I fixed your entry")
+    logger.debug("Ian B, I fixed your entry")
     minor_surgery_count += 1
     df.at[1532, 'q5a4'] = "kuemper"
     df.at[1532, 'q7a3'] = np.nan
     # Joel C dropped some extra periods in answers
-    print("Joel C, I fixed your entry")
+    logger.debug("Joel C, I fixed your entry")
     minor_surgery_count += 1
     df.at[1541, 'q6a1'] = "caufield"
     df.at[1541, 'q7a1'] = "hedman"
     # Bryce C forgot a comma in one of his answers
-    print("Bryce C, I fixed your entry")
+    logger.debug("Bryce C, I fixed your entry")
     minor_surgery_count += 1
     df.at[1542, 'q3a2'] = "quenneville"
     df.at[1542, 'q3a5'] = "cooper"
     # Marc B included an explanation of his picking ron francis
-    print("Marc B, I fixed your entry")
+    logger.debug("Marc B, I fixed your entry")
     minor_surgery_count += 1
     df.at[1580, 'q4a5'] = "francis"
     # Jon C wrote a very long explanation of his picks, which was long enough and used
     # enough puncuation to be picked up as a very bad entry to the contest. His reply
     # is deleted after all repairs are made via indexing.
     minor_surgery_count += 1
-    print("Dropping index 849 - is not an entry, is an explanation of Jon C's entry")
+    logger.debug("Dropping index 849 - is not an entry, is an explanation of Jon C's entry")
     df.drop(849, axis=0, inplace=True)
     # Kevin A submitted his entry twice, then replied to one of his entries to make an amended entry
     # Because he forgot to enter anyone for Q9. Deleting his two prior entries.
     minor_surgery_count += 1
-    print("Dropping outdated entry from Kevin A")
+    logger.debug("Dropping outdated entry from Kevin A")
     df.drop(1223, axis=0, inplace=True)
     minor_surgery_count += 1
-    print("Dropping another outdated entry from Kevin A")
+    logger.debug("Dropping another outdated entry from Kevin A")
     df.drop(1281, axis=0, inplace=True)
+    df.index = comment_ids[df.index]
     return df, minor_surgery_count
 
 
-def standardization_operations(df, authors):
+def entry_key(author, comment):
+    """ Returns a key for an entry that doesn't depend on where it was
+    scraped from on the page: the author (without the " entry # index" that
+    entry_scraper adds to repeat commenters) and a hash of the comment as it
+    was scraped. Used to find entries in the fix ledger.
+    """
+    return (DUPLICATE_AUTHOR_SUFFIX.sub("", author),
+            hashlib.sha256(comment.encode('utf8')).hexdigest()[:16])
+
+
+def entry_positions(entry_keys):
+    """ Returns a dictionary of where each entry is, keyed by its entry_key
+    plus which occurrence of that key it is (0 for the first, 1 for the
+    second, etc.), since the same person can post the same entry twice.
+    Fixes in the fix ledger carry the same "occurrence" (see ledger_position).
+    """
+    seen = Counter()
+    positions = {}
+    for i, key in enumerate(entry_keys):
+        positions[(*key, seen[key])] = i
+        seen[key] += 1
+    return positions
+
+
+def ledger_position(positions, fix):
+    """ Returns where the entry a fix in the fix ledger belongs to is (see
+    entry_positions), or None if it can't be found. A fix without an
+    "occurrence" (e.g. added by hand) only matches if exactly one entry has
+    its author and comment hash; if several do, there's no telling which
+    one it was meant for, so it's treated as not found.
+    """
+    key = (fix["author"], fix["comment_hash"])
+    if "occurrence" in fix:
+        return positions.get((*key, fix["occurrence"]))
+    if (*key, 1) in positions:
+        return None
+    return positions.get((*key, 0))
+
+
+def ledger_value(value):
+    """ Turns NaN into None for saving in the fix ledger, and back again."""
+    if value is None:
+        return np.nan
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+
+def build_fix_ledger(authors, comments, ledger_path=FIX_LEDGER_PATH):
+    """ Builds the fix ledger from comment_fixer and dataframe_fixer, so the
+    hand fixes stop depending on positional indexes. Given the authors and
+    comments straight from entry_scraper, this runs both fixers (quietly),
+    compares what went in to what came out, and writes every difference to
+    a .json file keyed by entry_key, along with which "occurrence" of that
+    key it is (so fixes to an entry posted twice go to the right copy):
+        - "comment_fixes": comments that were rewritten, and their new text
+        - "added_entries": entries that were added (Matt B's dad)
+        - "cell_fixes": answers that dataframe_fixer changed, along with the
+          answer they replaced, so a fix that no longer applies shows up
+        - "dropped_entries": entries that dataframe_fixer dropped
+    Every fix also has "warnings", the INTERPRETATION warnings the fixers
+    gave about that entry (matched up by author, and kept on the first fix
+    for them), which are logged again whenever the fix is applied. Any
+    warning whose author doesn't have a fix is kept in "comment_warnings"
+    or "dataframe_warnings" instead, and logged every time. The major and
+    minor surgery counts the fixers gave are kept in "surgery_counts", so
+    the ledger reports the same counts as the fixers.
+    Returns the ledger. This only has to be run once, against the same page
+    the fixers were written for; after that, the ledger can be edited by
+    hand and the fixers left alone.
+    """
+    entry_keys = [entry_key(author, comment) for author, comment in zip(authors, comments)]
+    with collected_warnings() as comment_warnings:
+        major_surgery_count, fixed_authors, fixed_comments = comment_fixer(list(authors), list(comments))
+    with collected_warnings():
+        df = generate_dataframe(fixed_authors, fixed_comments)
+    with collected_warnings() as dataframe_warnings:
+        fixed_df, minor_surgery_count = dataframe_fixer(df.copy())
+    ledger = {"comment_fixes": [], "added_entries": [], "cell_fixes": [], "dropped_entries": []}
+    entry_keys += [entry_key(author, comment)
+                   for author, comment in zip(fixed_authors[len(comments):], fixed_comments[len(comments):])]
+    # Each entry's key, with which occurrence of that key it is on the end
+    occurrence_keys = {i: key for key, i in entry_positions(entry_keys).items()}
+    for i, (author, comment) in enumerate(zip(fixed_authors, fixed_comments)):
+        if i >= len(comments):
+            ledger["added_entries"].append({"author": author, "comment": comment, "warnings": []})
+        elif comment != comments[i]:
+            author, comment_hash, occurrence = occurrence_keys[i]
+            ledger["comment_fixes"].append({"author": author, "comment_hash": comment_hash,
+                                            "occurrence": occurrence, "comment": comment, "warnings": []})
+    for i in df.index:
+        author, comment_hash, occurrence = occurrence_keys[i]
+        if i not in fixed_df.index:
+            ledger["dropped_entries"].append({"author": author, "comment_hash": comment_hash,
+                                              "occurrence": occurrence, "warnings": []})
+            continue
+        for column in df.columns:
+            old, new = df.at[i, column], fixed_df.at[i, column]
+            if not same_answer(old, new):
+                ledger["cell_fixes"].append({"author": author, "comment_hash": comment_hash,
+                                             "occurrence": occurrence, "column": column,
+                                             "old": ledger_value(old), "new": ledger_value(new),
+                                             "warnings": []})
+    ledger["comment_warnings"] = attach_warnings(
+        comment_warnings, ledger["comment_fixes"] + ledger["added_entries"])
+    ledger["dataframe_warnings"] = attach_warnings(
+        dataframe_warnings, ledger["cell_fixes"] + ledger["dropped_entries"])
+    ledger["surgery_counts"] = {"major": major_surgery_count, "minor": minor_surgery_count}
+    with open(ledger_path, 'w', encoding='utf8') as ledger_file:
+        json.dump(ledger, ledger_file, indent=1, ensure_ascii=False)
+    fix_count = sum(len(ledger[section]) for section in
+                    ("comment_fixes", "added_entries", "cell_fixes", "dropped_entries"))
+    logger.info(f"Wrote {fix_count} fixes to {ledger_path}")
+    return ledger
+
+
+def attach_warnings(warnings, fixes):
+    """ Puts each warning (from a WarningsCollector) on the first of the
+    fixes for the same author, for build_fix_ledger. Returns the warnings
+    that no fix's author matched.
+    """
+    first_fixes = {}
+    for fix in fixes:
+        first_fixes.setdefault(DUPLICATE_AUTHOR_SUFFIX.sub("", fix["author"]), fix)
+    unattached = []
+    for warning in warnings:
+        fix = first_fixes.get(DUPLICATE_AUTHOR_SUFFIX.sub("", str(warning.get("author", ""))))
+        if fix is None:
+            unattached.append(warning)
+        else:
+            fix["warnings"].append(warning)
+    return unattached
+
+
+def same_answer(first, second):
+    """ Checks whether two answers are the same, counting two blanks (NaN)
+    as the same answer.
+    """
+    if pd.isna(first) or pd.isna(second):
+        return pd.isna(first) and pd.isna(second)
+    return first == second
+
+
+def load_fix_ledger(ledger_path=FIX_LEDGER_PATH):
+    """ Reads a fix ledger written by build_fix_ledger."""
+    with open(ledger_path, 'r', encoding='utf8') as ledger_file:
+        ledger = json.load(ledger_file)
+    for fix in ledger.get("cell_fixes", []):
+        fix["old"] = ledger_value(fix["old"])
+        fix["new"] = ledger_value(fix["new"])
+    return ledger
+
+
+def apply_comment_ledger(authors, comments, ledger):
+    """ Does comment_fixer's job from the fix ledger: rewrites each comment
+    that has a comment fix, and adds the added entries on the end. Fixes are
+    found by entry_key (see ledger_position), so they still land on the
+    right comment if the page is scraped in a different order. Any comment
+    fix whose comment can't be found (because it was deleted or edited
+    since, or it could be more than one comment) is skipped and reported.
+    The warnings kept with each fix that's applied are logged again (see
+    build_fix_ledger). Returns the "major surgery" count (the same count
+    comment_fixer gave, as long as every fix could be applied, otherwise
+    the count of comments fixed and added), the authors and comments, the
+    entry_key of every entry (for apply_dataframe_ledger), and the list of
+    fixes that couldn't be applied.
+    """
+    logger.info("Applying the fix ledger to the comments...")
+    entry_keys = [entry_key(author, comment) for author, comment in zip(authors, comments)]
+    positions = entry_positions(entry_keys)
+    stale_fixes = []
+    major_surgery_count = 0
+    for fix in ledger.get("comment_fixes", []):
+        i = ledger_position(positions, fix)
+        if i is None:
+            stale_fixes.append(fix)
+            logger.warning(f"STALE FIX: no comment (or more than one) from {fix['author']} matches {fix['comment_hash']}, skipping it")
+            continue
+        replay_warnings(fix.get("warnings", []))
+        comments[i] = fix["comment"]
+        major_surgery_count += 1
+    for entry in ledger.get("added_entries", []):
+        replay_warnings(entry.get("warnings", []))
+        authors.append(entry["author"])
+        comments.append(entry["comment"])
+        entry_keys.append(entry_key(entry["author"], entry["comment"]))
+        major_surgery_count += 1
+    replay_warnings(ledger.get("comment_warnings", []))
+    major_surgery_count = ledger_surgery_count(ledger, "major", major_surgery_count, stale_fixes)
+    logger.info(f"{major_surgery_count} comments had to be handled in this fashion.")
+    return major_surgery_count, authors, comments, entry_keys, stale_fixes
+
+
+def apply_dataframe_ledger(df, ledger, entry_keys):
+    """ Does dataframe_fixer's job from the fix ledger, given the entry_key
+    of every row (from apply_comment_ledger). All of the fixes for a column
+    are written in one go, rather than one cell at a time. A cell fix is
+    only applied if the cell still holds the answer it was written to
+    replace; any fix whose entry or answer doesn't match anymore is skipped
+    and reported. The warnings kept with each fix that's applied are logged
+    again (see build_fix_ledger). Returns the fixed dataframe, the "minor
+    surgery" count (the same count dataframe_fixer gave, as long as every
+    fix could be applied, otherwise the count of entries fixed or dropped),
+    and the list of fixes that couldn't be applied.
+    """
+    logger.info("Applying the fix ledger to the dataframe...")
+    positions = entry_positions(entry_keys)
+    stale_fixes = []
+    fixed_rows = set()
+    fixes_by_column = {}
+    for fix in ledger.get("cell_fixes", []):
+        i = ledger_position(positions, fix)
+        if i is None or not same_answer(df[fix["column"]].iat[i], fix["old"]):
+            stale_fixes.append(fix)
+            logger.warning(f"STALE FIX: {fix['author']}'s {fix['column']} isn't {fix['old']!r} anymore, skipping it")
+            continue
+        replay_warnings(fix.get("warnings", []))
+        rows, values = fixes_by_column.setdefault(fix["column"], ([], []))
+        rows.append(i)
+        values.append(fix["new"])
+        fixed_rows.add(i)
+    for column, (rows, values) in fixes_by_column.items():
+        column_values = df[column].to_numpy(dtype=object, copy=True)
+        column_values[rows] = values
+        df[column] = pd.Series(column_values, index=df.index, dtype=object)
+    dropped_rows = []
+    for fix in ledger.get("dropped_entries", []):
+        i = ledger_position(positions, fix)
+        if i is None:
+            stale_fixes.append(fix)
+            logger.warning(f"STALE FIX: no entry (or more than one) from {fix['author']} matches {fix['comment_hash']}, can't drop it")
+            continue
+        replay_warnings(fix.get("warnings", []))
+        dropped_rows.append(i)
+        fixed_rows.add(i)
+    df = df.drop(df.index[dropped_rows])
+    replay_warnings(ledger.get("dataframe_warnings", []))
+    minor_surgery_count = ledger_surgery_count(ledger, "minor", len(fixed_rows), stale_fixes)
+    logger.info(f"{minor_surgery_count} entries were fixed or dropped from the ledger.")
+    return df, minor_surgery_count, stale_fixes
+
+
+def ledger_surgery_count(ledger, surgery, applied_count, stale_fixes):
+    """ Returns the "major" or "minor" surgery count for a fix ledger: the
+    count the fixers gave when the ledger was built, if it has one and
+    every fix could be applied, so the report is the same either way.
+    Otherwise it's applied_count, how many entries the ledger fixed, which
+    can differ a little from the fixers' count (they counted each fix they
+    made, not each entry), and a note saying so is logged.
+    """
+    if not stale_fixes and surgery in ledger.get("surgery_counts", {}):
+        return ledger["surgery_counts"][surgery]
+    if "surgery_counts" in ledger:
+        logger.info(f"NOTE: Some fixes couldn't be applied, so the {surgery} surgery count is the number of entries fixed from the ledger ({applied_count}), not the {ledger['surgery_counts'][surgery]} the fixers counted")
+    return applied_count
+
+
+def compile_alias_table(*alias_dicts):
+    """ Given one or more alias dictionaries that would be applied to a
+    column one after another (e.g. city names, then team names), this
+    function merges them into a single dictionary that gives the same
+    result in one lookup. Any answer not in the merged dictionary is
+    already standard and stays as it is.
+    """
+    alias_table = {}
+    for alias_dict in alias_dicts:
+        for alias in alias_dict:
+            if alias in alias_table:
+                continue
+            standard = alias
+            # Follow the alias through each dictionary in turn, just like
+            # replacing with each dictionary one after another would
+            for lookup in alias_dicts:
+                if isinstance(standard, str) and standard in lookup:
+                    standard = lookup[standard]
+            alias_table[alias] = standard
+    return alias_table
+
+
+def standardize_question(df, columns, alias_table):
+    """ Standardizes all of the answer columns for one question at once.
+    The columns are stacked into a single array and factorized, so each
+    distinct answer is only looked up in the alias table one time, no
+    matter how many entries gave it. The standardized answers are then
+    put back into the dataframe in place. Blank (NaN) answers stay blank.
+    """
+    logger.debug(f"Standardizing the answers for columns {', '.join(columns)}...")
+    answers = df[columns].to_numpy(dtype=object)
+    codes, distinct_answers = pd.factorize(answers.ravel())
+    # Look up each distinct answer once. NaN is added on the end for
+    # blank answers, which factorize gives a code of -1
+    standardized = np.array([alias_table.get(x, x) for x in distinct_answers] + [np.nan],
+                            dtype=object)
+    df[columns] = pd.DataFrame(standardized[codes].reshape(answers.shape),
+                               index=df.index, columns=columns, dtype=object)
+    logger.debug("Done!")
+
+
+def resolve_ambiguous_aliases(df, columns, ambiguous_aliases):
+    """ Some answers could mean more than one person (e.g. "armstrong" or
+    "staal"). Given the answer columns for a question and a dictionary of
+    each ambiguous answer to the answer it should be read as, this function
+    finds every ambiguous answer in those columns at once and replaces it
+    in place. Each change is reported to the entrant with an interpretation
+    warning. Returns an array holding the author of each changed answer,
+    so the number of answers changed is its length.
+    """
+    answers = df[columns].to_numpy(dtype=object, copy=True)
+    is_ambiguous = df[columns].isin(list(ambiguous_aliases)).to_numpy()
+    # Go through the changed answers column by column, so warnings come out in column order
+    col_indexes, row_indexes = np.nonzero(is_ambiguous.T)
+    affected_authors = df['author'].to_numpy(dtype=object)[row_indexes]
+    for author, row_index, col_index in zip(affected_authors, row_indexes, col_indexes):
+        ambiguous_answer = answers[row_index, col_index]
+        resolved_answer = ambiguous_aliases[ambiguous_answer]
+        logger.debug(f"{author}, I fixed your entry")
+        contest_warning(
+            "INTERPRETATION",
+            f"INTERPRETATION WARNING: {author} listed '{ambiguous_answer}' in {columns[col_index]}. Interpreting this as '{resolved_answer}'",
+            author=author, column=columns[col_index], answer=ambiguous_answer, interpreted_as=resolved_answer)
+        answers[row_index, col_index] = resolved_answer
+    if len(affected_authors) > 0:
+        df[columns] = pd.DataFrame(answers, index=df.index, columns=columns, dtype=object)
+    return affected_authors
+
+
+def alias_tables_version(table_dir=ALIAS_TABLE_DIR):
+    """ Returns a short hash of every alias table file in table_dir,
+    along with QUESTION_ALIAS_TABLES. Any edit to a table (or to which
+    tables a question uses) gives a new version, so anything compiled
+    from an older version of the tables can be spotted and rebuilt.
+    """
+    digest = hashlib.sha256(repr(QUESTION_ALIAS_TABLES).encode('utf8'))
+    for file_name in sorted(os.listdir(table_dir)):
+        if not file_name.endswith(".csv"):
+            continue
+        digest.update(file_name.encode('utf8'))
+        with open(os.path.join(table_dir, file_name), 'rb') as table_file:
+            digest.update(table_file.read())
+    return digest.hexdigest()[:16]
+
+
+def read_alias_table(table_path):
+    """ Reads one alias table .csv file (with "alias", "standard" and "note"
+    columns) into a dictionary of alias to standard answer. A blank standard
+    answer means the alias isn't a real answer, and is read in as NaN.
+    """
+    alias_dict = {}
+    with open(table_path, 'r', encoding='utf8', newline='') as table_file:
+        for row in csv.DictReader(table_file):
+            alias_dict[row["alias"]] = row["standard"] if row["standard"] else np.nan
+    return alias_dict
+
+
+def load_alias_index(table_dir=ALIAS_TABLE_DIR):
+    """ Returns a dictionary with one compiled alias table per question (see
+    compile_alias_table), built from the .csv alias tables in table_dir.
+    The compiled index is saved to a cache file named after the version of
+    the tables (see alias_tables_version), so later runs load it straight
+    from the cache instead of reading and compiling every table again. If
+    any table changes, its version changes, and the index is rebuilt.
+    """
+    version = alias_tables_version(table_dir)
+    if version in LOADED_ALIAS_INDEXES:
+        return LOADED_ALIAS_INDEXES[version]
+    cache_dir = os.path.join(table_dir, ".cache")
+    cache_path = os.path.join(cache_dir, f"alias_index-{version}.pickle")
+    if os.path.exists(cache_path):
+        with open(cache_path, 'rb') as cache_file:
+            alias_index = pickle.load(cache_file)
+    else:
+        logger.info(f"Compiling alias tables (version {version})...")
+        alias_tables = {}
+        alias_index = {}
+        for question, table_names in QUESTION_ALIAS_TABLES.items():
+            for table_name in table_names:
+                if table_name not in alias_tables:
+                    alias_tables[table_name] = read_alias_table(
+                        os.path.join(table_dir, table_name + ".csv"))
+            alias_index[question] = compile_alias_table(
+                *[alias_tables[table_name] for table_name in table_names])
+        # Clear out compiled indexes from older versions of the tables, then save this one
+        os.makedirs(cache_dir, exist_ok=True)
+        for file_name in os.listdir(cache_dir):
+            if file_name.startswith("alias_index-"):
+                os.remove(os.path.join(cache_dir, file_name))
+        temp_path = cache_path + ".tmp"
+        with open(temp_path, 'wb') as cache_file:
+            pickle.dump(alias_index, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    LOADED_ALIAS_INDEXES[version] = alias_index
+    return alias_index
+
+
+def armstrong_check(df):
+    """ Runs the special 'armstrong' check for GMs over a dataframe whose
+    GM answers (question 4) have already been standardized, changing any
+    'armstrong' to 'd armstrong' in place (see AMBIGUOUS_ALIASES), with an
+    interpretation warning for each one.
+    """
+    q4 = QUESTION_COLUMNS["q4"]
+    logger.info("Running special 'armstrong' check for GM's. Many people entered 'armstrong' as an entry, but there are two armstrongs.")
+    logger.info("'d armstrong' of St Louis is eligible this year, but 'b armstrong' of Arizona is not.")
+    logger.info("In the entries I've had to fix so far, I've defaulted to giving people credit for 'd armstrong' based on his eligibility.")
+    logger.info("This will need to be clarified next year.")
+    armstrong_authors = resolve_ambiguous_aliases(df, q4, AMBIGUOUS_ALIASES["q4"])
+    logger.info(f"This check fixed {len(armstrong_authors)} entries.")
+    logger.info("This is in addition to some other entries with the same problem fixed previously in this script")
+
+
+def standardization_operations(df, resolve_ambiguous=True):
     """ In order to facilitate automatic grading of the
     contest entries, all answers in all entries must be
     standardized. In this way, "tbl" can be graded, instead
     of "Tampa Bay", "Lightning", "Tampa", etc. This function
     takes a dataframe and goes through each question, using
-    customized dictionaries to replace all answers with a 
+    customized alias tables to replace all answers with a 
     standardized answer. Returns a standardized dataframe.
 
-    2021-22 note: This function also takes a list of authors
-    for use during the special "armstrong" GM check. This 
-    MUST be modified for next year, when the second GM named
-    "armstrong" becomes a viable answer.
+    The alias tables live in the alias_tables folder, one .csv
+    file per table, and QUESTION_ALIAS_TABLES lists which tables
+    are used for each question. They're loaded with load_alias_index,
+    which caches the compiled tables on disk between runs.
 
-    Note that for future contests, these dictionaries can be
+    2021-22 note: After the GMs are standardized, the special
+    "armstrong" GM check is run (see armstrong_check), unless
+    resolve_ambiguous is False. This MUST be modified for next
+    year, when the second GM named "armstrong" becomes a viable
+    answer.
+
+    Note that for future contests, these tables can be
     a starting point, but will have to be very closely 
     checked to make sure they remain accurate.
     """
     # Start standardizing entries by replacing values with a standard value
-    # Dictionary to match team cities with three letter abbreviation
-    city_name_dict = {
-        "anaheim": "ana",
-        "arizona": "ari",
-        "phoenix": "ari",
-        "az": "ariz",
-        "boston": "bos",
-        "buffalo": "buf",
-        "carolina": "car",
-        "columbus": "cbj",
-        "cbus": "cbj",
-        "clb": "cbj",
-        "calgary": "cgy",
-        "chicago": "chi",
-        "colorado": "col",
-        "dallas": "dal",
-        "detroit": "det",
-        "edmonton": "edm",
-        "florida": "fla",
-        "los angeles": "lak",
-        "minnesota": "min",
-        "mn": "min",
-        "montreal": "mtl",
-        "new jersey": "njd",
-        "nj": "njd",
-        "nashville": "nsh",
-        "new york islanders": "nyi",
-        "ny islanders": "nyi",
-        "new york (islanders)": "nyi",
-        "nyislanders": "nyi",
-        "new york rangers": "nyr",
-        "new york (rangers)": "nyr",
-        "ny rangers": "nyr",
-        "ottawa": "ott",
-        "philadelphia": "phi",
-        "pittsburgh": "pit",
-        "san jose": "sjs",
-        "sj": "sjs",
-        "seattle": "sea",
-        "st louis": "stl",
-        "st. louis": "stl",
-        "tampa bay": "tbl",
-        "tampa": "tbl",
-        "toronto": "tor",
-        "vancouver": "van",
-        "las vegas": "veg",
-        "vegas": "veg",
-        "winnipeg": "wpg",
-        "washington": "wsh"
-    }
-    # Dictionary to match team names with three letter abbreviation
-    team_name_dict = {
-        "mighty ducks": "ana",
-        "ducks": "ana",
-        "coyotes": "ari",
-        "yotes": "ari",
-        "bruins": "bos",
-        "sabres": "buf",
-        "hurricanes": "car",
-        "canes": "car",
-        "'canes": "car",
-        "blue jackets": "cbj",
-        "jackets": "cbj",
-        "bjs": "cbj",
-        "flames": "cgy",
-        "blackhawks": "chi",
-        "black hawks": "chi",
-        "avalanche": "col",
-        "avs": "col",
-        "stars": "dal",
-        "red wings": "det",
-        "wings": "det",
-        "oilers": "edm",
-        "oil": "edm",
-        "panthers": "fla",
-        "kings": "lak",
-        "wild": "min",
-        "canadiens": "mtl",
-        "canadians": "mtl",
-        "devils": "njd",
-        "predators": "nsh",
-        "preds": "nsh",
-        "islanders": "nyi",
-        "isles": "nyi",
-        "rangers": "nyr",
-        "senators": "ott",
-        "sens": "ott",
-        "flyers": "phi",
-        "penguins": "pit",
-        "sharks": "sjs",
-        "kraken": "sea",
-        "blues": "stl",
-        "lightning": "tbl",
-        "bolts": "tbl",
-        "maple leafs": "tor",
-        "leafs": "tor",
-        "canucks": "van",
-        "golden knights": "veg",
-        "knights": "veg",
-        "jets": "wpg",
-        "capitals": "wsh",
-        "caps": "wsh"
-    }
-    teams_other_dict = {
-        "0": np.nan,
-        "anaheim ducks": "ana",
-        "annehiem": "ana",
-        "anahiem": "ana",
-        "anh": "ana",
-        "ani": "ana",
-        "ana ducks": "ana",
-        "arizona coyotes": "ari",
-        "az coyotes": "ari",
-        "phoenix coyotes": "ari",
-        "arz": "ari",
-        "ariz": "ari",
-        "'zona": "ari",
-        "arizona..": "ari",
-        "azc": "ari",
-        "phx": "ari",
-        "boston bruins": "bos",
-        "buffalo sabres": "buf",
-        "sabers": "buf",
-        "sabre's": "buf",
-        "sabre’s": "buf",
-        "bufallo sabres": "buf",
-        "sables": "buf",
-        "buff.": "buf",
-        "buff": "buf",
-        "buf sabres": "buf",
-        "carolina hurricanes": "car",
-        "columbus blue jackets": "cbj",
-        "clm": "cbj",
-        "colombus blue jackets": "cbj",
-        "colombus": "cbj",
-        "blue jax": "cbj",
-        "coumbus": "cbj",
-        "the cbj": "cbj",
-        "calgary flames": "cgy",
-        "cal": "cgy",
-        "chicago blackhawks": "chi",
-        "chicago black hawks": "chi",
-        "colorado avalanche": "col",
-        "col avalanche": "col",
-        "coloardo": "col",
-        "colarado": "col",
-        "avalance": "col",
-        "aves": "col",
-        "avalanches": "col",
-        "crl": "col",
-        "dallas stars": "dal",
-        "detroit red wings": "det",
-        "redwings": "det",
-        "drw": "det",
-        "det.": "det",
-        "det red wings": "det",
-        "detroit redwings": "det",
-        "edmonton oilers": "edm",
-        "oliers": "edm",
-        "florida panthers": "fla",
-        "floride": "fla",
-        "flo": "fla",
-        "fl": "fla",
-        "flp": "fla",
-        "los angeles kings": "lak",
-        "l.a. kings": "lak",
-        "la kings": "lak",
-        "l.a kings": "lak",
-        "la": "lak",
-        "minnesota wild": "min",
-        "minn": "min",
-        "montreal canadiens": "mtl",
-        "montreal canadians": "mtl",
-        "candiens": "mtl",
-        "habs": "mtl",
-        "nashville predators": "nsh",
-        "nash": "nsh",
-        "nas": "nsh",
-        "nshville": "nsh",
-        "new jersey devils": "njd",
-        "ney york islanders": "nyi",
-        "new york isles": "nyi",
-        "new york i": "nyi",
-        "ottawa senators": "ott",
-        "sentaors": "ott",
-        "philadelphia flyers": "phi",
-        "philedelphia": "phi",
-        "san jose sharks": "sjs",
-        "sj sharks": "sjs",
-        "sharkes": "sjs",
-        "san josé sharks": "sjs",
-        "sam jose": "sjs",
-        "sanjose": "sjs",
-        "seattle kraken": "sea",
-        "krakken": "sea",
-        "st louis blues": "stl",
-        "st. louis blues": "stl",
-        "st": "stl",
-        "tampa bay lightning": "tbl",
-        "tb lightning": "tbl",
-        "tb": "tbl",
-        "mike m 1. lightning": "tbl",
-        "tampa bay lightening": "tbl",
-        "lightining": "tbl",
-        "ligntning": "tbl",
-        "lighting": "tbl",
-        "lightening": "tbl",
-        "lightnings": "tbl",
-        "tampa lightning": "tbl",
-        "tamp bay": "tbl",
-        "tgl": "tbl",
-        "toronto maple leafs": "tor",
-        "mapleleafs": "tor",
-        "leaf's": "tor",
-        "leaf’s": "tor",
-        "tor maple leafs": "tor",
-        "tml": "tor",
-        "maples leafs": "tor",
-        "vancouver canucks": "van",
-        "las vegas golden knights": "veg",
-        "vegas golden knights": "veg",
-        "vgk": "veg",
-        "dillon h. 1. vegas": "veg",
-        "de 1. golden knights": "veg",
-        "golden knight": "veg",
-        "goldn knights": "veg",
-        "goldn knight": "veg",
-        "g knights": "veg",
-        "g. knights": "veg",
-        "golden nights": "veg",
-        "las.vegas": "veg",
-        "vgn": "veg",
-        "lvk": "veg",
-        "lv": "veg",
-        "lvg": "veg",
-        "vgs": "veg",
-        "vkg": "veg",
-        "the vgk": "veg",
-        "winnipeg jets": "wpg",
-        "win": "wpg",
-        "washington capitals": "wsh",
-        "was": "wsh",
-    }
-    # Generate list of columns for question 1 to iterate through
+    alias_index = load_alias_index()
+    # Generate list of columns for each question to standardize
     q1 = ['q1a1', 'q1a2', 'q1a3', 'q1a4', 'q1a5']
-    for question in q1:
-        print(f"Standardizing the answers for column {question}...")
-        # Replace by city name
-        df[question].replace(to_replace=city_name_dict,
-                             value=None, inplace=True)
-        # Replace by team name
-        df[question].replace(to_replace=team_name_dict,
-                             value=None, inplace=True)
-        # Replace by other criteria (combined city & team name, misspellings, etc.)
-        df[question].replace(to_replace=teams_other_dict,
-                             value=None, inplace=True)
-        print("Done!")
+    standardize_question(df, q1, alias_index["q1"])
     q2 = ['q2a1', 'q2a2', 'q2a3', 'q2a4', 'q2a5']
-    for question in q2:
-        print(f"Standardizing the answers for column {question}")
-        # Replace by city name
-        df[question].replace(to_replace=city_name_dict,
-                             value=None, inplace=True)
-        # Replace by team name
-        df[question].replace(to_replace=team_name_dict,
-                             value=None, inplace=True)
-        # Replace by other criteria (combined city & team name, misspellings, etc.)
-        df[question].replace(to_replace=teams_other_dict,
-                             value=None, inplace=True)
-        print("Done!")
-    # Dictionary of variations of coaches names for standardization
-    coaches_dict = {
-        "0": np.nan,
-
-        "jared bednar": "bednar",
-        "j. bednar": "bednar",
-        "j bednar": "bednar",
-        "bednar (col)": "bednar",
-        "bednar(col)": "bednar",
-        "jared bednar (col)": "bednar",
-        "j. bednard": "bednar",
-        "bed ar": "bednar",
-        "colorado": "bednar",
-        "jared bendar": "bednar",
-        "col coach": "bednar",
-        "richard bednar": "bednar",
-        "bednard": "bednar",
-        "bednar col": "bednar",
-        "j.bednar": "bednar",
-        "col": "bednar",
-        "j benar": "bednar",
-        "bedner": "bednar",
-
-        "craig berube": "berube",
-        "c. berube": "berube",
-        "c berube": "berube",
-        "berube (stl)": "berube",
-        "berube(stl)": "berube",
-
-        "jeff blashill": "blashill",
-        "j. blashill": "blashill",
-        "j blashill": "blashill",
-        "blashill (det)": "blashill",
-        "blashill(det)": "blashill",
-        "detroit": "blashill",
-        "det": "blashill",
-
-        "bob boughner": "boughner",
-        "b. boughner": "boughner",
-        "b boughner": "boughner",
-        "boughner (sjs)": "boughner",
-        "boughner (sj)": "boughner",
-        "boughner(sjs)": "boughner",
-        "boughner(sj)": "boughner",
-
-        "rick bowness": "bowness",
-        "r. bowness": "bowness",
-        "r bowness": "bowness",
-        "bowness (dal)": "bowness",
-        "bowness(dal)": "bowness",
-
-        "rod brind'amour": "brind'amour",
-        "rod brind’amour": "brind'amour",
-        "r. brind'amour": "brind'amour",
-        "r. brind’amour": "brind'amour",
-        "r brind'amour": "brind'amour",
-        "r brind’amour": "brind'amour",
-        "rod brindamour": "brind'amour",
-        "r. brindamour": "brind'amour",
-        "r brindamour": "brind'amour",
-        "brindamour": "brind'amour",
-        "brind’amour": "brind'amour",
-        "brind’amour(car)": "brind'amour",
-        "brindamore": "brind'amour",
-        "rba": "brind'amour",
-        "rodthebod": "brind'amour",
-        "rod “the bod” brind’amour": "brind'amour",
-        "rod bind’amour": "brind'amour",
-        "brand'amour": "brind'amour",
-        "rod brind‘amour": "brind'amour",
-        "rob brind'amour": "brind'amour",
-        "brind‘amour": "brind'amour",
-        "rod": "brind'amour",
-        "brindamor": "brind'amour",
-        "brindamore car": "brind'amour",
-        "brind ‘amour ": "brind'amour",
-        "brind amour": "brind'amour",
-        "brind amor": "brind'amour",
-        "brind'amor": "brind'amour",
-        "rod bindamour": "brind'amour",
-        "brind'amur": "brind'amour",
-        "ron brind’amour": "brind'amour",
-        "brind ‘amour": "brind'amour",
-        "r brind amour": "brind'amour",
-        'rob "the bod"': "brind'amour",
-        "rod brid'amour": "brind'amour",
-        "rod the bod": "brind'amour",
-        "brind a’mour": "brind'amour",
-        "rod brind'amour (car)": "brind'amour",
-        "brind’amor": "brind'amour",
-        "car": "brind'amour",
-        "brind'omour": "brind'amour",
-        "rod brind`amour": "brind'amour",
-        "brind'amour (car)": "brind'amour",
-        "rod brind’ amour": "brind'amour",
-        "rod ‘the bod’ brind’amour": "brind'amour",
-        "brind' amour ": "brind'amour",
-        "rod brind’amor": "brind'amour",
-        "robert brindamour": "brind'amour",
-        "rob brind’amour": "brind'amour",
-        "brinda’amour": "brind'amour",
-        "rob brinda'mour": "brind'amour",
-        "bind’amour": "brind'amour",
-        "rod brind amour": "brind'amour",
-        "rod  brind'amour": "brind'amour",
-        "rod brind'amor": "brind'amour",
-        "brind’amour (car)": "brind'amour",
-        "brind a'mour": "brind'amour",
-        "rob brindamour": "brind'amour",
-        "canes coach": "brind'amour",
-        "brind' amour": "brind'amour",
-        "brind’amore": "brind'amour",
-        "rod 'the bod' brind'amour": "brind'amour",
-
-        "bruce cassidy": "cassidy",
-        "b. cassidy": "cassidy",
-        "b cassidy": "cassidy",
-        "cassidy (bos)": "cassidy",
-        "cassidy(bos)": "cassidy",
-        "cassidy bos": "cassidy",
-        "bos coach": "cassidy",
-        "butch cassidy": "cassidy",
-        "kassidy": "cassidy",
-        "cassiday": "cassidy",
-        "bos": "cassidy",
-
-        "jeremy colliton": "colliton",
-        "j. colliton": "colliton",
-        "j colliton": "colliton",
-        "colliton (chi)": "colliton",
-        "colliton(chi)": "colliton",
-        "collison": "colliton",
-        "jeremy collington": "colliton",
-
-        "jon cooper": "cooper",
-        "j. cooper": "cooper",
-        "j cooper": "cooper",
-        "cooper (tb)": "cooper",
-        "cooper(tb)": "cooper",
-        "john cooper": "cooper",
-        "cooper (tbl)": "cooper",
-        "cooper(tbl)": "cooper",
-        "tbl": "cooper",
-        "tb": "cooper",
-        "cooper tb": "cooper",
-        "ooper": "cooper",
-        "tb coach": "cooper",
-        "tbl coach": "cooper",
-        "tampa coach": "cooper",
-        "jon cooper (tb)": "cooper",
-        "jon cooper (tbl)": "cooper",
-        "j.cooper": "cooper",
-        "job cooper": "cooper",
-        "tampa bay": "cooper",
-        "jon copper": "cooper",
-        "jonathon cooper": "cooper",
-        "cooper.": "cooper",
-
-        "peter deboer": "deboer",
-        "pete deboer": "deboer",
-        "peter de boer": "deboer",
-        "pete de boer": "deboer",
-        "p. deboer": "deboer",
-        "p. de boer": "deboer",
-        "p deboer": "deboer",
-        "p de boer": "deboer",
-        "deboer (veg)": "deboer",
-        "deboer (vgk)": "deboer",
-        "pete deboer (vgk)": "deboer",
-        "deboer (lv)": "deboer",
-        "de boer (veg)": "deboer",
-        "de boer (vgk)": "deboer",
-        "de boer (lv)": "deboer",
-        "vgk coach": "deboer",
-        "vgk": "deboer",
-        "deboer vgk": "deboer",
-        "lv coach": "deboer",
-        "doboer": "deboer",
-        "de boer": "deboer",
-        "debour": "deboer",
-        "peter debour": "deboer",
-        "deboar": "deboer",
-        "vegas coach": "deboer",
-
-        "dominique ducharme": "ducharme",
-        "dom ducharme": "ducharme",
-        "d. ducharme": "ducharme",
-        "d ducharme": "ducharme",
-        "ducharme (mtl)": "ducharme",
-        "ducharme(mtl)": "ducharme",
-        "dominic duscharme": "ducharme",
-
-        "dallas eakins": "eakins",
-        "d. eakins": "eakins",
-        "d eakins": "eakins",
-        "eakins (ana)": "eakins",
-        "eakins(ana)": "eakins",
-
-        "dean evason": "evason",
-        "d. evason": "evason",
-        "d evason": "evason",
-        "evason (min)": "evason",
-        "evason(min)": "evason",
-        "dean evanson": "evason",
-        "evanson": "evason",
-        "dean evenson": "evason",
-        "d.evason": "evason",
-        "evenson": "evason",
-        "minnesota coach": "evason",
-        "dean eaveson": "evason",
-
-        "gerard gallant": "gallant",
-        "g. gallant": "gallant",
-        "g gallant": "gallant",
-        "gallant (nyr)": "gallant",
-        "gallant(nyr)": "gallant",
-        "gerrard gallant": "gallant",
-        "galland": "gallant",
-        "garrard gallant": "gallant",
-        "g.gallant": "gallant",
-
-        "don granato": "granato",
-        "d. granato": "granato",
-        "d granato": "granato",
-        "granato (buf)": "granato",
-        "granato(buf)": "granato",
-
-        "travis green": "green",
-        "t. green": "green",
-        "t green": "green",
-        "green (van)": "green",
-        "green(van)": "green",
-        "t.green": "green",
-        "todd green": "green",
-        "trent green": "green",
-
-        "dave hakstol": "hakstol",
-        "d. hakstol": "hakstol",
-        "d hakstol": "hakstol",
-        "hakstol (sea)": "hakstol",
-        "hakstol(sea)": "hakstol",
-        "dave hakstall": "hakstol",
-        "hasktoil": "hakstol",
-        "hakstoll": "hakstol",
-        "kraken coach": "hakstol",
-        "halston": "hakstol",
-        "dave hakstoll": "hakstol",
-
-        "john hynes": "hynes",
-        "j. hynes": "hynes",
-        "j hynes": "hynes",
-        "hynes (nsh)": "hynes",
-        "hynes(nsh)": "hynes",
-
-        "sheldon keefe": "keefe",
-        "s. keefe": "keefe",
-        "s keefe": "keefe",
-        "keefe (tor)": "keefe",
-        "keefe(tor)": "keefe",
-        "tor": "keefe",
-        "toronto": "keefe",
-        "sheldon keef": "keefe",
-        "sheldon keefe(tor)": "keefe",
-        "keafe": "keefe",
-        "keefe (tml)": "keefe",
-        "seldon keefe": "keefe",
-
-        "brad larsen": "larsen",
-        "b. larsen": "larsen",
-        "b larsen": "larsen",
-        "larsen (cbj)": "larsen",
-        "larsen(cbj)": "larsen",
-        "cbj": "larsen",
-
-        "peter laviolette": "laviolette",
-        "p. laviolette": "laviolette",
-        "p laviolette": "laviolette",
-        "laviolette (wsh)": "laviolette",
-        "laviolette(wsh)": "laviolette",
-        "peter_laviolette": "laviolette",
-        "laviollette": "laviolette",
-        "laviollete": "laviolette",
-
-        "paul maurice": "maurice",
-        "p. maurice": "maurice",
-        "p maurice": "maurice",
-        "maurice (wpg)": "maurice",
-        "maurice(wpg)": "maurice",
-        "paul maurice (wpg)": "maurice",
-
-        "todd mclellan": "mclellan",
-        "t. mclellan": "mclellan",
-        "t mclellan": "mclellan",
-        "mclellan (lak)": "mclellan",
-        "mclellan (la)": "mclellan",
-        "mclellan(lak)": "mclellan",
-        "mclellan(la)": "mclellan",
-        "mclennan": "mclellan",
-        "todd mclellan (lak)": "mclellan",
-        "mcllellan": "mclellan",
-        "lak": "mclellan",
-        "maclellan": "mclellan",
-        "mcclellan": "mclellan",
-
-        "joel quenneville": "quenneville",
-        "j. quenneville": "quenneville",
-        "j quenneville": "quenneville",
-        "quenneville (fla)": "quenneville",
-        "quenneville(fla)": "quenneville",
-        "coach q": "quenneville",
-        "queenville": "quenneville",
-        "quinville": "quenneville",
-        "j.quenneville": "quenneville",
-        "quennville": "quenneville",
-        "qunneville": "quenneville",
-        "joel quinville": "quenneville",
-        "joel queneville": "quenneville",
-        "joel quenneville (fla)": "quenneville",
-        "q": "quenneville",
-        "joel quennville": "quenneville",
-        "joel quenville": "quenneville",
-        "queenneville": "quenneville",
-        "joel quennenville": "quenneville",
-        "florida coach": "quenneville",
-        "quineville": "quenneville",
-        "j. quennville": "quenneville",
-        "joe q": "quenneville",
-        "fla coach": "quenneville",
-        "quenville": "quenneville",
-        "queneville": "quenneville",
-        "john quenneville": "quenneville",
-        "joel quennevile": "quenneville",
-        "quennville (fla)": "quenneville",
-        "joe quenneville": "quenneville",
-        "quinneville": "quenneville",
-        "quenneville fla": "quenneville",
-        "john quenville": "quenneville",
-        "joe quinville": "quenneville",
-        "joel qenneville": "quenneville",
-        "queeneville": "quenneville",
-        "joel quinneville": "quenneville",
-        "quennveville": "quenneville",
-        "quennenville": "quenneville",
-        "joel quennvile": "quenneville",
-        "joel q (fla)": "quenneville",
-        "joel qunneville": "quenneville",
-        "john quennville": "quenneville",
-        "j. quenville": "quenneville",
-        "joel quennveville": "quenneville",
-
-
-        "lindy ruff": "ruff",
-        "l. ruff": "ruff",
-        "l ruff": "ruff",
-        "ruff (njd)": "ruff",
-        "ruff (nj)": "ruff",
-        "ruff(njd)": "ruff",
-        "ruff(nj)": "ruff",
-        "ruff nj": "ruff",
-        "new jersey coach": "ruff",
-
-        "d. j. smith": "smith",
-        "d j smith": "smith",
-        "d.j. smith": "smith",
-        "dj smith": "smith",
-        "smith (ott)": "smith",
-        "smith(ott)": "smith",
-        "dj smith (ott)": "smith",
-        "d.j. smith (ott)": "smith",
-        "d.j smith": "smith",
-        "ottawa coach": "smith",
-        "ott coach": "smith",
-        "djsmith": "smith",
-        "tj smith": "smith",
-
-        "mike sullivan": "sullivan",
-        "m. sullivan": "sullivan",
-        "m sullivan": "sullivan",
-        "sullivan (pit)": "sullivan",
-        "sullivan(pit)": "sullivan",
-        "sullivan (pitt)": "sullivan",
-
-        "daryl sutter": "sutter",
-        "d. sutter": "sutter",
-        "d sutter": "sutter",
-        "sutter (cgy)": "sutter",
-        "sutter(cgy)": "sutter",
-        "darryl sutter": "sutter",
-        "cgy coach": "sutter",
-
-        "dave tippett": "tippett",
-        "d. tippett": "tippett",
-        "d tippett": "tippett",
-        "tippett (edm)": "tippett",
-        "tippett(edm)": "tippett",
-        "dave tippet": "tippett",
-        "d. tippet": "tippett",
-        "d tippet": "tippett",
-        "tippet (edm)": "tippett",
-        "tippet(edm)": "tippett",
-        "edmonton": "tippett",
-        "edm": "tippett",
-        "tippet": "tippett",
-        "edm coach": "tippett",
-        "tippette": "tippett",
-        "d.tippett": "tippett",
-        "tippit": "tippett",
-        "tipett": "tippett",
-
-        "andre tourigny": "tourigny",
-        "a. tourigny": "tourigny",
-        "a tourigny": "tourigny",
-        "tourigny (ari)": "tourigny",
-        "tourigny(ari)": "tourigny",
-        "arizona": "tourigny",
-        "ari": "tourigny",
-        "phx": "tourigny",
-
-        "barry trotz": "trotz",
-        "b. trotz": "trotz",
-        "b trotz": "trotz",
-        "trotz (nyi)": "trotz",
-        "trotz(nyi)": "trotz",
-        "ny islanders": "trotz",
-        "nyi": "trotz",
-        "trots": "trotz",
-        "rotz": "trotz",
-        "barrty trotz": "trotz",
-        "barry trotz (nyi)": "trotz",
-        "tortz": "trotz",
-        "b.trotz": "trotz",
-        "trott": "trotz",
-        "trotz nyi": "trotz",
-        "nyi coach": "trotz",
-        "barry trots": "trotz",
-
-
-        "alain vigneault": "vigneault",
-        "a. vigneault": "vigneault",
-        "a vigneault": "vigneault",
-        "vigneault (phi)": "vigneault",
-        "vigneault(phi)": "vigneault",
-        "alain vignealt": "vigneault",
-    }
+    standardize_question(df, q2, alias_index["q2"])
     q3 = ['q3a1', 'q3a2', 'q3a3', 'q3a4', 'q3a5']
-    for question in q3:
-        print(f"Standardizing the answers for column {question}")
-        # Replace by various names of coaches
-        df[question].replace(to_replace=coaches_dict, value=None, inplace=True)
-        print("Done!")
-    # Dictionary of variations of GM names for standardization
-    gms_dict = {
-        "0": np.nan,
-
-        "kevyn adams": "adams",
-        "k. adams": "adams",
-        "k adams": "adams",
-        "adams (buf)": "adams",
-        "adams(buf)": "adams",
-        "buf": "adams",
-
-        "bill armstrong": "b armstrong",
-        "bill armstrong (ari)": "b armstrong",
-        "bill armstrong (az)": "b armstrong",
-        "b armstrong (ari)": "b armstrong",
-        "b armstrong (az)": "b armstrong",
-        "b. armstrong": "b armstrong",
-        "armstrong (ari)": "b armstrong",
-        "armstrong (az)": "b armstrong",
-        "phx": "b armstrong",
-        "ari": "b armstrong",
-        "armstrong (coyotes)": "b armstrong",
-        "armstrong(coyotes)": "b armstrong",
-        "ari gm": "b armstrong",
-        "bill armstong": "b armstrong",
-        "armstrong(az)": "b armstrong",
-
-        "doug armstrong": "d armstrong",
-        "doug armstrong (stl)": "d armstrong",
-        "d armstrong (stl)": "d armstrong",
-        "d. armstrong (stl)": "d armstrong",
-        "d. armstrong": "d armstrong",
-        "armstrong (stl)": "d armstrong",
-        "armstrong(stl)": "d armstrong",
-        "stl": "d armstrong",
-        "armstrong(blues)": "d armstrong",
-        "armstrong (st. l)": "d armstrong",
-        "armstrong (doug)": "d armstrong",
-        "doug armstrong stl": "d armstrong",
-
-        "jim benning": "benning",
-        "j. benning": "benning",
-        "j benning": "benning",
-        "benning (van)": "benning",
-        "benning(van)": "benning",
-        "van": "benning",
-
-        "marc bergevin": "bergevin",
-        "mark bergevin": "bergevin",
-        "marc bergevin (mtl)": "bergevin",
-        "mark bergevin (mtl)": "bergevin",
-        "m. bergevin": "bergevin",
-        "m bergevin": "bergevin",
-        "bergevin (mtl)": "bergevin",
-        "bergevin(mtl)": "bergevin",
-        "mtl": "bergevin",
-        "bergevin mtl": "bergevin",
-
-        "rob blake": "blake",
-        "rob blake (lak)": "blake",
-        "rob blake (la)": "blake",
-        "r. blake": "blake",
-        "r blake": "blake",
-        "blake (lak)": "blake",
-        "blake (la)": "blake",
-        "lak": "blake",
-        "la": "blake",
-        "rod blake": "blake",
-        "r.blake": "blake",
-        "kings gm": "blake",
-
-        "stan bowman": "bowman",
-        "stan bowman (chi)": "bowman",
-        "s. bowman": "bowman",
-        "s. bowman (chi)": "bowman",
-        "s bowman (chi)": "bowman",
-        "s bowman": "bowman",
-        "bowman (chi)": "bowman",
-        "bowman(chi)": "bowman",
-        "chi": "bowman",
-
-        "julien brisebois": "brisebois",
-        "julian brisebois": "brisebois",
-        "julien brise bois": "brisebois",
-        "julian brise bois": "brisebois",
-        "julien brisebois (tbl)": "brisebois",
-        "julian brisebois (tbl)": "brisebois",
-        "julien brisebois (tb)": "brisebois",
-        "julian brisebois (tb)": "brisebois",
-        "j. brisebois (tbl)": "brisebois",
-        "j. brisebois (tb)": "brisebois",
-        "j. brisebois": "brisebois",
-        "j brisebois (tbl)": "brisebois",
-        "j brisebois (tb)": "brisebois",
-        "j brisebois": "brisebois",
-        "brisebois (tbl)": "brisebois",
-        "brisebois (tb)": "brisebois",
-        "brisebois(tbl)": "brisebois",
-        "brisebois(tb)": "brisebois",
-        "tbl gm": "brisebois",
-        "tb gm": "brisebois",
-        "tbl": "brisebois",
-        "tb": "brisebois",
-        "julien brisbois": "brisebois",
-        "j. brisbois": "brisebois",
-        "j brisbois": "brisebois",
-        "julien briseboise": "brisebois",
-        "j. briseboise": "brisebois",
-        "j briseboise": "brisebois",
-        "j.brisebois": "brisebois",
-        "j.brisbois": "brisebois",
-        "j.brisboise": "brisebois",
-        "bisebois": "brisebois",
-        "birsbouis": "brisebois",
-        "julien briesebois": "brisebois",
-        "biseboise": "brisebois",
-        "juilen brisebos": "brisebois",
-        "juloen brisbois": "brisebois",
-        "julian briseboes": "brisebois",
-        "j. briesbois": "brisebois",
-        "brisebouis": "brisebois",
-        "john brisebois": "brisebois",
-        "julia brisebois": "brisebois",
-        "broisebois": "brisebois",
-        "julien briesbois": "brisebois",
-        "julian briesbois": "brisebois",
-        "brisbios": "brisebois",
-        "briesbois": "brisebois",
-        "jbb": "brisebois",
-        "brisbois": "brisebois",
-        "julien brisbrois": "brisebois",
-        "tampa gm": "brisebois",
-        "julien brizebois": "brisebois",
-        "biresbois": "brisebois",
-        "birsebois": "brisebois",
-        "julien brisebous": "brisebois",
-        "briseboise": "brisebois",
-        "brisboi": "brisebois",
-        "brisebios": "brisebois",
-        "brisebrois": "brisebois",
-        "briesebois": "brisebois",
-        "julian briesebois": "brisebois",
-        "julian birsbois": "brisebois",
-        "breisbois": "brisebois",
-        "brisebois tb": "brisebois",
-        "tampa bay": "brisebois",
-        "julien birsbois": "brisebois",
-        "brisboise": "brisebois",
-        "julien brisbeois": "brisebois",
-        "julien brisebrois": "brisebois",
-
-        "kevin cheveldayoff": "cheveldayoff",
-        "kevin cheveldayof": "cheveldayoff",
-        "kevin cheveldayov": "cheveldayoff",
-        "kevin cheveldayoff (wpg)": "cheveldayoff",
-        "kevin cheveldayoff (win)": "cheveldayoff",
-        "k. cheveldayoff (wpg)": "cheveldayoff",
-        "k. cheveldayoff (win)": "cheveldayoff",
-        "k. cheveldayoff": "cheveldayoff",
-        "k cheveldayoff (wpg)": "cheveldayoff",
-        "k cheveldayoff (win)": "cheveldayoff",
-        "k cheveldayoff": "cheveldayoff",
-        "cheveldayoff (wpg)": "cheveldayoff",
-        "cheveldayoff (win)": "cheveldayoff",
-        "cheveldayoff(wpg)": "cheveldayoff",
-        "cheveldayoff(win": "cheveldayoff",
-        "chevy": "cheveldayoff",
-        "wpg": "cheveldayoff",
-        "win": "cheveldayoff",
-        "kevin chevyldayoff": "cheveldayoff",
-        "kevin chevaldeyoff": "cheveldayoff",
-        "kevin cheveladayoff": "cheveldayoff",
-        "chevelydayoff": "cheveldayoff",
-        "chevaldayoff": "cheveldayoff",
-        "kevin chevaldayof": "cheveldayoff",
-        "wpg gm": "cheveldayoff",
-        "chevelodayoff": "cheveldayoff",
-        "cheveldayof": "cheveldayoff",
-
-        "pierre dorion": "dorion",
-        "pierre dorian": "dorion",
-        "pierre dorion (ott)": "dorion",
-        "p. dorion (ott)": "dorion",
-        "p. dorion": "dorion",
-        "p dorion (ott)": "dorion",
-        "p dorion": "dorion",
-        "dorion (ott)": "dorion",
-        "dorion(ott)": "dorion",
-        "ott": "dorion",
-        "doiron": "dorion",
-        "dorian": "dorion",
-        "pierre doriane": "dorion",
-        "ott gm": "dorion",
-
-        "chris drury": "drury",
-        "chris drury (nyr)": "drury",
-        "chris drury (ny)": "drury",
-        "c. drury (nyr)": "drury",
-        "c. drury (ny)": "drury",
-        "c. drury": "drury",
-        "c drury (nyr)": "drury",
-        "c drury (ny)": "drury",
-        "c drury": "drury",
-        "drury (nyr)": "drury",
-        "drury (ny)": "drury",
-        "drury(nyr)": "drury",
-        "drury(ny)": "drury",
-        "nyr": "drury",
-        "ny rangers": "drury",
-
-        "kyle dubas": "dubas",
-        "kyle dubas (tor)": "dubas",
-        "kyle dubas (tml)": "dubas",
-        "k. dubas (tor)": "dubas",
-        "k. dubas (tml)": "dubas",
-        "k. dubas": "dubas",
-        "k dubas (tor)": "dubas",
-        "k dubas (tml)": "dubas",
-        "k dubas": "dubas",
-        "dubas (tor)": "dubas",
-        "dubas (tml)": "dubas",
-        "dubas(tor)": "dubas",
-        "dubas(tml)": "dubas",
-        "tor": "dubas",
-        "tml": "dubas",
-        "k.dubas": "dubas",
-
-        "tom fitzgerald": "fitzgerald",
-        "tom fitzgerald (njd)": "fitzgerald",
-        "tom fitzgerald (nj)": "fitzgerald",
-        "t. fitzgerald (njd)": "fitzgerald",
-        "t. fitzgerald (nj)": "fitzgerald",
-        "t. fitzgerald": "fitzgerald",
-        "t fitzgerald (njd)": "fitzgerald",
-        "t fitzgerald (nj)": "fitzgerald",
-        "t fitzgerald": "fitzgerald",
-        "fitzgerald (njd)": "fitzgerald",
-        "fitzgerald (nj)": "fitzgerald",
-        "fitzgerald(njd)": "fitzgerald",
-        "fitzgerald(nj)": "fitzgerald",
-        "njd": "fitzgerald",
-        "nj": "fitzgerald",
-
-        "chuck fletcher": "fletcher",
-        "chuck fletcher (phi)": "fletcher",
-        "c. fletcher (phi)": "fletcher",
-        "c. fletcher": "fletcher",
-        "c fletcher (phi)": "fletcher",
-        "c fletcher": "fletcher",
-        "fletcher (phi)": "fletcher",
-        "fletcher(phi)": "fletcher",
-        "phi": "fletcher",
-        "fletcher phi": "fletcher",
-        "phi gm": "fletcher",
-
-        "ron francis": "francis",
-        "ron francis (sea)": "francis",
-        "r. francis (sea)": "francis",
-        "r. francis": "francis",
-        "r francis (sea)": "francis",
-        "r francis": "francis",
-        "francis (sea)": "francis",
-        "francis(sea)": "francis",
-        "francis (hired july 2019)": "francis",
-        "sea": "francis",
-        "seattle gm": "francis",
-        "ron francis (if he counts he was technically hired early enough)": "francis",
-        "r.francis": "francis",
-        "kraken gm": "francis",
-        "franics": "francis",
-        "sea gm": "francis",
-
-        "bill guerin": "guerin",
-        "bill guerin (min)": "guerin",
-        "b. guerin (min)": "guerin",
-        "b. guerin": "guerin",
-        "b guerin (min)": "guerin",
-        "b guerin": "guerin",
-        "guerin (min)": "guerin",
-        "guerin(min)": "guerin",
-        "min": "guerin",
-        "guerrin": "guerin",
-        "guerin (minn)": "guerin",
-        "minnesota gm": "guerin",
-        "geurin": "guerin",
-        "b.guerin": "guerin",
-        "billy guerin": "guerin",
-        "bill geurin": "guerin",
-        "bill gudrun": "guerin",
-        "bill guerrin": "guerin",
-
-        "ron hextall": "hextall",
-        "ron hextall (pit)": "hextall",
-        "r. hextall (pit)": "hextall",
-        "r. hextall": "hextall",
-        "r hextall (pit)": "hextall",
-        "r hextall": "hextall",
-        "hextall (pit)": "hextall",
-        "hextall(pit)": "hextall",
-        "pit": "hextall",
-
-        "ken holland": "holland",
-        "ken holland (edm)": "holland",
-        "k. holland (edm)": "holland",
-        "k. holland": "holland",
-        "k holland (edm)": "holland",
-        "k holland": "holland",
-        "holland (edm)": "holland",
-        "holland(edm)": "holland",
-        "edm": "holland",
-        "ken hollland": "holland",
-        "oilers gm": "holland",
-
-        "jarmo kekalainen": "kekalainen",
-        "jarmo kekalainen (cbj)": "kekalainen",
-        "jarmo kekalainen (cb)": "kekalainen",
-        "j. kekalainen (cbj)": "kekalainen",
-        "j. kekalainen (cb)": "kekalainen",
-        "j. kekalainen": "kekalainen",
-        "j kekalainen (cbj)": "kekalainen",
-        "j kekalainen (cb)": "kekalainen",
-        "j kekalainen": "kekalainen",
-        "kekalainen (cbj)": "kekalainen",
-        "kekalainen (cb)": "kekalainen",
-        "kekalainen(cbj)": "kekalainen",
-        "kekalainen(cb)": "kekalainen",
-        "cbj gm": "kekalainen",
-        "cb gm": "kekalainen",
-        "clb gm": "kekalainen",
-        "cbj": "kekalainen",
-        "clb": "kekalainen",
-        "cb": "kekalainen",
-        "kekalaninen": "kekalainen",
-        "columbus": "kekalainen",
-        "kekalainan": "kekalainen",
-        "jarmmo kekalaien": "kekalainen",
-        "jarmo kekäläinen": "kekalainen",
-        "jermo kekailainen": "kekalainen",
-        "jarmo": "kekalainen",
-        "kekalanien": "kekalainen",
-        "kekäläinen": "kekalainen",
-        "jarmok": "kekalainen",
-        "kekalaainen": "kekalainen",
-        "jarmo kekelainen": "kekalainen",
-
-        "lou lamoriello": "lamoriello",
-        "lou lamoriello (nyi)": "lamoriello",
-        "lou lamoriello (ny)": "lamoriello",
-        "l. lamoriello (nyi)": "lamoriello",
-        "l. lamoriello (ny)": "lamoriello",
-        "l. lamoriello": "lamoriello",
-        "l lamoriello (nyi)": "lamoriello",
-        "l lamoriello (ny)": "lamoriello",
-        "l lamoriello (nyi)": "lamoriello",
-        "l lamoriello (ny)": "lamoriello",
-        "l lamoriello": "lamoriello",
-        "lamoriello (nyi)": "lamoriello",
-        "lamoriello (ny)": "lamoriello",
-        "lamoriello(nyi)": "lamoriello",
-        "lamoriello(ny)": "lamoriello",
-        "nyi gm": "lamoriello",
-        "nyi": "lamoriello",
-        "lamarello": "lamoriello",
-        "lou lamorello(sry dont know his spellin)": "lamoriello",
-        "lou lamorello": "lamoriello",
-        "lou lamerello": "lamoriello",
-        "lou lamerillo": "lamoriello",
-        "lamourello": "lamoriello",
-        "lamorilleo": "lamoriello",
-        "lamarillo": "lamoriello",
-        "ny islanders": "lamoriello",
-        "lamoreillo": "lamoriello",
-        "lou lamariello": "lamoriello",
-        "lou lamirello": "lamoriello",
-        "lamorillo": "lamoriello",
-        "lamiorello": "lamoriello",
-        "lamoreiello": "lamoriello",
-        "lou lam": "lamoriello",
-        "lou l": "lamoriello",
-        "lou lamarello": "lamoriello",
-        "lou lamierello": "lamoriello",
-        "lamerello": "lamoriello",
-        "lamorielllo (nyi)": "lamoriello",
-        "lamorello": "lamoriello",
-        "lamariello": "lamoriello",
-        "lamourillo": "lamoriello",
-        "lou": "lamoriello",
-        "lamouriello": "lamoriello",
-        "lamoille": "lamoriello",
-        "l.lamoriello": "lamoriello",
-        "lou lamoirello": "lamoriello",
-        "lou lamarillo": "lamoriello",
-        "luo lamoriello": "lamoriello",
-        "lammoriello": "lamoriello",
-        "uncle lou": "lamoriello",
-        "lou lamiorello": "lamoriello",
-        "lou lameriello": "lamoriello",
-        "lamerllo": "lamoriello",
-        "lamorinello": "lamoriello",
-        "lou lamorielo": "lamoriello",
-
-        "brian maclellan": "maclellan",
-        "brian maclellan (wsh)": "maclellan",
-        "b. maclellan (wsh)": "maclellan",
-        "b. maclellan": "maclellan",
-        "b maclellan (wsh)": "maclellan",
-        "b maclellan": "maclellan",
-        "maclellan (wsh)": "maclellan",
-        "maclellan(wsh)": "maclellan",
-        "wsh gm": "maclellan",
-        "wsh": "maclellan",
-        "was gm": "maclellan",
-        "mcclellan": "maclellan",
-        "mclellan": "maclellan",
-        "brian mcclellan": "maclellan",
-        "brian mclellan": "maclellan",
-        "mclelland": "maclellan",
-        "macclellan": "maclellan",
-        "maclellan (was)": "maclellan",
-        "brian macclellan": "maclellan",
-
-        "kelly mccrimmon": "mccrimmon",
-        "kelly mccrimmon (veg)": "mccrimmon",
-        "kelly mccrimmon (vgk)": "mccrimmon",
-        "kelly mccrimmon (lv)": "mccrimmon",
-        "k. mccrimmon (veg)": "mccrimmon",
-        "k. mccrimmon (vgk)": "mccrimmon",
-        "k. mccrimmon (lv)": "mccrimmon",
-        "k. mccrimmon": "mccrimmon",
-        "k mccrimmon (veg)": "mccrimmon",
-        "k mccrimmon (vgk)": "mccrimmon",
-        "k mccrimmon (lv)": "mccrimmon",
-        "k mccrimmon": "mccrimmon",
-        "mccrimmon (veg)": "mccrimmon",
-        "mccrimmon (vgk)": "mccrimmon",
-        "mccrimmon (lv)": "mccrimmon",
-        "mccrimmon(veg)": "mccrimmon",
-        "mccrimmon(vgk)": "mccrimmon",
-        "mccrimmon(lv)": "mccrimmon",
-        "vegas gm": "mccrimmon",
-        "vegas": "mccrimmon",
-        "veg": "mccrimmon",
-        "vgk gm": "mccrimmon",
-        "vgk": "mccrimmon",
-        "lv gm": "mccrimmon",
-        "lv": "mccrimmon",
-        "lvk": "mccrimmon",
-        "kelly mcrimmon": "mccrimmon",
-        "k.mccrimmon": "mccrimmon",
-        "knights gm (kelly mccrimmon)": "mccrimmon",
-        "mcgrimmon": "mccrimmon",
-        "kelly maccrimmon": "mccrimmon",
-        "mcrimmon": "mccrimmon",
-        "mckrimmon": "mccrimmon",
-        "kelly m": "mccrimmon",
-        "kelly mckrimmon": "mccrimmon",
-
-        "bob murray": "murray",
-        "bob murray (ana)": "murray",
-        "b. murray (ana)": "murray",
-        "b. murray": "murray",
-        "b murray (ana)": "murray",
-        "b murray": "murray",
-        "murray (ana)": "murray",
-        "murray(ana)": "murray",
-        "ana": "murray",
-
-        "jim nill": "nill",
-        "jim nill (dal)": "nill",
-        "j. nill (dal)": "nill",
-        "j. nill": "nill",
-        "j nill (dal)": "nill",
-        "j nill": "nill",
-        "nill (dal)": "nill",
-        "nill(dal)": "nill",
-        "dal": "nill",
-
-        "david poile": "poile",
-        "david poile (nash)": "poile",
-        "david poile (nsh)": "poile",
-        "d. poile (nash)": "poile",
-        "d. poile (nsh)": "poile",
-        "d. poile": "poile",
-        "d poile (nash)": "poile",
-        "d poile (nsh)": "poile",
-        "d poile": "poile",
-        "poile (nash)": "poile",
-        "poile (nsh)": "poile",
-        "poile(nash)": "poile",
-        "poile(nsh)": "poile",
-        "nash": "poile",
-        "nsh": "poile",
-        "poille": "poile",
-
-        "joe sakic": "sakic",
-        "joe sakic (col)": "sakic",
-        "j. sakic (col)": "sakic",
-        "j. sakic": "sakic",
-        "j sakic (col)": "sakic",
-        "j sakic": "sakic",
-        "sakic (col)": "sakic",
-        "sakic(col)": "sakic",
-        "col gm": "sakic",
-        "col": "sakic",
-        "sackic": "sakic",
-        "salic": "sakic",
-        "j.sakic": "sakic",
-        "joe sackic": "sakic",
-        "sacic": "sakic",
-        "joseph sakic": "sakic",
-        "burnaby joe": "sakic",
-        "sakic col": "sakic",
-        "avalanche gm": "sakic",
-        "sakick": "sakic",
-        "jow sakic": "sakic",
-        "jose sakic": "sakic",
-
-        "don sweeney": "sweeney",
-        "don sweeney (bos)": "sweeney",
-        "don sweeny": "sweeney",
-        "don sweeny (bos)": "sweeney",
-        "d. sweeney (bos)": "sweeney",
-        "d. sweeny (bos)": "sweeney",
-        "d. sweeney": "sweeney",
-        "d. sweeny": "sweeney",
-        "d sweeney (bos)": "sweeney",
-        "d sweeny (bos)": "sweeney",
-        "d sweeney": "sweeney",
-        "d sweeny": "sweeney",
-        "sweeny": "sweeney",
-        "sweeney (bos)": "sweeney",
-        "sweeny (bos)": "sweeney",
-        "sweeney(bos)": "sweeney",
-        "sweeny(bos)": "sweeney",
-        "bos gm": "sweeney",
-        "bos": "sweeney",
-        "sweeney bos": "sweeney",
-
-        "brad treliving": "treliving",
-        "brad treliving (cgy)": "treliving",
-        "b. treliving (cgy)": "treliving",
-        "b. treliving": "treliving",
-        "b treliving (cgy)": "treliving",
-        "b treliving": "treliving",
-        "treliving (cgy)": "treliving",
-        "treliving(cgy)": "treliving",
-        "cgy gm": "treliving",
-        "cgy": "treliving",
-
-        "don waddell": "waddell",
-        "don waddell (car)": "waddell",
-        "don waddle": "waddell",
-        "d. waddell (car)": "waddell",
-        "d. waddle": "waddell",
-        "d. waddell": "waddell",
-        "d waddell (car)": "waddell",
-        "d waddle": "waddell",
-        "d waddell": "waddell",
-        "waddell (car)": "waddell",
-        "waddell(car)": "waddell",
-        "car gm": "waddell",
-        "car": "waddell",
-        "waddel": "waddell",
-        "don waddel": "waddell",
-        "waddell car": "waddell",
-        "wadell": "waddell",
-        "donwaddell": "waddell",
-        "carolina gm": "waddell",
-
-        "doug wilson": "wilson",
-        "doug wilson (sjs)": "wilson",
-        "doug wilson (sj)": "wilson",
-        "d. wilson (sjs)": "wilson",
-        "d. wilson (sj)": "wilson",
-        "d. wilson": "wilson",
-        "d wilson (sjs)": "wilson",
-        "d wilson (sj)": "wilson",
-        "d wilson": "wilson",
-        "wilson (sjs)": "wilson",
-        "wilson (sj)": "wilson",
-        "wilson(sjs)": "wilson",
-        "wilson(sj)": "wilson",
-        "sjs gm": "wilson",
-        "sj gm": "wilson",
-        "sjs": "wilson",
-        "sj": "wilson",
-
-        "steve yzerman": "yzerman",
-        "steve yzerman (det)": "yzerman",
-        "s. yzerman (det)": "yzerman",
-        "s. yzerman": "yzerman",
-        "s yzerman (det)": "yzerman",
-        "s yzerman": "yzerman",
-        "yzerman (det)": "yzerman",
-        "yzerman(det)": "yzerman",
-        "stevie y": "yzerman",
-        "det gm": "yzerman",
-        "det": "yzerman",
-        "yzermam": "yzerman",
-        "steve yserman": "yzerman",
-        "steven yzerman": "yzerman",
-        "detroit gm": "yzerman",
-        "detroit": "yzerman",
-        "steve yzermam": "yzerman",
-        "steve y": "yzerman",
-        "yerman": "yzerman",
-        "yzerman det": "yzerman",
-        "s.yzerman": "yzerman",
-        "stevie yzerman": "yzerman",
-
-        "bill zito": "zito",
-        "bill zito (fla)": "zito",
-        "bill zito (fl)": "zito",
-        "b. zito (fla)": "zito",
-        "b. zito (fl)": "zito",
-        "b. zito": "zito",
-        "b zito (fla)": "zito",
-        "b zito (fl)": "zito",
-        "b zito": "zito",
-        "zito (fla)": "zito",
-        "zito (fl)": "zito",
-        "zito(fla)": "zito",
-        "zito(fl)": "zito",
-        "fla gm": "zito",
-        "fla": "zito",
-        "fl gm": "zito",
-        "fl": "zito",
-        "bill zeto": "zito",
-    }
+    standardize_question(df, q3, alias_index["q3"])
     q4 = ['q4a1', 'q4a2', 'q4a3', 'q4a4', 'q4a5']
-    for question in q4:
-        print(f"Standardizing the answers for column {question}")
-        # Replace by various names of gms
-        df[question].replace(to_replace=gms_dict, value=None, inplace=True)
-        print("Done!")
-
-    print("Running special 'armstrong' check for GM's. Many people entered 'armstrong' as an entry, but there are two armstrongs.")
-    print("'d armstrong' of St Louis is eligible this year, but 'b armstrong' of Arizona is not.")
-    print("In the entries I've had to fix so far, I've defaulted to giving people credit for 'd armstrong' based on his eligibility.")
-    print("This will need to be clarified next year.")
-    armstrong_count = 0
-    for question in q4:
-        for index in range(len(df)):
-            if df[question].iloc[index] == "armstrong":
-                temp_author = authors[index]
-                armstrong_count += 1
-                print(f"{temp_author}, I fixed your entry")
-                print(
-                    f"INTERPRETATION WARNING: {temp_author} listed 'armstrong' in their GMs. Interpreting this as 'd armstrong'")
-                df.at[index, question] = "d armstrong"
-
-    print(f"This check fixed {armstrong_count} entries.")
-    print("This is in addition to some other entries with the same problem fixed previously in this script")
-    # Dictionary of variations of goalie names for standardization
-    goalie_dict = {
-        "0": np.nan,
-
-        "jake allen": "allen",
-        "j. allen": "allen",
-        "j allen": "allen",
-        "j.allen": "allen",
-
-        "frederik andersen": "andersen",
-        "frederik anderson": "andersen",
-        "freddie andersen": "andersen",
-        "freddie andersen": "andersen",
-        "f. andersen": "andersen",
-        "f. anderson": "andersen",
-        "f andersen": "andersen",
-        "f anderson": "andersen",
-        "anderson": "andersen",
-        "f.andersen": "andersen",
-        "fred anderson": "andersen",
-        "frederick andersen": "andersen",
-
-        "craig anderson": "anderson",
-
-        "jordan binnington": "binnington",
-        "j. binnington": "binnington",
-        "j binnington": "binnington",
-        "binington": "binnington",
-        "binnington (stl)": "binnington",
-        "bennington": "binnington",
-        "bininngton": "binnington",
-        "binnigton": "binnington",
-        "jordan binnington (stl)": "binnington",
-        "j.binnington": "binnington",
-
-        "sergei bobrovsky": "bobrovsky",
-        "sergei bobrovski": "bobrovsky",
-        "sergei bobrofski": "bobrovsky",
-        "s. bobrovsky": "bobrovsky",
-        "s. bobrovski": "bobrovsky",
-        "s. bobrofski": "bobrovsky",
-        "s bobrovsky": "bobrovsky",
-        "s bobrovski": "bobrovsky",
-        "s bobrofski": "bobrovsky",
-        "bob": "bobrovsky",
-
-        "jack campbell": "campbell",
-        "j. campbell": "campbell",
-        "j campbell": "campbell",
-
-        "thatcher demko": "demko",
-        "t. demko": "demko",
-        "t demko": "demko",
-        "thatcher d": "demko",
-        "t. demko": "demko",
-        "semko": "demko",
-        "dempko": "demko",
-
-        "marc-andre fleury": "fleury",
-        "marc andre fleury": "fleury",
-        "mark andre fleury": "fleury",
-        "marc andrew fleury": "fleury",
-        "mark andrew fleury": "fleury",
-        "m. a. fleury": "fleury",
-        "m.a. fleury": "fleury",
-        "m a fleury": "fleury",
-        "ma fleury": "fleury",
-        "fluery": "fleury",
-        "flower": "fleury",
-        "feury": "fleury",
-        "fleury (chi)": "fleury",
-        "flurry": "fleury",
-        "maf": "fleury",
-        "marc andre fluery": "fleury",
-        "m.a fleury": "fleury",
-        "m.afleury": "fleury",
-
-        "john gibson": "gibson",
-        "j. gibson": "gibson",
-        "j gibson": "gibson",
-        "jon gibson": "gibson",
-        "j.gibson": "gibson",
-
-        "philipp grubauer": "grubauer",
-        "philip grubauer": "grubauer",
-        "phil grubauer": "grubauer",
-        "p. grubauer": "grubauer",
-        "p grubauer": "grubauer",
-        "phillip grubauer": "grubauer",
-        "phillipp grubauer": "grubauer",
-        "philipp grabauer": "grubauer",
-
-        "carter hart": "hart",
-        "carter heart": "hart",
-        "c. hart": "hart",
-        "c. heart": "hart",
-        "c hart": "hart",
-        "c heart": "hart",
-
-        "connor hellebuyck": "hellebuyck",
-        "conner hellebuyck": "hellebuyck",
-        "c. hellebuyck": "hellebuyck",
-        "c hellebuyck": "hellebuyck",
-        "hellebucyck": "hellebuyck",
-        "c. hellebyuck": "hellebuyck",
-        "hellebuyk": "hellebuyck",
-        "connor hellybuck": "hellebuyck",
-        "hellybuck": "hellebuyck",
-        "helly": "hellebuyck",
-        "connor hellyebuck": "hellebuyck",
-        "helebyuk": "hellebuyck",
-        "hellebucyk": "hellebuyck",
-        "connor hellebyuck": "hellebuyck",
-        "connor hellebuyck (wpg)": "hellebuyck",
-        "connor hellebuyc": "hellebuyck",
-        "hellebuyuk": "hellebuyck",
-        "conor h": "hellebuyck",
-        "conor hellebuyck": "hellebuyck",
-        "connor helleybuck": "hellebuyck",
-        "connor h": "hellebuyck",
-        "hellabuck": "hellebuyck",
-        "hellebuych": "hellebuyck",
-        "c helleybuck": "hellebuyck",
-        "c.hellebuyck": "hellebuyck",
-        "conner hellebucyk": "hellebuyck",
-        "connor heelebuyck": "hellebuyck",
-        "connor hellbuyck": "hellebuyck",
-        "connor hellebuck": "hellebuyck",
-        "connor hellebucyk": "hellebuyck",
-        "connor hellebuyk": "hellebuyck",
-        "connor hellebyck": "hellebuyck",
-        "connor hellebyuck (wpg)": "hellebuyck",
-        "connor helleybuyck": "hellebuyck",
-        "connor hellybuyck": "hellebuyck",
-        "conor hellybuck": "hellebuyck",
-        "hellyubuk": "hellebuyck",
-        "hellebuyck (wpg)": "hellebuyck",
-        "hellebuyuck": "hellebuyck",
-        "hellebuyuck (wpg)": "hellebuyck",
-        "hellebyck": "hellebuyck",
-        "hellebyuck": "hellebuyck",
-        "hellenbuyck": "hellebuyck",
-        "hellenbyck": "hellebuyck",
-        "helleybuck": "hellebuyck",
-        "helleybuyck": "hellebuyck",
-        "helllebucyk": "hellebuyck",
-        "helllebuyck": "hellebuyck",
-        "hellybuyck": "hellebuyck",
-        "hellyebuck": "hellebuyck",
-        "hellyebuyck": "hellebuyck",
-        "hellyubuk": "hellebuyck",
-        "heebuyck": "hellebuyck",
-        "helabyuck": "hellebuyck",
-        "helebucyk": "hellebuyck",
-        "helebuyck": "hellebuyck",
-        "hellbuyck": "hellebuyck",
-        "hellbyuck": "hellebuyck",
-        "hellebuck": "hellebuyck",
-        "hullybuck": "hellebuyck",
-
-        "adin hill": "hill",
-        "a. hill": "hill",
-        "a hill": "hill",
-        "hill (sjs)": "hill",
-        "hill (sj)": "hill",
-
-        "carter hutton": "hutton",
-        "c. hutton": "hutton",
-        "c hutton": "hutton",
-        "hutton (ari)": "hutton",
-
-        "joonas korpisalo": "korpisalo",
-        "jonas korpisalo": "korpisalo",
-        "j. korpisalo": "korpisalo",
-        "j korpisalo": "korpisalo",
-        "korpi": "korpisalo",
-
-        "darcy kuemper": "kuemper",
-        "darcy kemper": "kuemper",
-        "d. kuemper": "kuemper",
-        "d. kemper": "kuemper",
-        "d kuemper": "kuemper",
-        "d kemper": "kuemper",
-        "kemper": "kuemper",
-        "keumper": "kuemper",
-        "kempur": "kuemper",
-        "darcey kuemper": "kuemper",
-        "darcy kuemper (col)": "kuemper",
-
-        "kevin lankinen": "lankinen",
-        "k. lankinen": "lankinen",
-        "lankinen": "lankinen",
-
-        "robin lehner": "lehner",
-        "r. lehner": "lehner",
-        "r lehner": "lehner",
-        "lehener": "lehner",
-        "lehner (vgk)": "lehner",
-        "lehrer": "lehner",
-        "robin lehner (wgk)": "lehner",
-        "lehnar": "lehner",
-        "lenher": "lehner",
-        "robin l": "lehner",
-        "robin l.": "lehner",
-        "robin lehner (vgk)": "lehner",
-        "robin lehrner": "lehner",
-        "robyn l": "lehner",
-
-        "jacob markstrom": "markstrom",
-        "jacob markström": "markstrom",
-        "jacob marksrom": "markstrom",
-        "j. markstrom": "markstrom",
-        "j. markström": "markstrom",
-        "j markstrom": "markstrom",
-        "j markström": "markstrom",
-        "markström": "markstrom",
-        "jakob markstrom": "markstrom",
-        "marsktrom": "markstrom",
-        "jakov markstom": "markstrom",
-        "markstrom (cgy)": "markstrom",
-        "markstrom (cal)": "markstrom",
-        "markstron": "markstrom",
-        "markstrum": "markstrom",
-        "j.markstrom": "markstrom",
-        "jacob m": "markstrom",
-        "jacob markstrom (cgy)": "markstrom",
-        "jakob markstom": "markstrom",
-        "jakob markstorm": "markstrom",
-        "j.markström": "markstrom",
-        "jacob markström (cgy)": "markstrom",
-
-        "elvis merzlikins": "merzlikins",
-        "e. merzlikins": "merzlikins",
-        "e merzlikins": "merzlikins",
-        "merzlinkis": "merzlikins",
-
-        "matt murray": "murray",
-        "m. murray": "murray",
-        "m murray": "murray",
-
-        "alex nedeljkovic": "nedeljkovic",
-        "a. nedeljkovic": "nedeljkovic",
-        "a nedeljkovic": "nedeljkovic",
-        "nedjelkovic": "nedeljkovic",
-        "nedelijkovic": "nedeljkovic",
-        "nedeljkovich": "nedeljkovic",
-        "alex nedelkjovic": "nedeljkovic",
-
-        "calvin petersen": "petersen",
-        "calvin peterson": "petersen",
-        "cal petersen": "petersen",
-        "cal peterson": "petersen",
-        "c. petersen": "petersen",
-        "c. peterson": "petersen",
-        "c petersen": "petersen",
-        "c peterson": "petersen",
-        "peterson": "petersen",
-        "cal pederson": "petersen",
-
-        "carey price": "price",
-        "c. price": "price",
-        "c price": "price",
-
-        "james reimer": "reimer",
-        "james riemer": "reimer",
-        "j. reimer": "reimer",
-        "j. riemer": "reimer",
-        "j reimer": "reimer",
-        "j riemer": "reimer",
-        "riemer": "reimer",
-
-        "juuse saros": "saros",
-        "juicy saros": "saros",
-        "juice saros": "saros",
-        "j. saros": "saros",
-        "j saros": "saros",
-        "jusee saros": "saros",
-        "sarros": "saros",
-        "suros": "saros",
-        "soros": "saros",
-        "saaros": "saros",
-        "saros (nsh)": "saros",
-        "jusse saros": "saros",
-        "jussi saaros": "saros",
-        "jussi sarros": "saros",
-        "jusso saros": "saros",
-        "juuso saros": "saros",
-
-        "igor shesterkin": "shesterkin",
-        "i. shesterkin": "shesterkin",
-        "i shesterkin": "shesterkin",
-        "shesterskin": "shesterkin",
-        "shersterkin": "shesterkin",
-        "sheshterkin": "shesterkin",
-        "shestyorkin": "shesterkin",
-        "igor s": "shesterkin",
-        "igor shersterkin": "shesterkin",
-        "igor sherstorkin": "shesterkin",
-        "igor sheshterkin": "shesterkin",
-
-        "mike smith": "smith",
-        "m. smith": "smith",
-        "m smith": "smith",
-
-        "cam talbot": "talbot",
-        "c. talbot": "talbot",
-        "c talbot": "talbot",
-
-        "linus ullmark": "ullmark",
-        "linus ulmark": "ullmark",
-        "l. ullmark": "ullmark",
-        "l. ulmark": "ullmark",
-        "l ullmark": "ullmark",
-        "l ulmark": "ullmark",
-        "ulmark": "ullmark",
-
-        "semyon varlamov": "varlamov",
-        "varlarmov": "varlamov",
-
-        "andrei vasilevskiy": "vasilevskiy",
-        "andre vasilevskiy": "vasilevskiy",
-        "andrei vasilevski": "vasilevskiy",
-        "a. vasilevskiy": "vasilevskiy",
-        "a vasilevskiy": "vasilevskiy",
-        "vasilskiey": "vasilevskiy",
-        "vasi": "vasilevskiy",
-        "vasy": "vasilevskiy",
-        "andre vaislevskiy": "vasilevskiy",
-        "vaislevskiy": "vasilevskiy",
-        "andre vasileskiy": "vasilevskiy",
-        "vasileskiy": "vasilevskiy",
-        "andre vassilevsky": "vasilevskiy",
-        "vassilevsky": "vasilevskiy",
-        "andrei vaselevskiy": "vasilevskiy",
-        "vaselevskiy": "vasilevskiy",
-        "andrei vasilesvksiy (tbl)": "vasilevskiy",
-        "andrei vaseilevskiy (tbl)": "vasilevskiy",
-        "vasilevakiy": "vasilevskiy",
-        "visilievsky": "vasilevskiy",
-        "vasilevaky": "vasilevskiy",
-        "andrei vasilevskiy": "vasilevskiy",
-        "vasielevskiy": "vasilevskiy",
-        "andrei vasileviskiy": "vasilevskiy",
-        "vasilevskyi": "vasilevskiy",
-        "vasilevslky": "vasilevskiy",
-        "andrei vasilievskey": "vasilevskiy",
-        "andrei vasilesvkiy": "vasilevskiy",
-        "andrei vasiliesky": "vasilevskiy",
-        "vasilevkiy": "vasilevskiy",
-        "andrei vasilesvkiy (tbl)": "vasilevskiy",
-        "andrei vasilevskiy (tbl)": "vasilevskiy",
-        "vazilevskiy": "vasilevskiy",
-        "andrea vasilevsky": "vasilevskiy",
-        "vaslievskiy": "vasilevskiy",
-        "vasilievski": "vasilevskiy",
-        "vas": "vasilevskiy",
-        "vasilievsky": "vasilevskiy",
-        "andrei vasilevskey": "vasilevskiy",
-        "a vasilevsky": "vasilevskiy",
-        "a.vasilevsky": "vasilevskiy",
-        "anderi vasilevskiy": "vasilevskiy",
-        "andre vasileskly": "vasilevskiy",
-        "andre vasilevesky": "vasilevskiy",
-        "andre vasilevsky": "vasilevskiy",
-        "andrei v": "vasilevskiy",
-        "andrei vasikevski": "vasilevskiy",
-        "andrei vasilevesky": "vasilevskiy",
-        "andrei vasilevsky": "vasilevskiy",
-        "andrei vasilievskiy": "vasilevskiy",
-        "andrei vasilievsky": "vasilevskiy",
-        "andrei vasiliievski": "vasilevskiy",
-        "andrei vasivleskiy": "vasilevskiy",
-        "andrei vesalevskey": "vasilevskiy",
-        "andrej vasilevski": "vasilevskiy",
-        "andrew vasilevskiy": "vasilevskiy",
-        "andrew vasilevskiy (tbl)": "vasilevskiy",
-        "andrew vasilevsky": "vasilevskiy",
-        "andriy vasilevskiy": "vasilevskiy",
-        "vaselevski": "vasilevskiy",
-        "vaselevskii": "vasilevskiy",
-        "vasi tb": "vasilevskiy",
-        "vasielevski": "vasilevskiy",
-        "vasikevskiy": "vasilevskiy",
-        "vasile skin": "vasilevskiy",
-        "vasilekskiy": "vasilevskiy",
-        "vasileski": "vasilevskiy",
-        "vasilesky": "vasilevskiy",
-        "vasilesky (tb)": "vasilevskiy",
-        "vasilesvkiy": "vasilevskiy",
-        "vasilevesky": "vasilevskiy",
-        "vasilevksiy": "vasilevskiy",
-        "vasilevskey": "vasilevskiy",
-        "vasilevski": "vasilevskiy",
-        "vasilevski (tbl)": "vasilevskiy",
-        "vasilevskiey": "vasilevskiy",
-        "vasilevskiy (tbl)": "vasilevskiy",
-        "vasilevskiy hellebuyck": "vasilevskiy",
-        "vasilevsky": "vasilevskiy",
-        "vasiliesky": "vasilevskiy",
-        "vasiljevsky": "vasilevskiy",
-        "vasilveskiy": "vasilevskiy",
-        "vasilvesky": "vasilevskiy",
-        "vaslevskiy": "vasilevskiy",
-        "vaslievsky": "vasilevskiy",
-        "vasylevski": "vasilevskiy",
-
-        "vitek vanecek": "vanecek",
-        "vitek vanacek": "vanecek",
-        "v. vanecek": "vanecek",
-        "v. vanacek": "vanecek",
-        "v vanecek": "vanecek",
-        "v vanacek": "vanecek",
-        "vanacek": "vanecek",
+    standardize_question(df, q4, alias_index["q4"])
 
-
-    }
+    if resolve_ambiguous:
+        armstrong_check(df)
     q5 = ['q5a1', 'q5a2', 'q5a3', 'q5a4', 'q5a5']
-    for question in q5:
-        print(f"Standardizing the answers for column {question}")
-        # Replace by various names of goalies
-        df[question].replace(to_replace=goalie_dict, value=None, inplace=True)
-        print("Done!")
-    # Dictionary of variations of rookie names for standardization
-    rookie_dict = {
-        "0": np.nan,
-
-        "matty beniers": "beniers",
-        "beniers": "beniers",
-        "m. beniers": "beniers",
-
-        "matthew boldy": "boldy",
-        "mattew boldy": "boldy",
-        "matt boldy": "boldy",
-        "boldy": "boldy",
-        "m. boldy": "boldy",
-        "m.boldy": "boldy",
-        "m boldy": "boldy",
-
-        "evan bouchard": "bouchard",
-        "bouchard": "bouchard",
-        "e. bouchard": "bouchard",
-        "e bouchard": "bouchard",
-
-        "michael bunting": "bunting",
-        "bunting": "bunting",
-        "m bunting": "bunting",
-
-        "quinton byfield": "byfield",
-        "byfield": "byfield",
-        "q byfield": "byfield",
-        "q. byfield": "byfield",
-        "q.byfield": "byfield",
-        "quentin byfield": "byfield",
-        "quinton byfeld": "byfield",
-        "quiton byfield": "byfield",
-        "quninton byfield": "byfield",
-
-        "bowen byram": "byram",
-        "byram": "byram",
-        "bowan byram": "byram",
-        "bowen bryan": "byram",
-        "bowen byran": "byram",
-        "b. byram": "byram",
-        "bo byram": "byram",
-        "bynam": "byram",
-        "byram (col)": "byram",
-        "byrom": "byram",
-        "byrum": "byram",
-
-        "alexandre carrier": "carrier",
-        "alexander carrier": "carrier",
-        "alex carrier": "carrier",
-        "carrier": "carrier",
-        "a. carrier": "carrier",
-
-        "cole caufield": "caufield",
-        "caufield": "caufield",
-        "c caufield": "caufield",
-        "c caulfield": "caufield",
-        "c. caufield": "caufield",
-        "c. caulfield": "caufield",
-        "c.caufield": "caufield",
-        "calufield": "caufield",
-        "canfield": "caufield",
-        "caufeild": "caufield",
-        "caufeld": "caufield",
-        "caufield (mon)": "caufield",
-        "caufield (mtl)": "caufield",
-        "caufiled": "caufield",
-        "caufiueld": "caufield",
-        "cauflield": "caufield",
-        "caulfeld": "caufield",
-        "caulfied": "caufield",
-        "caulfield": "caufield",
-        "caulfired": "caufield",
-        "claufield": "caufield",
-        "coke caufeild": "caufield",
-        "cole c": "caufield",
-        "cole canfield": "caufield",
-        "cole caufeild": "caufield",
-        "cole caufeild (mtl)": "caufield",
-        "cole caufied": "caufield",
-        "cole caufield (mtl)": "caufield",
-        "cole caulfield": "caufield",
-        "cole claufield": "caufield",
-        "goal caufield": "caufield",
-
-        "yegor chinakhov": "chinakhov",
-        "chinakhov": "chinakhov",
-        "chinakov": "chinakhov",
-
-        "jamie drysdale": "drysdale",
-        "drysdale": "drysdale",
-        "jamie  drysdale": "drysdale",
-        "jaime drysdale": "drysdale",
-        "j. drysdale": "drysdale",
-        "drysdale (ana)": "drysdale",
-
-        "william eklund": "eklund",
-        "eklund": "eklund",
-        "ekland": "eklund",
-        "w. eklund": "eklund",
-        "englund": "eklund",
-
-        "filip gustavsson": "gustavsson",
-        "gustavsson": "gustavsson",
-        "f. gustavsson": "gustavsson",
-
-        "cal foote": "c foote",
-        "foote": "c foote",
-
-        "alexander holtz": "holtz",
-        "alexandre holtz": "holtz",
-        "alex holtz": "holtz",
-        "holtz": "holtz",
-        "a. holtz": "holtz",
-        "a.holtz": "holtz",
-        "a holtz": "holtz",
-
-        "jacob peterson": "peterson",
-        "peterson": "peterson",
-
-        "seth jarvis": "jarvis",
-        "jarvis": "jarvis",
-
-        "kaapo kahkonen": "kahkonen",
-        "kahkonen": "kahkonen",
-
-        "arthur kaliyev": "kaliyev",
-        "kaliyev": "kaliyev",
-        "a kaliyev": "kaliyev",
-
-        "knight": "knight",
-        "specer knight": "knight",
-        "spencer k": "knight",
-        "spencer knight": "knight",
-        "spencer knight (fla)": "knight",
-        "spencer knightr": "knight",
-        "spenser knight": "knight",
-        "s knight": "knight",
-        "s. knight": "knight",
-        "s.knight": "knight",
-        "knight (fla)": "knight",
-        "knight (spencer)": "knight",
-
-        "vitaly kravtsov": "kravtsov",
-        "kravtsov": "kravtsov",
-        "kravstov": "kravtsov",
-
-        "peyton krebs": "krebs",
-        "krebs": "krebs",
-
-        "hendrix lapierre": "lapierre",
-        "lapierre": "lapierre",
-
-        "anton lundell": "lundell",
-        "lundell": "lundell",
-
-        "connor mcmichael": "mcmichael",
-        "mcmichael": "mcmichael",
-        "c mcmichael": "mcmichael",
-
-        "dawson mercer": "mercer",
-        "mercer": "mercer",
-        "dawson mercer baby!": "mercer",
-
-        "nedeljkovic": "nedeljkovic",
-        "ned in drw": "nedeljkovic",
-        "nedejlkovic": "nedeljkovic",
-        "nedelijokic": "nedeljkovic",
-        "nedeljkovich": "nedeljkovic",
-        "nedelkovic": "nedeljkovic",
-        "nedelkovich": "nedeljkovic",
-        "nedjelkovic": "nedeljkovic",
-        "nejdelkovic": "nedeljkovic",
-        "a nedjelkovic": "nedeljkovic",
-        "a. nedeljkovic": "nedeljkovic",
-        "alex nedeljkovic": "nedeljkovic",
-        "alex nedeljkovic (det)": "nedeljkovic",
-        "alex nedjelkovic": "nedeljkovic",
-
-        "jake neighbours": "neighbours",
-        "neighbours": "neighbours",
-        "neighbors": "neighbours",
-
-        "alex newhook": "newhook",
-        "newhook": "newhook",
-        "a. newhook": "newhook",
-
-        "nils lundkvist": "lundkvist",
-        "lundkvist": "lundkvist",
-        "nils lundquist": "lundkvist",
-
-        "owen power": "power",
-        "power": "power",
-        "o. power": "power",
-
-        "cole perfetti": "perfetti",
-        "perfetti": "perfetti",
-
-        "john peterka": "peterka",
-        "peterka": "peterka",
-
-        "shane pinto": "pinto",
-        "pinto": "pinto",
-        "shane pinkto": "pinto",
-        "s.pinto": "pinto",
-        "sane pinto": "pinto",
-
-        "vasily podkolzin": "podkolzin",
-        "podkolzin": "podkolzin",
-        "v. podkolzin": "podkolzin",
-        "valery podkolzin": "podkolzin",
-        "vasili podkolzin": "podkolzin",
-        "vasiliy podkolzin": "podkolzin",
-        "vasily p": "podkolzin",
-        "vasily podklzin": "podkolzin",
-        "vasily podzilkin": "podkolzin",
-        "vasily podzkolin": "podkolzin",
-        "podkolzn": "podkolzin",
-        "podzolkin": "podkolzin",
-
-        "taylor raddysh": "raddysh",
-        "raddysh": "raddysh",
-
-        "jack rathbone": "rathbone",
-        "rathbone": "rathbone",
-
-        "lucas raymond": "raymond",
-        "raymond": "raymond",
-        "lucas raymond (det)": "raymond",
-        "raymond (det)": "raymond",
-
-        "lukas reichel": "reichel",
-        "reichel": "reichel",
-
-        "nick robertson": "robertson",
-        "robertson": "robertson",
-        "n robertson": "robertson",
-
-        "marco rossi": "rossi",
-        "rossi": "rossi",
-        "m rossi": "rossi",
-
-        "scott perunovich": "perunovich",
-        "perunovich": "perunovich",
-
-        "moritz seider": "seider",
-        "seider": "seider",
-        "mo seider": "seider",
-        "moreitz seider": "seider",
-        "moritz seider (det)": "seider",
-        "moritz sieder": "seider",
-        "m. seider": "seider",
-        "m seider": "seider",
-        "m.seider": "seider",
-        "mortiz seider": "seider",
-        "zeider": "seider",
-        "seider (det)": "seider",
-        "sieder": "seider",
-        "seidel": "seider",
-        "seoder": "seider",
-
-        "cole sillinger": "sillinger",
-        "sillinger": "sillinger",
-        "c. sillinger": "sillinger",
-
-        "jeremy swayman": "swayman",
-        "swayman": "swayman",
-        "jeremey swayman": "swayman",
-        "jeremy s": "swayman",
-        "swaymam": "swayman",
-
-        "vladimir tkachev": "tkachev",
-        "tkachev": "tkachev",
-        "tkachyov": "tkachev",
-
-        "philip tomasino": "tomasino",
-        "tomasino": "tomasino",
-        "tomassino": "tomasino",
-
-        "trevor zegras": "zegras",
-        "zegras": "zegras",
-        "travis zegras": "zegras",
-        "trevor segras": "zegras",
-        "trevor z": "zegras",
-        "trevor zagras": "zegras",
-        "trevor zegas": "zegras",
-        "trevor zegras (ana)": "zegras",
-        "trevor zegres": "zegras",
-        "trevor zigras": "zegras",
-        "t zegras": "zegras",
-        "t. zegras": "zegras",
-        "t.zegras": "zegras",
-        "zebras": "zegras",
-        "zegra": "zegras",
-        "segras": "zegras",
-        "zegras (ana)": "zegras",
-        "zegres": "zegras",
-        "zeigras": "zegras",
-        "zergas": "zegras",
-        "zehra’s": "zegras",
-
-    }
+    standardize_question(df, q5, alias_index["q5"])
     q6 = ['q6a1', 'q6a2', 'q6a3', 'q6a4', 'q6a5']
-    for question in q6:
-        print(f"Standardizing the answers for column {question}")
-        # Replace by various names of calder candidates
-        df[question].replace(to_replace=rookie_dict, value=None, inplace=True)
-        print("Done!")
-    # Dictionary of variations of defense names for standardization
-    dmen_dict = {
-        "0": np.nan,
-
-        "sebastian aho": "aho (d)",
-        "aho (d)": "aho (d)",
-
-        "tyson barrie": "barrie",
-        "barrie": "barrie",
-
-        "brent burns": "burns",
-        "burns": "burns",
-
-        "john carlson": "carlson",
-        "carlson": "carlson",
-        "carlson (wsh)": "carlson",
-        "j. carlson": "carlson",
-        "j. carlson (wsh)": "carlson",
-
-        "thomas chabot": "chabot",
-        "chabot": "chabot",
-
-        "jakob chychrun": "chychrun",
-        "chychrun": "chychrun",
-        "jacob chychrun": "chychrun",
-
-        "rasmus dahlin": "dahlin",
-        "dahlin": "dahlin",
-
-        "drew doughty": "doughty",
-        "doughty": "doughty",
-
-        "aaron ekblad": "ekblad",
-        "ekblad": "ekblad",
-
-        "mario ferraro": "ferraro",
-        "ferraro": "ferraro",
-
-        "adam fox": "fox",
-        "fox": "fox",
-        "adam fox (nyr)": "fox",
-        "andy fox": "fox",
-        "a fox": "fox",
-        "a. fox": "fox",
-        "a.fox": "fox",
-        "adam f": "fox",
-        "fox (nyr)": "fox",
-
-        "mark giordano": "giordano",
-        "giordano": "giordano",
-
-        "samuel girard": "girard",
-        "girard": "girard",
-        "sam girard": "girard",
-
-        "dougie hamilton": "hamilton",
-        "hamilton": "hamilton",
-        "doug hamilton": "hamilton",
-        "douggie hamilton": "hamilton",
-        "dougie": "hamilton",
-        "dougie hamilton (njd)": "hamilton",
-        "d hamilton": "hamilton",
-        "d hamlton": "hamilton",
-        "d. hamilton": "hamilton",
-        "d.hamilton": "hamilton",
-        "hamiliton": "hamilton",
-        "hamilston": "hamilton",
-        "hamiltom": "hamilton",
-        "hamilton (njd)": "hamilton",
-
-        "noah hanifin": "hanifin",
-        "hanifin": "hanifin",
-
-        "miro heiskanen": "heiskanen",
-        "heiskanen": "heiskanen",
-        "miro heskainen": "heiskanen",
-        "miro heskinen": "heiskanen",
-        "miro hieskanan": "heiskanen",
-        "m heiskenan": "heiskanen",
-        "m. heiskanen": "heiskanen",
-        "heiskenan": "heiskanen",
-        "heiskenen": "heiskanen",
-        "heiskenin": "heiskanen",
-        "heiskinen": "heiskanen",
-        "heskinan": "heiskanen",
-        "heskinen": "heiskanen",
-        "hieskanen": "heiskanen",
-
-        "quinn hughes": "q hughes",
-        "hughes": "q hughes",
-        "quin hughes": "q hughes",
-        "quinn h": "q hughes",
-        "q hughes": "q hughes",
-        "q. hughes": "q hughes",
-        "q.hughes": "q hughes",
-        "hughes (q)": "q hughes",
-
-        "roman josi": "josi",
-        "josi": "josi",
-        "roman jossi": "josi",
-        "roman jossie": "josi",
-        "r. josi": "josi",
-        "r.josi": "josi",
-
-        "erik karlsson": "karlsson",
-        "karlsson": "karlsson",
-        "e. karlsson": "karlsson",
-
-        "duncan keith": "keith",
-        "keith": "keith",
-
-        "kris letang": "letang",
-        "letang": "letang",
-
-        "cale makar": "makar",
-        "makar": "makar",
-        "cale makar (col)": "makar",
-        "cale maker": "makar",
-        "cole makar": "makar",
-        "cole makar (col)": "makar",
-        "cole maker": "makar",
-        "cal makar": "makar",
-        "cale m": "makar",
-        "c makar": "makar",
-        "c.makar": "makar",
-        "c. makar": "makar",
-        "makar (col)": "makar",
-        "makarov": "makar",
-        "maker": "makar",
-        "makes": "makar",
-        "makkar": "makar",
-        "całe makar": "makar",
-
-        "charlie mcavoy": "mcavoy",
-        "mcavoy": "mcavoy",
-        "charlie macavoy": "mcavoy",
-        "charlie macvoy": "mcavoy",
-        "charlie mcavoy (bos)": "mcavoy",
-        "charlie m": "mcavoy",
-        "c mcavoy": "mcavoy",
-        "c. mcavoy": "mcavoy",
-        "mcavoy (bos)": "mcavoy",
-        "macavoy": "mcavoy",
-        "mccavoy": "mcavoy",
-        "mccovoy": "mcavoy",
-        "mcevoy": "mcavoy",
-        "mcovoy": "mcavoy",
-
-        "jake muzzin": "muzzin",
-        "muzzin": "muzzin",
-
-        "darnell nurse": "nurse",
-        "nurse": "nurse",
-        "nurse (edm)": "nurse",
-
-        "colton paryako": "parayko",
-        "parakyo": "parayko",
-
-        "adam pelech": "pelech",
-        "pelech": "pelech",
-
-        "jeff petry": "petry",
-        "petry": "petry",
-        "perry": "petry",
-
-        "alex pietrangelo": "pietrangelo",
-        "pietrangelo": "pietrangelo",
-        "alex pieterangelo": "pietrangelo",
-        "alex pieteranglo": "pietrangelo",
-        "a pietrangelo": "pietrangelo",
-        "peitrangelo": "pietrangelo",
-        "peterangelo": "pietrangelo",
-        "petro": "pietrangelo",
-        "piatrangelo": "pietrangelo",
-        "pieterangelo": "pietrangelo",
-        "pietranglo": "pietrangelo",
-        "pietriangelo": "pietrangelo",
-
-        "ivan provorov": "provorov",
-        "provorov": "provorov",
-
-        "ryan pulock": "pulock",
-        "pulock": "pulock",
-
-        "morgan rielly": "rielly",
-        "rielly": "rielly",
-        "morgan reilly": "rielly",
-        "reilly": "rielly",
-
-        "mikhail sergachev": "sergachev",
-        "sergachev": "sergachev",
-
-        "seth jones": "jones",
-        "jones": "jones",
-        "seth j": "jones",
-        "s jones": "jones",
-        "s. jones": "jones",
-        "(seth) jones": "jones",
-
-        "shea theodore": "theodore",
-        "theodore": "theodore",
-        "shea theadore": "theodore",
-        "sheatheodore": "theodore",
-        "s. theodore": "theodore",
-        "theadore": "theodore",
-        "thedore": "theodore",
-        "theordore": "theodore",
-
-        "jaccob slavin": "slavin",
-        "slavin": "slavin",
-        "jacob slavin": "slavin",
-        "slavvin": "slavin",
-
-        "jared spurgeon": "spurgeon",
-        "spurgeon": "spurgeon",
-
-        "devon toews": "d toews",
-        "toews": "d toews",
-        "d. toews": "d toews",
-
-        "victor hedman": "hedman",
-        "hedman": "hedman",
-        "victim hedman": "hedman",
-        "victor h": "hedman",
-        "victor headman": "hedman",
-        "victor hedamn": "hedman",
-        "victor hedman (tbl)": "hedman",
-        "victor hedmen": "hedman",
-        "victor herman": "hedman",
-        "viktor hedman": "hedman",
-        "viktor heman": "hedman",
-        "v hedman": "hedman",
-        "v. hedman": "hedman",
-        "v.hedman": "hedman",
-        "headman": "hedman",
-        "herman": "hedman",
-        "hedmam": "hedman",
-        "hedman (tb)": "hedman",
-        "hedman (tbl)": "hedman",
-        "hedmon": "hedman",
-        "heldman": "hedman",
-
-        "mackenzie weegar": "weegar",
-        "weegar": "weegar",
-        "m. weegar": "weegar",
-        "m.weegar": "weegar",
-        "weeger": "weegar",
-        "wegar": "weegar",
-
-        "zach werenski": "werenski",
-        "werenski": "werenski",
-    }
+    standardize_question(df, q6, alias_index["q6"])
     q7 = ['q7a1', 'q7a2', 'q7a3', 'q7a4', 'q7a5']
-    for question in q7:
-        print(f"Standardizing the answers for column {question}")
-        # Replace by various names of norris candidates
-        df[question].replace(to_replace=dmen_dict, value=None, inplace=True)
-        print("Done!")
-    # Dictionary of variations of hart candidate names for standardization
-    hart_dict = {
-        "0": np.nan,
-
-        "sebastian aho": "aho (f)",
-        "aho": "aho (f)",
-        "aho (car)": "aho (f)",
-
-        "aleksander barkov": "barkov",
-        "barkov": "barkov",
-        "alexander barkov": "barkov",
-        "alexander barskov": "barkov",
-        "alexsander barkov": "barkov",
-        "aleksandar barkov": "barkov",
-        "aleksander barkkov": "barkov",
-        "aleksandr barkov": "barkov",
-        "alex barkov": "barkov",
-        "alex barkov (fla)": "barkov",
-        "a. barkov": "barkov",
-        "barkiv": "barkov",
-        "barkov (fla)": "barkov",
-        "sasha barkov": "barkov",
-        "barlow": "barkov",
-
-        "mathew barzal": "barzal",
-        "barzal": "barzal",
-        "matthew barzal": "barzal",
-
-        "sean coutourier": "coutourier",
-        "couturier": "coutourier",
-
-        "sidney crosby": "crosby",
-        "crosby": "crosby",
-        "sidney c": "crosby",
-        "sydney crosby": "crosby",
-        "s crosby": "crosby",
-        "crosby (pit)": "crosby",
-
-        "leon draisaitl": "draisaitl",
-        "draisaitl": "draisaitl",
-        "leon draisaital": "draisaitl",
-        "leon draisaitil": "draisaitl",
-        "leon draisaitl (edm)": "draisaitl",
-        "leon draisatl": "draisaitl",
-        "leon draisitl": "draisaitl",
-        "leon draistaitl": "draisaitl",
-        "leon drasaitl": "draisaitl",
-        "leon dreisaitl": "draisaitl",
-        "leon d": "draisaitl",
-        "leon d.": "draisaitl",
-        "l draisaitl": "draisaitl",
-        "l. draisaitl": "draisaitl",
-        "leon": "draisaitl",
-        "draisaitl (edm)": "draisaitl",
-        "draisaitle": "draisaitl",
-        "draisatil": "draisaitl",
-        "draisatl": "draisaitl",
-        "draisetal": "draisaitl",
-        "draisital": "draisaitl",
-        "draisitl": "draisaitl",
-        "draistail": "draisaitl",
-        "draistaitl": "draisaitl",
-        "draistatl": "draisaitl",
-        "draistl": "draisaitl",
-        "drasaitl": "draisaitl",
-        "drasital": "draisaitl",
-        "dreisaitl": "draisaitl",
-        "driasaittl": "draisaitl",
-        "drai": "draisaitl",
-        "draisailt": "draisaitl",
-        "draisaital": "draisaitl",
-        "draisaitil": "draisaitl",
-
-        "aaron ekblad": "ekblad",
-        "ekblad": "ekblad",
-
-        "marc andre fleury": "fleury",
-        "fleury": "fleury",
-
-        "adam fox": "fox",
-        "fox": "fox",
-
-        "victor hedman": "hedman",
-        "hedman": "hedman",
-
-        "connor hellebuyck": "hellebuyck",
-        "hellebuyck": "hellebuyck",
-        "connor hellyebuck": "hellebuyck",
-        "c. hellebuyck": "hellebuyck",
-        "hellebuck": "hellebuyck",
-
-        "roope hintz": "hintz",
-        "hintz": "hintz",
-
-        "jack hughes": "hughes",
-        "j hughes": "hughes",
-
-        "jonathan huberdeau": "huberdeau",
-        "huberdeau": "huberdeau",
-
-        "seth jones": "jones",
-        "s.jones": "jones",
-
-        "patrick kane": "kane",
-        "kane": "kane",
-        "kane (patrick)": "kane",
-        "patty kane": "kane",
-        "pkane": "kane",
-        "p kane": "kane",
-        "p. kane": "kane",
-        "p. kane (initial probably unnecessary)": "kane",
-        "p.kane": "kane",
-        "kane88": "kane",
-
-        "kirill kaprizov": "kaprizov",
-        "kaprizov": "kaprizov",
-        "kiril kaprizov": "kaprizov",
-        "kirill kaprisov": "kaprizov",
-        "kaprisov": "kaprizov",
-        "karprizov": "kaprizov",
-        "kiprizov": "kaprizov",
-
-        "nikita kucherov": "kucherov",
-        "kucherov": "kucherov",
-        "nikita kucharov": "kucherov",
-        "nikita kucherov (tbl)": "kucherov",
-        "nikita kuscherov": "kucherov",
-        "n kucherov": "kucherov",
-        "n. kucherov": "kucherov",
-        "kucherov (tbl)": "kucherov",
-        "kuchorov": "kucherov",
-        "kuckerov": "kucherov",
-        "kusherov": "kucherov",
-
-        "anders lee": "lee",
-        "lee": "lee",
-
-        "nathan mackinnon": "mackinnon",
-        "mackinnon": "mackinnon",
-        "nathan mackinnon (col)": "mackinnon",
-        "nathan mackinon": "mackinnon",
-        "nathan makinnon": "mackinnon",
-        "nathan mckinnion": "mackinnon",
-        "nathan mckinnon": "mackinnon",
-        "nate mackinnon": "mackinnon",
-        "n mackinnon": "mackinnon",
-        "n. mackinnon": "mackinnon",
-        "n. mackinon": "mackinnon",
-        "n.mackinnon": "mackinnon",
-        "nathan m": "mackinnon",
-        "mackininon": "mackinnon",
-        "mackinnin": "mackinnon",
-        "makinnon": "mackinnon",
-        "mackinnion": "mackinnon",
-        "mackinnon (col)": "mackinnon",
-        "mackinon": "mackinnon",
-        "mckinnon": "mackinnon",
-        "mckinnon (col)": "mackinnon",
-        "mckinon": "mackinnon",
-        "mckìnnon": "mackinnon",
-
-        "cale makar": "makar",
-        "makar": "makar",
-        "c. makar": "makar",
-
-        "brad marchand": "marchand",
-        "marchand": "marchand",
-        "b marchand": "marchand",
-
-        "mitch marner": "marner",
-        "marner": "marner",
-        "mitchell marner": "marner",
-        "m. marner": "marner",
-
-        "auston matthews": "matthews",
-        "matthews": "matthews",
-        "austin matthews": "matthews",
-        "austen matthews": "matthews",
-        "austin mathews": "matthews",
-        "auston mathews": "matthews",
-        "auston matthews (tor)": "matthews",
-        "austonmatthews": "matthews",
-        "austin m": "matthews",
-        "a matthews": "matthews",
-        "a. matthews": "matthews",
-        "a.matthews": "matthews",
-        "matthews (austin)": "matthews",
-        "matthews (tor)": "matthews",
-        "mathews": "matthews",
-        "matthew": "matthews",
-        "matthew's": "matthews",
-        "auston matthew’s": "matthews",
-        "matthew’s": "matthews",
-
-        "connor mcdavid": "mcdavid",
-        "mcdavid": "mcdavid",
-        "conner mcdavid": "mcdavid",
-        "connor m david": "mcdavid",
-        "connor mcdavid (edm)": "mcdavid",
-        "conor mcdavid": "mcdavid",
-        "connor m": "mcdavid",
-        "mcdaddy": "mcdavid",
-        "c mcdavid": "mcdavid",
-        "c. mcdavid": "mcdavid",
-        "c.mcdavid": "mcdavid",
-        "macdavid": "mcdavid",
-        "macdavid (edm)": "mcdavid",
-        "mcdavid (edm)": "mcdavid",
-        "mcjesus": "mcdavid",
-        "david": "mcdavid",
-
-        "ryan o'reilly": "o'reilly",
-        "o'reilly": "o'reilly",
-
-        "alex ovechkin": "ovechkin",
-        "ovechkin": "ovechkin",
-
-        "artemi panarin": "panarin",
-        "panarin": "panarin",
-        "artem panarin": "panarin",
-        "artemi panerin": "panarin",
-        "artemis panarin": "panarin",
-        "artermi panarin": "panarin",
-        "artrmi panarin": "panarin",
-        "a.panarin": "panarin",
-        "panerin": "panarin",
-        "panirin": "panarin",
-        "pannarin": "panarin",
-        "planarian": "panarin",
-        "bread": "panarin",
-
-        "david pastrnak": "pastrnak",
-        "pastrnak": "pastrnak",
-        "david pasternak": "pastrnak",
-        "david pastranak": "pastrnak",
-        "d pastrnak": "pastrnak",
-        "pastranak": "pastrnak",
-
-        "elias pettersson": "pettersson",
-        "pettersson": "pettersson",
-        "elias petterson": "pettersson",
-        "e. petterson": "pettersson",
-        "petterrson": "pettersson",
-        "pettersen": "pettersson",
-
-        "brayden point": "point",
-        "point": "point",
-        "b.point": "point",
-
-        "mikko rantanen": "rantanen",
-        "rantanen": "rantanen",
-        "m. rantanen": "rantanen",
-
-        "juuse saros": "saros",
-        "saros": "saros",
-
-        "mark scheifele": "scheifele",
-        "scheifele": "scheifele",
-
-        "mark stone": "stone",
-        "stone": "stone",
-        "m.stone": "stone",
-
-        "andrei vasilevskiy": "vasilevskiy",
-        "vasilevskiy": "vasilevskiy",
-        "andrei v": "vasilevskiy",
-        "andrei vasilevsky": "vasilevskiy",
-        "andrei vasilievskiy": "vasilevskiy",
-        "vasilevsky": "vasilevskiy",
-        "vasi": "vasilevskiy",
-        "vasilevski": "vasilevskiy",
-
-        "mika zibanejad": "zibanejad",
-        "zibanejad": "zibanejad",
-
-    }
+    standardize_question(df, q7, alias_index["q7"])
     q8 = ['q8a1', 'q8a2', 'q8a3', 'q8a4', 'q8a5']
-    for question in q8:
-        print(f"Standardizing the answers for column {question}")
-        # Replace by various names of hart candidates
-        df[question].replace(to_replace=hart_dict, value=None, inplace=True)
-        print("Done!")
-    # Dictionary of variations of players to be traded names for standardization
-    trade_dict = {
-        "0": np.nan,
-
-        "michael amadio": "amadio",
-        "amadio": "amadio",
-
-        "craig anderson": "anderson",
-        "c anderson": "c anderson",
-
-        "andreas athanasiou": "athanasiou",
-        "athanasiou": "athanasiou",
-
-        "jay beagle": "beagle",
-        "beagle": "beagle",
-
-        "jonathan bernier": "bernier",
-        "bernier": "bernier",
-
-        "matthew benning": "benning",
-        "benning": "benning",
-
-        "tyler bertuzzi": "bertuzzi",
-        "bertuzzi": "bertuzzi",
-        "t. bertuzzi": "bertuzzi",
-
-        "alex biega": "biega",
-        "biega": "biega",
-
-        "anders bjork": "bjork",
-        "bjork": "bjork",
-
-        "colin blackwell": "blackwell",
-        "blackwell": "blackwell",
-
-        "sergei bobrovsky": "bobrovsky",
-        "bobrovsky": "bobrovsky",
-
-        "brock boeser": "boeser",
-        "boeser": "boeser",
-
-        "nick bonino": "bonino",
-        "bonino": "bonino",
-
-        "mark borowiecki": "borowiecki",
-        "borowiecki": "borowiecki",
-        "mark boroweicki": "borowiecki",
-
-        "will borgen": "borgen",
-        "borgen": "borgen",
-
-        "johnny boychuk": "boychuk",
-        "boychuk": "boychuk",
-
-        "brian boyle": "boyle",
-        "boyle": "boyle",
-
-        "derick brassard": "brassard",
-        "brassard": "brassard",
-
-        "connor brown": "c brown",
-        "c brown": "c brown",
-
-        "dustin brown": "d brown",
-        "d brown": "d brown",
-
-        "josh brown": "j brown",
-        "j brown": "j brown",
-
-        "andre burakovsky": "burakovsky",
-        "burakovsky": "burakovsky",
-        "burakowsky": "burakovsky",
-
-        "will butcher": "butcher",
-        "butcher": "butcher",
-        "w. butcher": "butcher",
-
-        "quinton byfield": "byfield",
-        "byfield": "byfield",
-
-        "paul byron": "byron",
-        "byron": "byron",
-
-        "jeff carter": "carter",
-        "carter": "carter",
-
-        "zdeno chara": "chara",
-        "chara": "chara",
-
-        "ben chariot": "chiarot",
-        "ben chiarot": "chiarot",
-        "chiarot": "chiarot",
-
-        "kyle clifford": "clifford",
-        "clifford": "clifford",
-
-        "andrew cogliano": "cogliano",
-        "cogliano": "cogliano",
-
-        "andrew copp": "copp",
-        "copp": "copp",
-
-        "nick cousins": "cousins",
-        "cousins": "cousins",
-        "n. cousins": "cousins",
-
-        "lawson crouse": "crouse",
-        "crouse": "crouse",
-
-        "rasmus dahlin": "dahlin",
-        "dahlin": "dahlin",
-
-        "dante fabbro": "fabbro",
-        "fabbro": "fabbro",
-
-        "jake debrusk": "debrusk",
-        "debrusk": "debrusk",
-
-        "calvin de haan": "de haan",
-        "dehaan": "de haan",
-
-        "danny dekeyser": "dekeyser",
-        "dekeyser": "dekeyser",
-        "d. dekeyser": "dekeyser",
-
-        "nic deslauriers": "deslauriers",
-        "deslauriers": "deslauriers",
-
-        "travis dermott": "dermott",
-        "dermott": "dermott",
-
-        "max domi": "domi",
-        "domi": "domi",
-        "m. domi": "domi",
-        "m.domi": "domi",
-
-        "matt dumba": "dumba",
-        "dumba": "dumba",
-
-        "ryan dzingel": "dzingel",
-        "dzingel": "dzingel",
-        "dzingle": "dzingel",
-        "r.dzingel": "dzingel",
-
-        "cody eakin": "eakin",
-        "eakin": "eakin",
-        "cody eakins": "eakin",
-        "c. eakin": "eakin",
-        "c.eakin": "eakin",
-
-        "jordan eberle": "eberle",
-        "eberle": "eberle",
-
-        "alexander edler": "edler",
-        "edler": "edler",
-        "a. edler": "edler",
-        "alex edler": "edler",
-
-        "jack eichel": "eichel",
-        "eichel": "eichel",
-        "jack eichel (buf)": "eichel",
-        "jack eickel": "eichel",
-        "j. eichel": "eichel",
-        "j eichel": "eichel",
-        "eichel (buf)": "eichel",
-        "eicher": "eichel",
-        "eichle": "eichel",
-
-        "mattias ekholm": "ekholm",
-        "ekholm": "ekholm",
-        "matthias ekholm": "ekholm",
-        "eckholm": "ekholm",
-
-        "tyler ennis": "ennis",
-        "ennis": "ennis",
-        "ennis (ott)": "ennis",
-
-        "eric comrie": "comrie",
-        "comrie": "comrie",
-
-        "loui eriksson": "eriksson",
-        "eriksson": "eriksson",
-        "loui erikkson": "eriksson",
-        "louie eriksson": "eriksson",
-        "louis eriksson": "eriksson",
-        "ericksson": "eriksson",
-
-        "robby fabbri": "fabbri",
-        "fabbri": "fabbri",
-        "robbi fabbri": "fabbri",
-
-        "kevin fiala": "fiala",
-        "fiala": "fiala",
-
-        "filip forsberg": "forsberg",
-        "forsberg": "forsberg",
-        "filip forsberg (nsh)": "forsberg",
-        "filip forsbog": "forsberg",
-        "flip forsberg": "forsberg",
-        "flip forsburg": "forsberg",
-        "forsberg (filip)": "forsberg",
-        "forsberg (nas)": "forsberg",
-        "forserg": "forsberg",
-        "fosberg": "forsberg",
-        "f forsberg": "forsberg",
-        "f.  forsberg": "forsberg",
-        "f. forsberg": "forsberg",
-        "f.forsberg": "forsberg",
-        "forsberg": "forsberg",
-        "fforsberg": "forsberg",
-
-        "marc andre fleury": "fleury",
-        "ma fleury": "fleury",
-        "maf": "fleury",
-        "fleury": "fleury",
-        "fluery": "fleury",
-
-        "cam fowler": "fowler",
-        "fowler": "fowler",
-
-        "sam gagner": "gagner",
-        "gagner": "gagner",
-        "sam gagne": "gagner",
-        "ganger": "gagner",
-
-        "alex galchenyuk": "galchenyuk",
-        "galchenyuk": "galchenyuk",
-
-        "jake gardiner": "gardiner",
-        "gardiner": "gardiner",
-
-        "johnny gaudreau": "gaudreau",
-        "gaudreau": "gaudreau",
-        "johnny gaudreau (cgy)": "gaudreau",
-        "j. gaudreau": "gaudreau",
-
-        "aleksandar georgiev": "georgiev",
-        "alexander georgiev": "georgiev",
-        "georgiev": "georgiev",
-
-        "ryan getzlaf": "getzlaf",
-        "getzlaf": "getzlaf",
-
-        "shayne gostisbehere": "gostisbehere",
-        "gostisbehere": "gostisbehere",
-        "ghostisbehere": "gostisbehere",
-
-        "john gibson": "gibson",
-        "gibson": "gibson",
-
-        "mark giordano": "giordano",
-        "giordano": "giordano",
-        "m. giordano": "giordano",
-
-        "zemgus girgensons": "girgensons",
-        "girgensons": "girgensons",
-        "girgensuns": "girgensons",
-
-        "claude giroux": "giroux",
-        "giroux": "giroux",
-
-        "luke glendening": "glendening",
-        "glendening": "glendening",
-
-        "alex goligoski": "goligoski",
-        "goligoski": "goligoski",
-
-        "jordan greenway": "greenway",
-        "greenway": "greenway",
-
-        "thomas greiss": "greiss",
-        "greiss": "greiss",
-
-        "rocco grimaldi": "grimaldi",
-        "grimaldi": "grimaldi",
-
-        "erik gudbranson": "gudbranson",
-        "gudbranson": "gudbranson",
-
-        "carl hagelin": "hagelin",
-        "hagelin": "hagelin",
-
-        "robert hagg": "hagg",
-        "hagg": "hagg",
-
-        "libor hajek": "hajek",
-        "hajek": "hajek",
-
-        "jaroslav halak": "halak",
-        "halak": "halak",
-
-        "travis hamonic": "hamonic",
-        "hamonic": "hamonic",
-
-        "connor hellebuyck": "hellebuyck",
-        # This is legitimate - I checked and this is an answer to Q9
-        "hellebuyck": "hellebuyck",
-
-        "adam henrique": "henrique",
-        "henrique": "henrique",
-
-        "tomas hertl": "hertl",
-        "hertl": "hertl",
-        "thomas hertl": "hertl",
-        "t hertl": "hertl",
-        "t. hertl": "hertl",
-        "t.hertl": "hertl",
-        "hertl (sj)": "hertl",
-        "hertl (sjs)": "hertl",
-        "hertle": "hertl",
-        "hertz": "hertl",
-        "hertel": "hertl",
-        "tomáš hertl": "hertl",
-
-        "thomas hickey": "hickey",
-        "hickey": "hickey",
-
-        "vinnie hinostroza": "hinostroza",
-        "hinostroza": "hinostroza",
-        "vinnie hinestroza": "hinostroza",
-        "vinnie hinistroza": "hinostroza",
-        "vinny hinostroza": "hinostroza",
-        "v. hinostroza": "hinostroza",
-        "hinistroza": "hinostroza",
-
-        "nick holden": "holden",
-        "holden": "holden",
-        "n. holden": "holden",
-
-        "braden holtby": "holtby",
-        "holtby": "holtby",
-
-        "carter hutton": "c hutton",
-        "c hutton": "c hutton",
-        "hutton": "c hutton",
-
-        "mattias janmark": "janmark",
-        "janmark": "janmark",
-
-        "dmitrij jaskin": "jaskin",
-        "jaskin": "jaskin",
-
-        "marcus johansson": "johansson",
-        "johansson": "johansson",
-
-        "ross johnston": "r johnston",
-        "r johnston": "r johnston",
-
-        "martin jones": "m jones",
-        "m jones": "m jones",
-
-        "seth jones": "s jones",
-        "s jones": "s jones",
-        "s.jones": "s jones",
-        "(seth) jones": "s jones",
-
-        "roman josi": "josi",
-        "josi": "josi",
-
-        "olli juolevi": "juolevi",
-        "juolevi": "juolevi",
-
-        "nazem kadri": "kadri",
-        "kadri": "kadri",
-
-        "kaapo kakko": "kakko",
-        "kakko": "kakko",
-
-        "evander kane": "e kane",
-        "e kane": "e kane",
-        "kane": "e kane",
-        "e. kane": "e kane",
-        "e.kane": "e kane",
-        "ekane": "e kane",
-
-        "ondrej kase": "kase",
-        "kase": "kase",
-
-        "zack kassian": "kassian",
-        "kassian": "kassian",
-
-        "clayton keller": "keller",
-        "keller": "keller",
-
-        "michal kempny": "kempny",
-        "kempny": "kempny",
-
-        "alex kerfoot": "kerfoot",
-        "kerfoot": "kerfoot",
-
-        "ryan kesler": "kesler",
-        "kesler": "kesler",
-        "ryan kessler": "kesler",
-
-        "phil kessel": "kessel",
-        "kessel": "kessel",
-        "phi kessel": "kessel",
-        "phil \"the thrill\" kessel": "kessel",
-        "phil kessel (ari)": "kessel",
-        "phil kessell": "kessel",
-        "philip kessel": "kessel",
-        "phill kessel": "kessel",
-        "phillip kessel": "kessel",
-        "phil k": "kessel",
-        "p kessel": "kessel",
-        "kessel (ari)": "kessel",
-        "p. kassel": "kessel",
-        "p. kessel": "kessel",
-        "p.kessel": "kessel",
-        "kessell": "kessel",
-        "2x stanley cup champion phil kessel": "kessel",
-
-        "anton khudobin": "khudobin",
-        "khudobin": "khudobin",
-
-        "john klingberg": "klingberg",
-        "klingberg": "klingberg",
-        "klinger": "klingberg",
-
-        "leo komarov": "komarov",
-        "komarov": "komarov",
-        "komorov": "komarov",
-
-        "anze kopitar": "kopitar",
-        # This is legitimate - I checked and this is an answer to Q9
-        "kopitar": "kopitar",
-
-        "joonas korpisalo": "korpisalo",
-        "korpisalo": "korpisalo",
-
-        "mikko koskinen": "koskinen",
-        "koskinen": "koskinen",
-
-        "jesperi kotkaniemi": "kotkaniemi",
-        "kotkaniemi": "kotkaniemi",
-
-        "vitaly kravtsov": "kravtsov",
-        "kravtsov": "kravtsov",
-        "vitali kravstov": "kravtsov",
-        "vitali kravtsov": "kravtsov",
-
-        "nikita kucherov": "kucherov",
-        # This is legitimate - There were two entries, I checked and 1 was a legit answer to #9, the other was a mistake
-        "kucherov": "kucherov",
-
-        "darcy kuemper": "kuemper",
-        "kuemper": "kuemper",
-
-        "brett kulak": "kulak",
-        "kulak": "kulak",
-
-        "dean kukan": "kukan",
-        "kukan": "kukan",
-
-        "evgeny kuznetsov": "kuznetsov",
-        "kuznetsov": "kuznetsov",
-        "evgeni kuznetzov": "kuznetsov",
-        "evgeny kuznetzov": "kuznetsov",
-        "kutzentsov": "kuznetsov",
-
-        "andrew ladd": "ladd",
-        "ladd": "ladd",
-
-        "patrik laine": "laine",
-        "laine": "laine",
-        "patrick laine": "laine",
-        "laine (cbj)": "laine",
-
-        "kevin labanc": "labanc",
-        "labanc": "labanc",
-        "lebanc": "labanc",
-
-        "johan larsson": "jo larsson",
-        "jo larsson": "jo larsson",
-
-        "nick leddy": "leddy",
-        "leddy": "leddy",
-        "n. leddy": "leddy",
-        "n leddy": "leddy",
-        "leddy\\": "leddy",
-
-        "kris letang": "letang",
-        "letang": "letang",
-
-        "trevor lewis": "lewis",
-        "lewis": "lewis",
-
-        "hampus lindholm": "lindholm",
-        "lindholm": "lindholm",
-        "h lindholm": "lindholm",
-        "h. lindholm": "lindholm",
-
-        "ilya lyubushkin": "lyubushkin",
-        "lyubushkin": "lyubushkin",
-
-        "olli maatta": "maatta",
-        "maatta": "maatta",
-        "maata": "maatta",
-
-        "evgeni malkin": "malkin",
-        "malkin": "malkin",
-
-        "josh manson": "manson",
-        "manson": "manson",
-        "j manson": "manson",
-
-        "ryan macinnis": "macinnis",
-        "macinnis": "macinnis",
-
-        "timo meier": "meier",
-        "meier": "meier",
-
-        "ilya mikheyev": "mikheyev",
-        "mikheyev": "mikheyev",
-        "ilya mickheyev": "mikheyev",
-        "ilya mikeyev": "mikheyev",
-        "micheyev": "mikheyev",
-        "mikeyhev": "mikheyev",
-
-        "colin miller":  "c miller",
-        "c miller":  "c miller",
-        "collin miller":  "c miller",
-        "c. miller":  "c miller",
-        "c.miller":  "c miller",
-        "(colin) miller":  "c miller",
-
-        "mitch marner": "marner",
-        "marner": "marner",
-
-        "sean monahan": "monahan",
-        "monahan": "monahan",
-
-        "sam montembeault": "montembeault",
-        "montembeault": "montembeault",
-
-        "john moore": "j moore",
-        "j moore": "j moore",
-
-        "connor murphy": "murphy",
-        "murphy": "murphy",
-
-        "vladislav namestnikov": "namestnikov",
-        "namestnikov": "namestnikov",
-        "vlad namestnikov": "namestnikov",
-        "namestnikov (det)": "namestnikov",
-        "namestikov": "namestnikov",
-        "namestnekov": "namestnikov",
-
-        "james neal": "neal",
-        "neal": "neal",
-        "j neal": "neal",
-
-        "nino niederreiter": "niederreiter",
-        "niederreiter": "niederreiter",
-
-        "markus nutivaara": "nutivaara",
-        "nutivaara": "nutivaara",
-
-        "william nylander": "w nylander",
-        "w nylander": "w nylander",
-
-        "gustav nyquist": "nyquist",
-        "nyquist": "nyquist",
-
-        "victor olofsson": "olofsson",
-        "olofsson": "olofsson",
-
-        "ondrej palat": "palat",
-        "palat": "palat",
-
-        "nic petan": "petan",
-        "petan": "petan",
-
-        "greg pateryn": "pateryn",
-        "pateryn": "pateryn",
-
-        "cedric paquette": "paquette",
-        "paquette": "paquette",
-
-        "joe pavelski": "pavelski",
-        "pavelski": "pavelski",
-
-        "mathieu perreault": "perreault",
-        "perreault": "perreault",
-
-        "marcus pettersson": "m pettersson",
-        "m pettersson": "m pettersson",
-        "marcus petterson": "m pettersson",
-
-        "pierre engvall": "engvall",
-        "engvall": "engvall",
-
-        "mark pysyk": "pysyk",
-        "pysyk": "pysyk",
-
-        "jonathan quick": "quick",
-        "quick": "quick",
-
-        "alexander radulov": "radulov",
-        "radulov": "radulov",
+    standardize_question(df, q8, alias_index["q8"])
+    q9 = ['q9a1', 'q9a2', 'q9a3', 'q9a4', 'q9a5']
+    standardize_question(df, q9, alias_index["q9"])
+    q10 = ['q10a1']
+    standardize_question(df, q10, alias_index["q10"])
+    logger.info("All standardization operations complete!")
+    return df
 
-        "rickard rakell": "rakell",
-        "rakell": "rakell",
-        "richard rackell": "rakell",
-        "richard rakell": "rakell",
-        "rikard rakell": "rakell",
-        "rikard rakkel": "rakell",
-        "rickard rackell": "rakell",
-        "rickard rakell (ana)": "rakell",
-        "rakell (ana)": "rakell",
-        "rakkell": "rakell",
-        "r rakell": "rakell",
-        "r. rakell": "rakell",
-        "r.rakell": "rakell",
-        "rackel": "rakell",
-        "rackell": "rakell",
-        "racker": "rakell",
-        "rickell": "rakell",
-        "robert rakell": "rakell",
 
-        "victor rask": "v rask",
-        "rask": "v rask",
-        "v. rask": "v rask",
+def open_stage_cache(cache_path=STAGE_CACHE_PATH):
+    """ Opens (and creates, if needed) the SQLite stage cache, which keeps
+    the rows made by generate_dataframe and standardization_operations so
+    a re-run only has to redo the comments that are new or were edited.
+    Each row is stored under its stage ("parse" or "standardize"), a hash
+    of what went into it, and the version of the code (and, for
+    standardizing, of the alias tables) that made it.
+    """
+    cache = sqlite3.connect(cache_path)
+    cache.execute("CREATE TABLE IF NOT EXISTS stage_rows ("
+                  "stage TEXT, key TEXT, version TEXT, row TEXT, PRIMARY KEY (stage, key, version))")
+    return cache
 
-        "morgan rielly": "rielly",
-        "rielly": "rielly",
-        "morgan reilly": "rielly",
-        "morgan rielly (tor)": "rielly",
-        "m.reilly": "rielly",
-        "m. reilly": "rielly",
-        "m. rielly": "rielly",
-        "reilly": "rielly",
-        "reilly(tor)": "rielly",
 
-        "james reimer": "reimer",
-        "reimer": "reimer",
-
-        "sam reinhart": "reinhart",
-        "reinhart": "reinhart",
-
-        "rasmus ristolainen": "ristolainen",
-        "ristolainen": "ristolainen",
-
-        "jack roslovic": "roslovic",
-        "roslovic": "roslovic",
-
-        "antoine roussel": "roussel",
-        "roussel": "roussel",
-        "antoine roussell": "roussel",
-        "rousell": "roussel",
-
-        "bryan rust": "rust",
-        "rust": "rust",
-
-        "jan rutta": "rutta",
-        "rutta": "rutta",
-
-        "zachary sanford": "sanford",
-        "sanford": "sanford",
-
-        "justin schultz": "schultz",
-        "schultz": "schultz",
-
-        "andrej sekera": "sekera",
-        "sekera": "sekera",
-
-        "damon severson": "severson",
-        "severson": "severson",
-
-        "kevin shattenkirk": "shattenkirk",
-        "shattenkirk": "shattenkirk",
-
-        "riley sheahan": "sheahan",
-        "sheahan": "sheahan",
-
-        "jakob silfverberg": "silfverberg",
-        "silfverberg": "silfverberg",
-
-        "reilly smith": "r smith",
-        "r smith": "r smith",
-
-        "vladimir sobotka": "sobotka",
-        "sobotka": "sobotka",
-
-        "eric staal": "e staal",
-        "e staal": "e staal",
-
-        "marc staal": "m staal",
-        "m staal": "m staal",
-        "mark staal": "m staal",
-        "m. staal": "m staal",
-
-        "paul stastny": "stastny",
-        "stastny": "stastny",
-
-        "derek stepan": "stepan",
-        "stepan": "stepan",
-
-        "troy stecher": "stecher",
-        "stecher": "stecher",
-        "t. stecher": "stecher",
-        "troy stetcher": "stecher",
-        "stetcher": "stecher",
-
-        "anton stralman": "stralman",
-        "stralman": "stralman",
-        "anton strahlman": "stralman",
-        "a.stralman": "stralman",
-        "stalman": "stralman",
-        "strahlman": "stralman",
-        "anton strålman": "stralman",
-
-        "ryan strome": "r strome",
-        "r strome": "r strome",
-
-        "dylan strome": "d strome",
-        "d strome": "d strome",
-        "d. strome": "d strome",
-        "strome": "d strome",
-        "strome (chi)": "d strome",
-
-        "malcolm subban": "m subban",
-        "m subban": "m subban",
-
-        "pk subban": "pk subban",
-        "subban": "pk subban",
-        "p.k. subban": "pk subban",
-        "p. k. subban": "pk subban",
-        "p.k. suban": "pk subban",
-        "pk suban": "pk subban",
-        "suban": "pk subban",
+def row_hash(*values):
+    """ Returns a hash of a list of values (strings and NaNs), for keying
+    rows in the stage cache.
+    """
+    encoded = json.dumps(values, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode('utf8')).hexdigest()
 
-        "vladimir tarasenko": "tarasenko",
-        "tarasenko": "tarasenko",
-        "vlad tarasenko": "tarasenko",
-        "vladamir tarasenko": "tarasenko",
-        "vladimer tarasenko": "tarasenko",
-        "vladimir taransenko": "tarasenko",
-        "vladimir tarasanko": "tarasenko",
-        "vladimir tarasenko (stl)": "tarasenko",
-        "vladimir terasenko": "tarasenko",
-        "valdimir tarasenko": "tarasenko",
-        "v tarasenko": "tarasenko",
-        "v. tarasenko": "tarasenko",
-        "v.tarasenko": "tarasenko",
-        "tarensanko": "tarasenko",
-        "taresenko": "tarasenko",
-        "taraenko": "tarasenko",
-        "tarasanko": "tarasenko",
 
-        "tomas tatar": "tatar",
-        "tatar": "tatar",
-
-        "joe thornton": "thornton",
-        "thornton": "thornton",
-        "jumbo joe": "thornton",
-
-        "chris tierney": "tierney",
-        "tierney": "tierney",
-        "chris tierny": "tierney",
-        "c. tierney": "tierney",
-        "tiereny (ott)": "tierney",
-        "tierney (ott)": "tierney",
-        "tierny": "tierney",
-        "tirney": "tierney",
-
-        "brady tkachuk": "b tkachuk",
-        "b tkachuk": "b tkachuk",
-
-        "matthew tkachuk": "m tkachuk",
-        "m tkachuk": "m tkachuk",
-
-        "dustin tokarski": "tokarski",
-        "tokarski": "tokarski",
-
-        "vincent trocheck": "trocheck",
-        "trocheck": "trocheck",
-
-        "kyle turris": "turris",
-        "turris": "turris",
-
-        "linus ullmark": "ullmark",
-        "ullmark": "ullmark",
-
-        "james van riemsdyk": "van riemsdyk",
-        "j van riemsdyk": "van riemsdyk",
-
-        "frank vatrano": "vatrano",
-        "vatrano": "vatrano",
-
-        "jake walman": "walman",
-        "walman": "walman",
-
-        "zach whitecloud": "whitecloud",
-        "whitecloud": "whitecloud",
-
-        "miles wood": "wood",
-        "wood": "wood",
-
-        "keith yandle": "yandle",
-        "yandle": "yandle",
-
-        "nikita zadorov": "zadorov",
-        "zadorov": "zadorov",
-        "zadarov": "zadorov",
-        "n.zadorov": "zadorov",
-
-        "mika zibanejad": "zibanejad",
-        "zibanejad": "zibanejad",
-
-        "jason zucker": "zucker",
-        "zucker": "zucker",
+def cached_rows(cache, stage, version, keys):
+    """ Looks up rows in the stage cache, and returns a dictionary of key to
+    row (whatever was stored for it, see store_rows) for every key that was
+    found.
+    """
+    found = {}
+    unique_keys = list(dict.fromkeys(keys))
+    # SQLite only takes so many values in one query, so look them up in batches
+    for start in range(0, len(unique_keys), 500):
+        batch = unique_keys[start:start + 500]
+        query = ("SELECT key, row FROM stage_rows WHERE stage = ? AND version = ? AND key IN ("
+                 + ",".join("?" * len(batch)) + ")")
+        for key, row in cache.execute(query, [stage, version] + batch):
+            found[key] = json.loads(row)
+    return found
+
+
+def store_rows(cache, stage, version, keyed_rows):
+    """ Saves rows to the stage cache, given (key, row) pairs. Rows (a list
+    of values, or anything else that goes into JSON, like a parsed entry
+    and its messages) are stored as JSON, with blanks written as NaN (which
+    Python's json module reads back as NaN).
+    """
+    cache.executemany("INSERT OR REPLACE INTO stage_rows VALUES (?, ?, ?, ?)",
+                      [(stage, key, version, json.dumps(row, ensure_ascii=False)) for key, row in keyed_rows])
+    cache.commit()
+
+
+def cached_generate_dataframe(authors, comments, cache, workers=1, comment_ids=None):
+    """ Does the same job as generate_dataframe, but only parses comments
+    that aren't already in the stage cache (keyed by a hash of the author
+    and the comment, after fixing), and saves the newly parsed rows for
+    next time. Each row is cached along with parse_entry's messages for it,
+    which are logged again (with the entry's current position) whenever the
+    row is reused, so a warm run warns about exactly what a cold one does.
+    Returns the dataframe, and a dictionary of how many rows were found in
+    the cache ("hits") and had to be parsed ("misses").
+    """
+    keys = [row_hash(author, comment) for author, comment in zip(authors, comments)]
+    found = cached_rows(cache, "parse", STAGE_CACHE_VERSION, keys)
+    missing = [i for i, key in enumerate(keys) if key not in found]
+    if missing:
+        parsed = parse_entries([authors[i] for i in missing], [comments[i] for i in missing],
+                               workers=workers, positions=missing)
+        store_rows(cache, "parse", STAGE_CACHE_VERSION, zip([keys[i] for i in missing], parsed))
+        found.update(zip([keys[i] for i in missing], parsed))
+    # Put the rows back in order, with the same index generate_dataframe would give them
+    df = entries_dataframe(authors, [found[key] for key in keys], entry_index(authors, comments, comment_ids))
+    stage_summary = {"hits": len(keys) - len(missing), "misses": len(missing)}
+    logger.info(f"Stage cache (parse): {stage_summary['hits']} hits, {stage_summary['misses']} misses")
+    return df, stage_summary
+
+
+def cached_standardization_operations(df, cache):
+    """ Does the same job as standardization_operations, but only
+    standardizes the entries that aren't already in the stage cache (keyed
+    by a hash of the fixed entry, under the current alias table version, so
+    editing an alias table redoes everything), and saves the newly
+    standardized entries for next time. Every answer is standardized on its
+    own, so standardizing only some of the entries gives the same answers.
+    The cached entries are from before the 'armstrong' check, which is run
+    over every entry afterwards (it's one quick pass over question 4), so
+    its warnings and count cover the reused entries too.
+    Returns the dataframe, and a dictionary of how many entries were found
+    in the cache ("hits") and had to be standardized ("misses").
+    """
+    version = f"{STAGE_CACHE_VERSION}-{alias_tables_version()}"
+    rows = df.to_numpy(dtype=object).tolist()
+    keys = [row_hash(*row) for row in rows]
+    found = cached_rows(cache, "standardize", version, keys)
+    missing = [i for i, key in enumerate(keys) if key not in found]
+    if missing:
+        standardized = standardization_operations(df.iloc[missing].copy(), resolve_ambiguous=False)
+        standardized_rows = standardized.to_numpy(dtype=object).tolist()
+        store_rows(cache, "standardize", version, zip([keys[i] for i in missing], standardized_rows))
+        found.update(zip([keys[i] for i in missing], standardized_rows))
+    df = pd.DataFrame([found[key] for key in keys], columns=df.columns, index=df.index, dtype=object)
+    armstrong_check(df)
+    stage_summary = {"hits": len(keys) - len(missing), "misses": len(missing)}
+    logger.info(f"Stage cache (standardize): {stage_summary['hits']} hits, {stage_summary['misses']} misses")
+    return df, stage_summary
+
+
+def load_answer_key(key_path):
+    """ Reads an answer key from a .json file, and returns it as a
+    dictionary of question (e.g. "q1") to that question's key, which holds
+    the set of correct "answers", the "points" for each correct pick and
+    the "penalty" for each wrong pick. In the file, each question can
+    either be a list of its correct (standardized) answers, or an object
+    with "answers", and optionally "points" and "penalty". For example:
+
+        {"q1": ["col", "tbl", "fla"],
+         "q10": {"answers": ["draisaitl"], "points": 5, "penalty": 5}}
+
+    Questions left out of the key aren't scored, so a partial key can be
+    used during the season.
+    """
+    with open(key_path, 'r', encoding='utf8') as key_file:
+        raw_key = json.load(key_file)
+    answer_key = {}
+    for question, question_key in raw_key.items():
+        if question not in QUESTION_COLUMNS:
+            raise ValueError(f"Answer key has an unknown question: {question}")
+        if not isinstance(question_key, dict):
+            question_key = {"answers": question_key}
+        answer_key[question] = {
+            "answers": set(question_key["answers"]),
+            "points": question_key.get("points", DEFAULT_POINTS),
+            "penalty": question_key.get("penalty", DEFAULT_PENALTY),
+        }
+    return answer_key
+
+
+def score_entries(df, answer_key):
+    """ Scores every entry in a standardized dataframe against an answer key
+    (see load_answer_key). For each question in the key, every pick that is
+    in the key's answers earns that question's points, and every other pick
+    loses its penalty. Blank picks and picks repeated within a question
+    don't count. Each question's answers are factorized once, so checking
+    a pick against the key is an array lookup rather than a Python loop.
+    Returns a dataframe with the same index as df, holding a points column
+    per question (e.g. "q1_points") and a "total" column.
+    """
+    scores = pd.DataFrame(index=df.index)
+    for question, columns in QUESTION_COLUMNS.items():
+        if question not in answer_key:
+            continue
+        question_key = answer_key[question]
+        answers = df[columns].to_numpy(dtype=object)
+        codes, distinct_answers = pd.factorize(answers.ravel())
+        codes = codes.reshape(answers.shape)
+        # Check each distinct answer against the key once, then look the result up by code
+        # (False is added on the end for blank answers, which factorize gives a code of -1)
+        is_correct = np.append(pd.Index(distinct_answers).isin(question_key["answers"]), False)[codes]
+        counted = codes >= 0
+        # Only the first of any repeated picks within a question counts
+        for col_index in range(1, len(columns)):
+            for earlier_index in range(col_index):
+                counted[:, col_index] &= codes[:, col_index] != codes[:, earlier_index]
+        correct_count = (is_correct & counted).sum(axis=1)
+        wrong_count = (~is_correct & counted).sum(axis=1)
+        scores[f"{question}_points"] = (correct_count * question_key["points"]
+                                        - wrong_count * question_key["penalty"])
+    scores["total"] = scores.sum(axis=1)
+    return scores
+
+
+def build_answer_index(df):
+    """ Builds an inverted index of the standardized answers: a dictionary
+    of question to a dictionary of answer to a sorted array of the row
+    positions (0 to len(df) - 1, as int32) of every entry that picked it.
+    An entry that gave the same answer twice for a question is only listed
+    once. Build it once after standardization_operations, then use
+    answer_pick_count and who_picked instead of scanning the dataframe, and
+    save_answer_index to keep it around for later.
+    """
+    answer_index = {}
+    for question, columns in QUESTION_COLUMNS.items():
+        answers = df[columns].to_numpy(dtype=object)
+        codes, distinct_answers = pd.factorize(answers.ravel())
+        rows = np.repeat(np.arange(len(df), dtype=np.int64), len(columns))
+        picked = codes >= 0
+        # One number per (answer, row) pair, so sorting them orders the pairs by answer and then
+        # by row, and repeated picks end up next to each other where they're easy to drop
+        pairs = np.sort(codes[picked].astype(np.int64) * len(df) + rows[picked])
+        pairs = pairs[np.append(True, pairs[1:] != pairs[:-1])[:len(pairs)]]
+        pair_codes, pair_rows = np.divmod(pairs, max(len(df), 1))
+        boundaries = np.searchsorted(pair_codes, np.arange(len(distinct_answers) + 1))
+        pair_rows = pair_rows.astype(np.int32)
+        answer_index[question] = {answer: pair_rows[boundaries[code]:boundaries[code + 1]]
+                                  for code, answer in enumerate(distinct_answers)}
+    return answer_index
+
+
+def answer_pick_count(answer_index, question, answer):
+    """ Returns how many entries picked an answer for a question."""
+    return len(answer_index[question].get(answer, ()))
+
+
+def who_picked(answer_index, question, answer, authors=None):
+    """ Returns the row positions of every entry that picked an answer for
+    a question (e.g. everyone who picked kessel for q9), or their names if
+    the authors (in row order, like df["author"]) are given.
+    """
+    rows = answer_index[question].get(answer, np.array([], dtype=np.int32))
+    if authors is None:
+        return rows
+    return np.asarray(authors, dtype=object)[rows]
+
+
+def save_answer_index(answer_index, index_path, authors=None):
+    """ Saves an inverted index from build_answer_index to a .npz file, so
+    later tools can load it without rerunning the whole scrape. Each
+    question is stored as its answers, the row positions for all of its
+    answers back to back, and where each answer's rows start. The authors
+    (in row order) can be saved along with it.
+    """
+    arrays = {}
+    for question, answer_rows in answer_index.items():
+        arrays[f"{question}_answers"] = np.array(list(answer_rows), dtype=str)
+        arrays[f"{question}_offsets"] = np.cumsum([0] + [len(rows) for rows in answer_rows.values()])
+        arrays[f"{question}_rows"] = np.concatenate([np.array([], dtype=np.int32), *answer_rows.values()])
+    if authors is not None:
+        arrays["authors"] = np.array(list(authors), dtype=str)
+    np.savez_compressed(index_path, **arrays)
+
+
+def load_answer_index(index_path):
+    """ Loads an inverted index saved by save_answer_index. Returns the
+    index and the authors saved with it (None if they weren't saved).
+    """
+    answer_index = {}
+    with np.load(index_path, allow_pickle=False) as saved:
+        for question in QUESTION_COLUMNS:
+            if f"{question}_answers" not in saved:
+                continue
+            offsets = saved[f"{question}_offsets"]
+            rows = saved[f"{question}_rows"]
+            answer_index[question] = {str(answer): rows[offsets[code]:offsets[code + 1]]
+                                      for code, answer in enumerate(saved[f"{question}_answers"])}
+        authors = saved["authors"].astype(object) if "authors" in saved else None
+    return answer_index, authors
+
+
+def build_leaderboard(df, answer_key, answer_index=None):
+    """ Sets up a live leaderboard for a standardized dataframe and an answer
+    key (see load_answer_key), so the scores can be kept up to date as the
+    season goes along without rerunning anything. It keeps how many
+    (distinct) picks and how many correct picks each entry has per question,
+    plus an inverted index from answer to entries (see build_answer_index),
+    so a change to the key only touches the entries that picked that answer.
+    The leaderboard is just a dictionary; use apply_key_event to change the
+    key and leaderboard_ranking to get the standings.
+    """
+    if answer_index is None:
+        answer_index = build_answer_index(df)
+    leaderboard = {
+        "authors": df["author"].to_numpy(dtype=object),
+        "index": df.index,
+        "answer_index": answer_index,
+        "answer_key": {},
+        "picked_counts": {},
+        "correct_counts": {},
+        "question_points": {},
+        "total": np.zeros(len(df), dtype=np.int64),
     }
-    q9 = ['q9a1', 'q9a2', 'q9a3', 'q9a4', 'q9a5']
-    for question in q9:
-        print(f"Standardizing the answers for column {question}")
-        # Replace by various names of hart candidates
-        df[question].replace(to_replace=trade_dict, value=None, inplace=True)
-        print("Done!")
-    # Dictionary of variations of 100-point scorer's names for standardization
-    bonus_dict = {
-        "barkov": "barkov",
-
-        "sam bennett (yes": "bennett",
-
-        "sidney crosby": "crosby",
-
-        "leon draisaitl": "draisaitl",
-        "draisaitl": "draisaitl",
-        "leon draisatl": "draisaitl",
-        "leon draisaitil": "draisaitl",
-        "l. draisaitl": "draisaitl",
-        "draisaital": "draisaitl",
-        "draistaitl": "draisaitl",
-        "leon draistaitl": "draisaitl",
-        "draisaitl (edm)": "draisaitl",
-        "leon": "draisaitl",
-        "draisatl": "draisaitl",
-        ": draisatl": "draisaitl",
-        "draisitl": "draisaitl",
-        "draisetal": "draisaitl",
-        "l.draisaitl": "draisaitl",
-        "leon d": "draisaitl",
-        "10. draisaitl": "draisaitl",
-        "optional bonus question: draisaitl": "draisaitl",
-        "leon draisatil": "draisaitl",
-        "draistatl": "draisaitl",
-        "drasatail": "draisaitl",
-        "draissaitl": "draisaitl",
-        "draisaitl for the win!": "draisaitl",
-        "l draisaitl": "draisaitl",
-        "drasaitl": "draisaitl",
-        "draisitl (edm)": "draisaitl",
-        "l draisaital": "draisaitl",
-        "leon draisaital": "draisaitl",
-        "leon drausaitl": "draisaitl",
-        "neon leon draisaitl baby": "draisaitl",
-        "bonus: l. draisaitl": "draisaitl",
-        "the other half of the oiler offense (a.k.a leon draisaitl)": "draisaitl",
-        "draisaitil": "draisaitl",
-        "draistail": "draisaitl",
-
-        "giroux": "giroux",
-
-        "roope hintz": "hintz",
-
-        "jonathan huberdeau": "huberdeau",
-        "huberdeau": "huberdeau",
-
-        "patrick kane": "p kane",
-        "p kane": "p kane",
-
-        "kaprizov": "kaprizov",
-        "kaprisov": "kaprizov",
-
-        "nikita kucherov": "kucherov",
-        "kucherov": "kucherov",
-        "kucherov gonna go brrrrrrr": "kucherov",
-        "kucherov*": "kucherov",
-        "optional bonus question: nikita kucherov": "kucherov",
-        "kucherov. i already own the book anyway (it's great)": "kucherov",
-        "kucherov (could tank my whole entry": "kucherov",
-        "question: kucherov": "kucherov",
-
-        "nathan mackinnon": "mackinnon",
-        "mackinnon": "mackinnon",
-        "nate mackinnon": "mackinnon",
-        "mckinnon": "mackinnon",
-        "nate mckinnon": "mackinnon",
-        "nathan mackinnon (col)": "mackinnon",
-        "n. mackinnon": "mackinnon",
-        "nathan mckinnon": "mackinnon",
-        "bonus: mackinnon": "mackinnon",
-
-        "brad marchand": "marchand",
-        "marchand": "marchand",
-
-        "mitch marner": "marner",
-        "marner": "marner",
-        "bonus: marner": "marner",
-        "m. marner": "marner",
-        "marner *insert elmo_fire_chaos.gif*": "marner",
-
-        "auston matthews": "matthews",
-        "matthews": "matthews",
-        "austin mathews": "matthews",
-        "auston matthews             bpb": "matthews",
-        "auston matthews (for a bonus signed six pack of labatt": "matthews",
-        "matthews bang!": "matthews",
-
-        "artemi panarin": "panarin",
-        "panarin": "panarin",
-        "panarin the bread man": "panarin",
-        ". panarin": "panarin",
-        "panerin": "panarin",
-        "artemi panerin": "panarin",
-        "panarin (praying for no second pandemic)": "panarin",
-        "bread man artemi panarin": "panarin",
-
-        "david pastrnak": "pastrnak",
-        "pastrnak": "pastrnak",
-
-        "brayden point": "point",
-        "point": "point",
-
-        "mikko rantanen": "rantanen",
-        "rantanen": "rantanen",
-        "rantanen mikko": "rantanen",
-
-        "mark scheifele": "scheifele",
-        "scheifele": "scheifele",
-
-        "0": np.nan,
-        "": np.nan,
-        "no answer": np.nan,
-        "pass": np.nan,
-        "no thank you": np.nan,
-        "nope": np.nan,
-        "no way": np.nan,
-        "hell no. not falling for this one": np.nan,
-        "too risky": np.nan,
-        "n": np.nan,
-        "i know nothing about hockey so everyone should beat me": np.nan,
-        "no": np.nan,
-        "jcs": np.nan,
-        "r.s": np.nan,
-        "nick d": np.nan,
-        "kjl": np.nan,
-        "jwm": np.nan,
-        "jl": np.nan,
-        "ben from portland": np.nan,
-        "none": np.nan,
-        "jon n": np.nan,
-        "lol do you think i'm a sucker?": np.nan,
-        "tag so i can find my entry: jl96": np.nan,
-        "no bonus answer.....go jackets!!!": np.nan,
-        "tim t. lgrw": np.nan,
-        "gw": np.nan,
-        "carl12345": np.nan,
-        "ryan m": np.nan,
-        "ellay 'vanilla thunder' heys": np.nan,
-        "i think my autocorrect now hates me as much as i hate it": np.nan,
-        "waaaaaaay too scared to risk this one": np.nan,
-        "couple possibilities but no one i'm gonna risk it all on": np.nan,
-        "rnw": np.nan,
-        "tae": np.nan,
-        "with five minutes to spare baby! blk": np.nan,
-        "not gonna do it..": np.nan,
-        "gm": np.nan,
-        "jb0202": np.nan,
-        "nope nope nope": np.nan,
-        "sn": np.nan,
-        "lets go buffalo": np.nan,
-        "nope. nope nope nope. not touching that": np.nan,
-        "jar": np.nan,
-        "bradley o": np.nan,
-        "efk (nyc)": np.nan,
-        "man am i going to look awful at the end": np.nan,
-        "nobody": np.nan,
-        "rl": np.nan,
-        "rga": np.nan,
-        "riley b": np.nan,
-        "not a chance": np.nan,
-        "risk it all": np.nan,
-        "travis c": np.nan,
-        "bwd": np.nan,
-        "moods": np.nan,
-        "saruman": np.nan,
-        "paul lang": np.nan,
-        "oh": np.nan,
-        "srl": np.nan,
-        "ajm": np.nan,
-        ">": np.nan,
-        "\"b.	marner\"": np.nan,
-        "pg13": np.nan,
-        "b$": np.nan,
-        "no way iâ€™ll risk it": np.nan,
-        "my wife's entry": np.nan,
-        "ty stortz": np.nan,
-        "hopefully i'll do better than last year. thanks alot lafreniere..": np.nan,
-        "when mackinnon sprains his ankle": np.nan,
-        "mtw": np.nan,
-        "rg": np.nan,
-        "kaj": np.nan,
-        "mcl": np.nan,
-        "rjp": np.nan,
-        "dcrjmr": np.nan,
-        "woj": np.nan,
-        "cga": np.nan,
-        "since wayne": np.nan,
-        "tim b": np.nan,
-        "eht": np.nan,
-        "sonny": np.nan,
-        "jtk": np.nan,
-        "ccc": np.nan,
-        "i am not falling into this trap": np.nan,
-        "jrb716": np.nan,
-        "submmited by jammer": np.nan,
-        "phil j": np.nan,
-        "rocco m": np.nan,
-        "robkd": np.nan,
-        "dt": np.nan,
-        "not participating": np.nan,
-        "kevin y": np.nan,
-        "jzs": np.nan,
-        "bonud": np.nan,
-        "ross hamm": np.nan,
-        "dfh": np.nan,
-        "thank you sean": np.nan,
-        "bz": np.nan,
-        "macki....can't risk the entire entry. not submitting for q #10": np.nan,
-        "justin zentai": np.nan,
-        "bjb": np.nan,
-        "decline bonus": np.nan,
-        "wg2": np.nan,
-        "ekb": np.nan,
-        "no thanks!": np.nan,
-        "ajv": np.nan,
-        "jwc": np.nan,
-        "not going for the optional suic": np.nan,
-        "kevin durant": np.nan,
-        "085 alj": np.nan,
-        "bonus": np.nan,
-        "japanada": np.nan,
-        "fetterov": np.nan,
-        "cd11": np.nan,
-        "jsa": np.nan,
-        "~wsd": np.nan,
-        "[pass]": np.nan,
-        "aj ~ go wings!": np.nan,
-        "irbull": np.nan,
-        "t. hamburg": np.nan,
-        "no thanks 2spooky4me": np.nan,
-        "blank": np.nan,
-        "you'll score 100 points in my heart": np.nan,
-        "dc": np.nan,
-        "e.g": np.nan,
-        "mes": np.nan,
-        "i ain't that stupid": np.nan,
-        "mjtl": np.nan,
-        "iap": np.nan,
-        "zb": np.nan,
-        "kmb": np.nan,
-        "dps": np.nan,
-        "dwd on behalf of 10k": np.nan,
-        "[not answering]": np.nan,
-        "jake s": np.nan,
-        "no thanks": np.nan,
-        "drew millard": np.nan,
-        "gokingsgo": np.nan,
-        "b.a": np.nan,
-        "zzzg": np.nan,
-        "soup": np.nan,
-        ".svc": np.nan,
-        "@natbencol": np.nan,
-        "cwz": np.nan,
-        "nate the great ( mck not beaulieu)": np.nan,
-        "i am a coward": np.nan,
-        "abs": np.nan,
-        "fs ggmu": np.nan,
-        "bdc12": np.nan,
-        "alex makhalov": np.nan,
-        "trw": np.nan,
-        "casto": np.nan,
-        "here's my gamble: nobody but mcdavid hits 100": np.nan,
-        "signed teh": np.nan,
-        "bettman eats boogers!": np.nan,
-        "npp": np.nan,
-        "nnnope": np.nan,
-        "absolutely not!": np.nan,
-        "fuck no lol": np.nan,
-        "qq": np.nan,
-        "js33": np.nan,
-        "(jgp)": np.nan,
-        "no way i’ll risk it": np.nan,
-        "no answer (don’t think anyone will)": np.nan,
+    for question in QUESTION_COLUMNS:
+        picked_counts = np.zeros(len(df), dtype=np.int64)
+        for rows in answer_index[question].values():
+            picked_counts[rows] += 1
+        leaderboard["picked_counts"][question] = picked_counts
+    for question, question_key in answer_key.items():
+        key_question(leaderboard, question, question_key["answers"],
+                     question_key["points"], question_key["penalty"])
+    return leaderboard
+
+
+def key_question(leaderboard, question, answers, points=DEFAULT_POINTS, penalty=DEFAULT_PENALTY):
+    """ Adds a question to a leaderboard's answer key (or replaces it),
+    scoring that question for every entry. Use apply_key_event for changes
+    to a single answer after that, it's much less work.
+    """
+    picked_counts = leaderboard["picked_counts"][question]
+    correct_counts = np.zeros(len(picked_counts), dtype=np.int64)
+    for answer in answers:
+        correct_counts[leaderboard["answer_index"][question].get(answer, [])] += 1
+    new_points = correct_counts * points - (picked_counts - correct_counts) * penalty
+    old_points = leaderboard["question_points"].get(question, 0)
+    leaderboard["total"] += new_points - old_points
+    leaderboard["answer_key"][question] = {"answers": set(answers), "points": points, "penalty": penalty}
+    leaderboard["correct_counts"][question] = correct_counts
+    leaderboard["question_points"][question] = new_points
+
+
+def apply_key_event(leaderboard, question, answer, correct=True):
+    """ Applies one change to the answer key. correct=True adds the answer
+    to the question's key, and correct=False takes it out again. Which one
+    an event is depends on what the question asks for, for example:
+        - a player gets traded: correct=True for question 9 (players to
+          change teams)
+        - a coach gets fired: correct=False for question 3 (coaches to
+          not lose their jobs)
+        - a goalie falls below 60% of starts: correct=False for question 5
+          (goalies to start 60% of games), and correct=True if they get
+          back above it
+    Only the entries that picked that answer are rescored. A question that wasn't in
+    the key yet is added with the default points and penalty. Returns the
+    row positions of the entries whose score changed (empty if the event
+    didn't change the key).
+    """
+    if question not in leaderboard["answer_key"]:
+        key_question(leaderboard, question, set())
+    question_key = leaderboard["answer_key"][question]
+    if (answer in question_key["answers"]) == correct:
+        return np.array([], dtype=np.int64)
+    if correct:
+        question_key["answers"].add(answer)
+    else:
+        question_key["answers"].discard(answer)
+    rows = leaderboard["answer_index"][question].get(answer, np.array([], dtype=np.int64))
+    # Each affected entry gains (or loses) a correct pick and loses (or gains) a wrong one
+    change = (question_key["points"] + question_key["penalty"]) * (1 if correct else -1)
+    leaderboard["correct_counts"][question][rows] += 1 if correct else -1
+    leaderboard["question_points"][question][rows] += change
+    leaderboard["total"][rows] += change
+    return rows
+
+
+def leaderboard_ranking(leaderboard, top=None):
+    """ Returns the current standings as a dataframe of rank, author and
+    total, best first, with ties sharing a rank (1, 2, 2, 4...) and tied
+    entries listed in the order they were posted. top limits it to the
+    first top places (plus anyone tied with the last of them).
+    """
+    total = leaderboard["total"]
+    order = np.argsort(-total, kind="stable")
+    ranked_total = total[order]
+    # An entry's rank is one more than the number of entries with a higher total
+    ranks = np.searchsorted(-ranked_total, -ranked_total, side="left") + 1
+    if top is not None:
+        order = order[ranks <= top]
+        ranks = ranks[ranks <= top]
+        ranked_total = total[order]
+    return pd.DataFrame({"rank": ranks, "author": leaderboard["authors"][order], "total": ranked_total},
+                        index=leaderboard["index"][order])
+
+
+def encode_entries(df, vocabularies=None):
+    """ Encodes every entry in a standardized dataframe as a fixed-width
+    bitset. Each question gets a block of bits, one bit per answer in that
+    question's vocabulary, and an entry's bit is set if they picked that
+    answer. The vocabularies default to the sorted distinct answers given
+    for each question, but can be passed in as a dictionary of question to
+    list of answers (any answer given that isn't in the list is added on
+    the end, so nothing is lost). Returns the bitsets as an array of uint64
+    words with one row per entry, and a layout dictionary of question to
+    (bit offset, vocabulary) needed to read them.
+    """
+    layout = {}
+    offset = 0
+    codes_by_question = {}
+    for question, columns in QUESTION_COLUMNS.items():
+        answers = df[columns].to_numpy(dtype=object)
+        given = pd.unique(answers[pd.notna(answers)])
+        if vocabularies is not None and question in vocabularies:
+            vocabulary = list(vocabularies[question])
+            known = set(vocabulary)
+            vocabulary += sorted(x for x in given if x not in known)
+        else:
+            vocabulary = sorted(given)
+        codes_by_question[question] = pd.Index(vocabulary).get_indexer(answers.ravel())
+        layout[question] = (offset, vocabulary)
+        offset += len(vocabulary)
+    bits = np.zeros((len(df), max(1, -(-offset // 64))), dtype=np.uint64)
+    for question, codes in codes_by_question.items():
+        question_offset, _ = layout[question]
+        width = len(QUESTION_COLUMNS[question])
+        picked = codes >= 0
+        positions = question_offset + codes[picked]
+        rows = np.nonzero(picked)[0] // width
+        np.bitwise_or.at(bits, (rows, positions // 64),
+                         np.left_shift(np.uint64(1), (positions % 64).astype(np.uint64)))
+    return bits, layout
+
+
+def decode_entries(bits, layout, index=None):
+    """ Turns bitsets made by encode_entries back into a dataframe of
+    answers, with the same answer columns as generate_dataframe. Each
+    question's picks come out in vocabulary order, with blanks (NaN) on the
+    end. Picks repeated within a question only appear once, and the order
+    picks were given in isn't kept, so each question holds the same set of
+    answers as the original dataframe.
+    """
+    decoded = {}
+    for question, (offset, vocabulary) in layout.items():
+        columns = QUESTION_COLUMNS[question]
+        answers = np.full((len(bits), len(columns)), np.nan, dtype=object)
+        filled = np.zeros(len(bits), dtype=np.int64)
+        for code, answer in enumerate(vocabulary):
+            position = offset + code
+            has_answer = (bits[:, position // 64] >> np.uint64(position % 64)) & np.uint64(1) == 1
+            answers[has_answer, filled[has_answer]] = answer
+            filled += has_answer
+        for col_index, column in enumerate(columns):
+            decoded[column] = answers[:, col_index]
+    return pd.DataFrame(decoded, index=index, dtype=object)
+
+
+def question_mask(layout, question, answers=None):
+    """ Returns a single bitset row (as uint64 words) with the bits set for
+    the given answers to a question, or for every answer in the question's
+    vocabulary if no answers are given. Answers not in the vocabulary
+    (which nobody picked) are skipped.
+    """
+    width = max(1, -(-sum(len(vocabulary) for _, vocabulary in layout.values()) // 64))
+    mask = np.zeros(width, dtype=np.uint64)
+    offset, vocabulary = layout[question]
+    codes = np.arange(len(vocabulary))
+    if answers is not None:
+        codes = codes[pd.Index(vocabulary).isin(list(answers))]
+    positions = offset + codes
+    np.bitwise_or.at(mask, positions // 64,
+                     np.left_shift(np.uint64(1), (positions % 64).astype(np.uint64)))
+    return mask
+
+
+def popcount(bits):
+    """ Counts the set bits in each row of a uint64 bitset array."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(bits).sum(axis=-1, dtype=np.int64)
+    return np.unpackbits(np.ascontiguousarray(bits).view(np.uint8), axis=-1).sum(axis=-1, dtype=np.int64)
+
+
+def score_bitsets(bits, layout, answer_key, index=None):
+    """ Scores bitsets made by encode_entries against an answer key (see
+    load_answer_key), the same way score_entries scores a dataframe. For
+    each question, the correct picks are counted by ANDing each entry with
+    the key's bits and counting the set bits, and the wrong picks are the
+    rest of the entry's bits for that question. Returns a dataframe with a
+    points column per question in the key and a "total" column.
+    """
+    scores = pd.DataFrame(index=index if index is not None else pd.RangeIndex(len(bits)))
+    for question in QUESTION_COLUMNS:
+        if question not in answer_key:
+            continue
+        question_key = answer_key[question]
+        correct_count = popcount(bits & question_mask(layout, question, question_key["answers"]))
+        wrong_count = popcount(bits & question_mask(layout, question)) - correct_count
+        scores[f"{question}_points"] = (correct_count * question_key["points"]
+                                        - wrong_count * question_key["penalty"])
+    scores["total"] = scores.sum(axis=1)
+    return scores
+
+
+def entry_similarity(bits, row):
+    """ Returns how similar every entry is to the entry at position row,
+    as the share of all of their picks (across every question) that the
+    two entries have in common (Jaccard similarity, from 0 to 1).
+    """
+    shared = popcount(bits & bits[row])
+    combined = popcount(bits | bits[row])
+    return np.divide(shared, combined, out=np.zeros(len(bits)), where=combined > 0)
+
+
+def check_entry_encoding(df, answer_key=None, vocabularies=None):
+    """ Checks that encode_entries doesn't lose or change anything, by
+    encoding a standardized dataframe, decoding it again with
+    decode_entries, and checking that every entry holds the same set of
+    answers for every question as it did in the dataframe (the order
+    answers were given in and repeated picks aren't kept, so sets are
+    compared). If an answer key is given, it also checks that score_bitsets
+    gives every entry the same points as score_entries. Prints and returns
+    a dataframe with one row per question, holding the size of the
+    question's vocabulary, how many entries came back with different
+    answers, and whether the scores matched (NaN if the question isn't in
+    the key), plus a "total" row for the whole entry and its total score.
+    """
+    bits, layout = encode_entries(df, vocabularies)
+    decoded = decode_entries(bits, layout, index=df.index)
+    if answer_key is not None:
+        expected_scores = score_entries(df, answer_key)
+        scores = score_bitsets(bits, layout, answer_key, index=df.index)
+    results = []
+    changed = np.zeros(len(df), dtype=bool)
+    for question, columns in QUESTION_COLUMNS.items():
+        answer_sets = [frozenset(row[pd.notna(row)]) for row in df[columns].to_numpy(dtype=object)]
+        decoded_sets = [frozenset(row[pd.notna(row)]) for row in decoded[columns].to_numpy(dtype=object)]
+        question_changed = np.array([answer_set != decoded_set for answer_set, decoded_set
+                                     in zip(answer_sets, decoded_sets)], dtype=bool)
+        changed |= question_changed
+        scores_match = np.nan
+        if answer_key is not None and question in answer_key:
+            scores_match = bool(np.array_equal(scores[f"{question}_points"].to_numpy(),
+                                               expected_scores[f"{question}_points"].to_numpy()))
+        results.append({"question": question,
+                        "vocabulary": len(layout[question][1]),
+                        "entries_changed": int(question_changed.sum()),
+                        "scores_match": scores_match})
+    results.append({"question": "total",
+                    "vocabulary": sum(len(vocabulary) for _, vocabulary in layout.values()),
+                    "entries_changed": int(changed.sum()),
+                    "scores_match": (bool(np.array_equal(scores["total"].to_numpy(),
+                                                         expected_scores["total"].to_numpy()))
+                                     if answer_key is not None else np.nan)})
+    results = pd.DataFrame(results).set_index("question")
+    logger.info(f"Bitset encoding check over {len(df)} entries ({bits.nbytes} bytes as bits):")
+    logger.info(results)
+    return results
+
+
+def load_season_odds(odds_path):
+    """ Reads the odds for the rest of the season from a .json file, for
+    simulate_seasons. Each question maps to an object with either "odds",
+    the chance of each answer's event happening on its own (playoff odds
+    per team, firing odds per coach or GM, the chance of a goalie starting
+    60% of games, trade odds per player, the chance of a player reaching
+    100 points), or "shares",
+    the vote shares for an award, where the answers that finish in the top
+    "places" of the voting come true each season (from QUESTION_PLACES if
+    it isn't given, so the top 15 for the Hart). Like load_answer_key,
+    "points" and "penalty" are optional. For example:
+
+        {"q1": {"odds": {"col": 0.95, "tor": 0.8, "sea": 0.3}},
+         "q8": {"shares": {"mcdavid": 0.6, "matthews": 0.3, "draisaitl": 0.1}, "places": 2}}
+
+    Question 2 (teams to miss the playoffs) takes playoff odds too, and
+    questions 3 and 4 (coaches and GMs to keep their jobs) take firing odds
+    too, so the same odds can be pasted into every question. Their odds
+    are flipped here (see ODDS_AGAINST_QUESTIONS), so a team with 0.8
+    playoff odds is a right answer for question 2 in 20% of seasons.
+
+    Questions left out aren't scored. Returns a dictionary of question to
+    its "kind" ("odds" or "shares"), "answers", "probabilities" (the chance
+    that each answer is right, with the shares scaled to add up to 1),
+    "places", "points" and "penalty".
+    """
+    with open(odds_path, 'r', encoding='utf8') as odds_file:
+        raw_odds = json.load(odds_file)
+    season_odds = {}
+    for question, question_odds in raw_odds.items():
+        if question not in QUESTION_COLUMNS:
+            raise ValueError(f"Season odds have an unknown question: {question}")
+        kinds = [kind for kind in ("odds", "shares") if kind in question_odds]
+        if len(kinds) != 1:
+            raise ValueError(f"Season odds for {question} need either \"odds\" or \"shares\"")
+        kind = kinds[0]
+        probabilities = np.array(list(question_odds[kind].values()), dtype=np.float64)
+        if (probabilities < 0).any() or (kind == "odds" and (probabilities > 1).any()):
+            raise ValueError(f"Season odds for {question} have a probability outside 0 to 1")
+        if kind == "shares":
+            if probabilities.sum() <= 0:
+                raise ValueError(f"Season odds for {question} have no vote shares")
+            probabilities = probabilities / probabilities.sum()
+        elif question in ODDS_AGAINST_QUESTIONS:
+            probabilities = 1 - probabilities
+        places = question_odds.get("places", QUESTION_PLACES.get(question, 1))
+        if not isinstance(places, int) or places < 1:
+            raise ValueError(f"Season odds for {question} need a whole number of places, not {places!r}")
+        season_odds[question] = {
+            "kind": kind,
+            "answers": list(question_odds[kind]),
+            "probabilities": probabilities,
+            "places": places,
+            "points": question_odds.get("points", DEFAULT_POINTS),
+            "penalty": question_odds.get("penalty", DEFAULT_PENALTY),
+        }
+    return season_odds
+
+
+def simulate_season_chunk(weights, baseline, samplers, seed, seasons, batch_size=1000):
+    """ Simulates one chunk of seasons for simulate_seasons (it's separate
+    so it can be run in another process). Each batch of seasons draws which
+    answers come true, as one row of 0s and 1s per season (for vote shares,
+    the top places are drawn one after another without replacement, each
+    in proportion to the shares left, using Gumbel-top-k: add Gumbel noise
+    to the log of each share and take the biggest places), and then scores
+    every entry for every season at once by multiplying by the weights.
+    Returns each entry's number of wins (with ties split), number of
+    top-10 finishes (ties included), and the sum and sum of squares of
+    their scores.
+    """
+    rng = np.random.default_rng(seed)
+    entry_count, column_count = weights.shape
+    wins = np.zeros(entry_count)
+    top_tens = np.zeros(entry_count)
+    score_sum = np.zeros(entry_count)
+    score_squares = np.zeros(entry_count)
+    top_place = max(entry_count - 10, 0)
+    for batch_start in range(0, seasons, batch_size):
+        batch = min(batch_size, seasons - batch_start)
+        outcomes = np.zeros((column_count, batch), dtype=np.float32)
+        for kind, columns, probabilities, places in samplers:
+            if kind == "odds":
+                outcomes[columns] = rng.random((batch, len(columns))).T < probabilities[:, None]
+            else:
+                keys = np.log(probabilities) + rng.gumbel(size=(batch, len(probabilities)))
+                if places < len(probabilities):
+                    placed = np.argpartition(-keys, places - 1, axis=1)[:, :places]
+                else:
+                    placed = np.broadcast_to(np.arange(len(probabilities)), keys.shape)
+                # Placings that nobody picked land on the extra row on the end, which is dropped
+                placed_columns = np.append(columns, column_count)[placed]
+                picked = placed_columns < column_count
+                seasons_placed = np.broadcast_to(np.arange(batch)[:, None], placed.shape)
+                outcomes[placed_columns[picked], seasons_placed[picked]] = 1
+        scores = weights @ outcomes - baseline[:, None]
+        best = scores.max(axis=0)
+        is_best = scores == best
+        wins += (is_best / is_best.sum(axis=0)).sum(axis=1)
+        top_tens += (scores >= np.partition(scores, top_place, axis=0)[top_place]).sum(axis=1)
+        score_sum += scores.sum(axis=1)
+        score_squares += np.square(scores, dtype=np.float64).sum(axis=1)
+    return wins, top_tens, score_sum, score_squares
+
+
+def simulate_seasons(df, season_odds, simulations=1_000_000, workers=None, seed=None, chunk_size=20_000):
+    """ Projects who is likely to win by simulating the rest of the season
+    over and over, using the odds from load_season_odds. Every simulated
+    season is scored the same way as score_entries (a correct pick earns
+    the question's points, a wrong one loses its penalty, repeated picks
+    count once), but with every entry scored at once: each entry's picks
+    become a row of weights, one per answer that has odds, so a batch of
+    seasons is scored with one matrix multiplication. The seasons are split
+    into chunks that are run across workers processes (every core by
+    default), and each chunk gets its own random seed from seed, so the
+    results are the same no matter how many workers are used. Returns a
+    dataframe with the same index as df, holding each entry's author,
+    win_probability, top10_probability, expected_score and score_std.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    answer_index = build_answer_index(df)
+    columns = [(question, answer) for question, question_odds in season_odds.items()
+               for answer in question_odds["answers"] if answer in answer_index[question]]
+    column_numbers = {column: column_number for column_number, column in enumerate(columns)}
+    weights = np.zeros((len(df), len(columns)), dtype=np.float32)
+    # A wrong pick costs the penalty, so every pick starts out costing the penalty and a
+    # correct one earns back the penalty plus the points
+    baseline = np.zeros(len(df), dtype=np.float32)
+    samplers = []
+    for question, question_odds in season_odds.items():
+        for rows in answer_index[question].values():
+            baseline[rows] += question_odds["penalty"]
+        answer_columns = []
+        for answer in question_odds["answers"]:
+            if (question, answer) in column_numbers:
+                column_number = column_numbers[(question, answer)]
+                weights[answer_index[question][answer], column_number] = (question_odds["points"]
+                                                                          + question_odds["penalty"])
+                answer_columns.append(column_number)
+            else:
+                answer_columns.append(len(columns))
+        answer_columns = np.array(answer_columns, dtype=np.int64)
+        if question_odds["kind"] == "odds":
+            # Answers nobody picked can't change anyone's score, so they aren't drawn
+            picked = answer_columns < len(columns)
+            samplers.append(("odds", answer_columns[picked], question_odds["probabilities"][picked], 1))
+        else:
+            # Answers with no share can't place, so they're left out (they'd only place if
+            # there were more places than answers with a share)
+            has_share = question_odds["probabilities"] > 0
+            samplers.append(("shares", answer_columns[has_share], question_odds["probabilities"][has_share],
+                             question_odds["places"]))
+    chunks = [min(chunk_size, simulations - start) for start in range(0, simulations, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    logger.info(f"Simulating {simulations} seasons for {len(df)} entries across {workers} process(es)...")
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(simulate_season_chunk, [weights] * len(chunks),
+                                        [baseline] * len(chunks), [samplers] * len(chunks), seeds, chunks))
+    else:
+        results = [simulate_season_chunk(weights, baseline, samplers, chunk_seed, seasons)
+                   for chunk_seed, seasons in zip(seeds, chunks)]
+    wins, top_tens, score_sum, score_squares = (np.sum(totals, axis=0) for totals in zip(*results))
+    expected_score = score_sum / simulations
+    logger.info("Done!")
+    return pd.DataFrame({
+        "author": df["author"].to_numpy(dtype=object),
+        "win_probability": wins / simulations,
+        "top10_probability": top_tens / simulations,
+        "expected_score": expected_score,
+        "score_std": np.sqrt(np.maximum(score_squares / simulations - expected_score ** 2, 0)),
+    }, index=df.index)
+
+
+def question_answer_codes(df, columns):
+    """ Returns a code for every answer given to one question (every slot
+    of every entry, column by column), along with the answers the codes
+    stand for, with -1 for a blank. If the question's columns are already
+    categorical with the same categories (see categorize_answers), their
+    codes are used as they are, otherwise the answers are factorized.
+    """
+    dtypes = [df[column].dtype for column in columns]
+    if (all(isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes)
+            and all(dtype.categories.equals(dtypes[0].categories) for dtype in dtypes)):
+        codes = np.concatenate([df[column].cat.codes.to_numpy() for column in columns])
+        return codes, dtypes[0].categories
+    return pd.factorize(df[columns].to_numpy(dtype=object).ravel(order="F"))
+
+
+def summarize_answers(df, minor_surgery_count=0, major_surgery_count=0):
+    """ Works out everything that reporting_operations reports, counting
+    each question's answers all at once from their codes (see
+    question_answer_codes) rather than going column by column. Returns a
+    dictionary with:
+        - "overall": the number of entries, possible answers, answers
+          given, and the major, minor and total surgery counts
+        - "questions": for each question, its description, how many answers
+          were possible, "received" and left "blank", how many "distinct"
+          answers were given, and "counts", a Series of how many times each
+          answer was given (most popular first, ties in alphabetical order)
+    """
+    report = {"overall": {}, "questions": {}}
+    for question, columns in QUESTION_COLUMNS.items():
+        codes, categories = question_answer_codes(df, columns)
+        blank = int((codes < 0).sum())
+        answer_counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+        counts = pd.Series(answer_counts, index=pd.Index(categories, dtype=object, name="answer"),
+                           name="count", dtype=np.int64)
+        # Leave out answers nobody gave (a categorical can hold answers from rows since dropped)
+        counts = counts[counts > 0]
+        counts = counts.sort_index().sort_values(ascending=False, kind="stable")
+        report["questions"][question] = {
+            "description": QUESTION_DESCRIPTIONS[question],
+            "possible": len(df) * len(columns),
+            "received": int(counts.sum()),
+            "blank": blank,
+            "distinct": len(counts),
+            "counts": counts,
+        }
+    question_reports = report["questions"].values()
+    report["overall"] = {
+        "entries": len(df),
+        "possible_answers": sum(question_report["possible"] for question_report in question_reports),
+        "answers_given": sum(question_report["received"] for question_report in question_reports),
+        "major_surgery_count": major_surgery_count,
+        "minor_surgery_count": minor_surgery_count,
+        "total_surgery_count": major_surgery_count + minor_surgery_count,
     }
-    q10 = ['q10a1']
-    for question in q10:
-        print(f"Standardizing the answers for column {question}")
-        # Replace by various names of hart candidates
-        df[question].replace(to_replace=bonus_dict, value=None, inplace=True)
-        print("Done!")
-    print("All standardization operations complete!")
-    return df
+    return report
 
 
 def reporting_operations(df, minor_surgery_count, major_surgery_count):
@@ -5208,255 +3589,617 @@ def reporting_operations(df, minor_surgery_count, major_surgery_count):
     we're ready to generate data from it! This function uses
     a provided df, minor surgery count, and major surgery count
     to provide some overall statistics, as well as value counts
-    for each question. Returns nothing except for printing out
-    a lot of data. 
+    for each question. Everything is worked out at once by
+    summarize_answers, and then printed out. Returns the
+    report dictionary from summarize_answers, so the results
+    can be used without reading them off of the screen.
     """
-    num_entries = len(df)
-    pos_total_answers = num_entries * 46
-    nan_count = df.isna().sum()
-    pos_answers = num_entries * 5
-    num_answers = pos_total_answers - sum(nan_count)
-    total_surgeries = major_surgery_count + minor_surgery_count
-    print(f"After completing all standardization operations, which included deleting a handful of erroneous/updated entries...")
-    print(
+    report = summarize_answers(df, minor_surgery_count, major_surgery_count)
+    num_entries = report["overall"]["entries"]
+    pos_total_answers = report["overall"]["possible_answers"]
+    num_answers = report["overall"]["answers_given"]
+    total_surgeries = report["overall"]["total_surgery_count"]
+    logger.info(f"After completing all standardization operations, which included deleting a handful of erroneous/updated entries...")
+    logger.info(
         f"There are {num_entries} entries in this year's prediction contest.")
-    print(
+    logger.info(
         f"Of these {num_entries} entries, a possible {pos_total_answers} answers were possible.")
-    print(f"Entrants provided {num_answers} answers overall.\n")
-    print(f"Of these {num_entries} entries, {major_surgery_count} required major surgery. This is {(major_surgery_count / num_entries) * 100:.2f}% of all entries.")
-    print("'Major surgery' means that the submission had to be rewritten in whole or in part, in order to be processed by the automatic scripting. For example, if someone used spaces as separators rather than commas, my script could not account for this, and the entry had to be rewritten entirely.")
-    print(f"Of these {num_entries} entries, {minor_surgery_count} required minor surgery. This is {(minor_surgery_count / num_entries) * 100:.2f}% of all entries.")
-    print("'Minor surgery' means that individual cells for an entry had to be corrected (some needing a single correction, others needing several), usually because of inconsistencies in the entry.")
-    print("For example, if someone listed 'mcdavid, draisaitl. mackinnon,...', the period instead of a comma would lead to a single cell receiving 'draisaitl. mackinnon' as an answer, and these would have to be corrected manually.")
-    print("Some of these were more problematic than the 'major' issues, because the diagnosis was usually more involved than the bigger issues which were more obvious.\n")
-    print(f"In total, {total_surgeries} of the {num_entries} entries ({(total_surgeries / num_entries) * 100:.2f})% required some significant modification that prevented them from being handled automatically. This was, by far, the most involved and time-intensive part of building this program.")
-    q1 = ['q1a1', 'q1a2', 'q1a3', 'q1a4', 'q1a5']
-    q2 = ['q2a1', 'q2a2', 'q2a3', 'q2a4', 'q2a5']
-    q3 = ['q3a1', 'q3a2', 'q3a3', 'q3a4', 'q3a5']
-    q4 = ['q4a1', 'q4a2', 'q4a3', 'q4a4', 'q4a5']
-    q5 = ['q5a1', 'q5a2', 'q5a3', 'q5a4', 'q5a5']
-    q6 = ['q6a1', 'q6a2', 'q6a3', 'q6a4', 'q6a5']
-    q7 = ['q7a1', 'q7a2', 'q7a3', 'q7a4', 'q7a5']
-    q8 = ['q8a1', 'q8a2', 'q8a3', 'q8a4', 'q8a5']
-    q9 = ['q9a1', 'q9a2', 'q9a3', 'q9a4', 'q9a5']
-    a = df['q1a1'].value_counts()
-    b = df['q1a2'].value_counts()
-    c = df['q1a3'].value_counts()
-    d = df['q1a4'].value_counts()
-    e = df['q1a5'].value_counts()
-    q1_nan_sum = 0
-    for question in q1:
-        temp_nan = df[question].isna().sum()
-        q1_nan_sum += temp_nan
-    x = a.add(b, fill_value=0).add(c, fill_value=0).add(
-        d, fill_value=0).add(e, fill_value=0)
-    x = x.sort_values(ascending=False)
-    print("***** ***** QUESTION 1 SUMMARY ***** *****")
-    print(f"Here is the data for Question 1 (teams to make the playoffs).")
-    print(
-        f"Out of a possible {pos_answers} answers, {int(sum(x))} answers were recieved.")
-    print(f"{q1_nan_sum} possible answers were not completed.")
-    print(f"{len(x)} different answers were provided for this question.")
-    print("Here are the various answers people provided for this question, in descending order of frequency:")
-    print(x)
-    a = df['q2a1'].value_counts()
-    b = df['q2a2'].value_counts()
-    c = df['q2a3'].value_counts()
-    d = df['q2a4'].value_counts()
-    e = df['q2a5'].value_counts()
-    q2_nan_sum = 0
-    for question in q2:
-        temp_nan = df[question].isna().sum()
-        q2_nan_sum += temp_nan
-    x = a.add(b, fill_value=0).add(c, fill_value=0).add(
-        d, fill_value=0).add(e, fill_value=0)
-    x = x.sort_values(ascending=False)
-    print("***** ***** QUESTION 2 SUMMARY ***** *****")
-    print(f"Here is the data for Question 2 (teams to miss the playoffs).")
-    print(
-        f"Out of a possible {pos_answers} answers, {int(sum(x))} answers were recieved.")
-    print(f"{q2_nan_sum} possible answers were not completed.")
-    print(f"{len(x)} different answers were provided for this question.")
-    print("Here are the various answers people provided for this question, in descending order of frequency:")
-    print(x)
-    a = df['q3a1'].value_counts()
-    b = df['q3a2'].value_counts()
-    c = df['q3a3'].value_counts()
-    d = df['q3a4'].value_counts()
-    e = df['q3a5'].value_counts()
-    q3_nan_sum = 0
-    for question in q3:
-        temp_nan = df[question].isna().sum()
-        q3_nan_sum += temp_nan
-    x = a.add(b, fill_value=0).add(c, fill_value=0).add(
-        d, fill_value=0).add(e, fill_value=0)
-    x = x.sort_values(ascending=False)
-    print("***** ***** QUESTION 3 SUMMARY ***** *****")
-    print(f"Here is the data for Question 3 (coaches to not lose their jobs).")
-    print(
-        f"Out of a possible {pos_answers} answers, {int(sum(x))} answers were recieved.")
-    print(f"{q3_nan_sum} possible answers were not completed.")
-    print(f"{len(x)} different answers were provided for this question.")
-    print("Here are the various answers people provided for this question, in descending order of frequency:")
-    print(x)
-    a = df['q4a1'].value_counts()
-    b = df['q4a2'].value_counts()
-    c = df['q4a3'].value_counts()
-    d = df['q4a4'].value_counts()
-    e = df['q4a5'].value_counts()
-    q4_nan_sum = 0
-    for question in q4:
-        temp_nan = df[question].isna().sum()
-        q4_nan_sum += temp_nan
-    x = a.add(b, fill_value=0).add(c, fill_value=0).add(
-        d, fill_value=0).add(e, fill_value=0)
-    x = x.sort_values(ascending=False)
-    print("***** ***** QUESTION 4 SUMMARY ***** *****")
-    print(f"Here is the data for Question 4 (GMs to not lose their jobs).")
-    print(
-        f"Out of a possible {pos_answers} answers, {int(sum(x))} answers were recieved.")
-    print(f"{q4_nan_sum} possible answers were not completed.")
-    print(f"{len(x)} different answers were provided for this question.")
-    print("Here are the various answers people provided for this question, in descending order of frequency:")
-    print(x)
-    a = df['q5a1'].value_counts()
-    b = df['q5a2'].value_counts()
-    c = df['q5a3'].value_counts()
-    d = df['q5a4'].value_counts()
-    e = df['q5a5'].value_counts()
-    q5_nan_sum = 0
-    for question in q5:
-        temp_nan = df[question].isna().sum()
-        q5_nan_sum += temp_nan
-    x = a.add(b, fill_value=0).add(c, fill_value=0).add(
-        d, fill_value=0).add(e, fill_value=0)
-    x = x.sort_values(ascending=False)
-    print("***** ***** QUESTION 5 SUMMARY ***** *****")
-    print(f"Here is the data for Question 5 (goalies to start 60% of team's games).")
-    print(
-        f"Out of a possible {pos_answers} answers, {int(sum(x))} answers were recieved.")
-    print(f"{q5_nan_sum} possible answers were not completed.")
-    print(f"{len(x)} different answers were provided for this question.")
-    print("Here are the various answers people provided for this question, in descending order of frequency:")
-    print(x)
-    a = df['q6a1'].value_counts()
-    b = df['q6a2'].value_counts()
-    c = df['q6a3'].value_counts()
-    d = df['q6a4'].value_counts()
-    e = df['q6a5'].value_counts()
-    q6_nan_sum = 0
-    for question in q6:
-        temp_nan = df[question].isna().sum()
-        q6_nan_sum += temp_nan
-    x = a.add(b, fill_value=0).add(c, fill_value=0).add(
-        d, fill_value=0).add(e, fill_value=0)
-    x = x.sort_values(ascending=False)
-    print("***** ***** QUESTION 6 SUMMARY ***** *****")
-    print(f"Here is the data for Question 6 (Top 10 Calder Voting).")
-    print(
-        f"Out of a possible {pos_answers} answers, {int(sum(x))} answers were recieved.")
-    print(f"{q6_nan_sum} possible answers were not completed.")
-    print(f"{len(x)} different answers were provided for this question.")
-    print("Here are the various answers people provided for this question, in descending order of frequency:")
-    print(x)
-    a = df['q7a1'].value_counts()
-    b = df['q7a2'].value_counts()
-    c = df['q7a3'].value_counts()
-    d = df['q7a4'].value_counts()
-    e = df['q7a5'].value_counts()
-    q7_nan_sum = 0
-    for question in q7:
-        temp_nan = df[question].isna().sum()
-        q7_nan_sum += temp_nan
-    x = a.add(b, fill_value=0).add(c, fill_value=0).add(
-        d, fill_value=0).add(e, fill_value=0)
-    x = x.sort_values(ascending=False)
-    print("***** ***** QUESTION 7 SUMMARY ***** *****")
-    print(f"Here is the data for Question 7 (Top 10 Norris Voting).")
-    print(
-        f"Out of a possible {pos_answers} answers, {int(sum(x))} answers were recieved.")
-    print(f"{q7_nan_sum} possible answers were not completed.")
-    print(f"{len(x)} different answers were provided for this question.")
-    print("Here are the various answers people provided for this question, in descending order of frequency:")
-    print(x)
-    a = df['q8a1'].value_counts()
-    b = df['q8a2'].value_counts()
-    c = df['q8a3'].value_counts()
-    d = df['q8a4'].value_counts()
-    e = df['q8a5'].value_counts()
-    q8_nan_sum = 0
-    for question in q8:
-        temp_nan = df[question].isna().sum()
-        q8_nan_sum += temp_nan
-    x = a.add(b, fill_value=0).add(c, fill_value=0).add(
-        d, fill_value=0).add(e, fill_value=0)
-    x = x.sort_values(ascending=False)
-    print("***** ***** QUESTION 8 SUMMARY ***** *****")
-    print(f"Here is the data for Question 8 (Top 15 Hart Voting).")
-    print(
-        f"Out of a possible {pos_answers} answers, {int(sum(x))} answers were recieved.")
-    print(f"{q8_nan_sum} possible answers were not completed.")
-    print(f"{len(x)} different answers were provided for this question.")
-    print("Here are the various answers people provided for this question, in descending order of frequency:")
-    print(x)
-    a = df['q9a1'].value_counts()
-    b = df['q9a2'].value_counts()
-    c = df['q9a3'].value_counts()
-    d = df['q9a4'].value_counts()
-    e = df['q9a5'].value_counts()
-    q9_nan_sum = 0
-    for question in q9:
-        temp_nan = df[question].isna().sum()
-        q9_nan_sum += temp_nan
-    x = a.add(b, fill_value=0).add(c, fill_value=0).add(
-        d, fill_value=0).add(e, fill_value=0)
-    x = x.sort_values(ascending=False)
-    print("***** ***** QUESTION 9 SUMMARY ***** *****")
-    print(f"Here is the data for Question 9 (NHL roster players to change teams).")
-    print(
-        f"Out of a possible {pos_answers} answers, {int(sum(x))} answers were recieved.")
-    print(f"{q9_nan_sum} possible answers were not completed.")
-    print(f"{len(x)} different answers were provided for this question.")
-    print("Here are the various answers people provided for this question, in descending order of frequency:")
-    print(x)
-    x = df['q10a1'].value_counts()
-    q10_nan_sum = df.q10a1.isna().sum()
-    x = x.sort_values(ascending=False)
-    print("***** ***** QUESTION 10 SUMMARY ***** *****")
-    print(f"Here is the data for Bonus Question 10 (earn 100+ points, not including McDavid).")
-    print(
-        f"Out of a possible {num_entries} answers, {int(sum(x))} answers were recieved.")
-    print(f"{q10_nan_sum} possible answers were not completed.")
-    print(f"{len(x)} different answers were provided for this question.")
-    print("Here are the various answers people provided for this question, in descending order of frequency:")
-    print(x)
-
-
-def save_to_csv(df):
+    logger.info(f"Entrants provided {num_answers} answers overall.\n")
+    logger.info(f"Of these {num_entries} entries, {major_surgery_count} required major surgery. This is {(major_surgery_count / num_entries) * 100:.2f}% of all entries.")
+    logger.info("'Major surgery' means that the submission had to be rewritten in whole or in part, in order to be processed by the automatic scripting. For example, if someone used spaces as separators rather than commas, my script could not account for this, and the entry had to be rewritten entirely.")
+    logger.info(f"Of these {num_entries} entries, {minor_surgery_count} required minor surgery. This is {(minor_surgery_count / num_entries) * 100:.2f}% of all entries.")
+    logger.info("'Minor surgery' means that individual cells for an entry had to be corrected (some needing a single correction, others needing several), usually because of inconsistencies in the entry.")
+    logger.info("For example, if someone listed 'mcdavid, draisaitl. mackinnon,...', the period instead of a comma would lead to a single cell receiving 'draisaitl. mackinnon' as an answer, and these would have to be corrected manually.")
+    logger.info("Some of these were more problematic than the 'major' issues, because the diagnosis was usually more involved than the bigger issues which were more obvious.\n")
+    logger.info(f"In total, {total_surgeries} of the {num_entries} entries ({(total_surgeries / num_entries) * 100:.2f})% required some significant modification that prevented them from being handled automatically. This was, by far, the most involved and time-intensive part of building this program.")
+    for question, question_report in report["questions"].items():
+        logger.info(f"***** ***** QUESTION {question[1:]} SUMMARY ***** *****")
+        logger.info(f"Here is the data for {question_report['description']}.")
+        logger.info(
+            f"Out of a possible {question_report['possible']} answers, {question_report['received']} answers were recieved.")
+        logger.info(f"{question_report['blank']} possible answers were not completed.")
+        logger.info(f"{question_report['distinct']} different answers were provided for this question.")
+        logger.info("Here are the various answers people provided for this question, in descending order of frequency:")
+        logger.info(question_report["counts"])
+    return report
+
+
+# Formats that save_report can write, along with the module each one needs
+REPORT_FORMATS = {
+    "json": None,
+    "parquet": "pyarrow",
+    "xlsx": "openpyxl",
+}
+
+
+def report_tables(report):
+    """ Lays a report from summarize_answers (or reporting_operations) out
+    as three dataframes, ready to be written out as tables:
+        - "overall": one row per overall statistic ("stat", "value")
+        - "questions": one row per question, with its description and its
+          possible/received/blank/distinct numbers
+        - "answers": every question's frequency table stacked together, one
+          row per question and answer with its count, in the same order
+          they're printed
+    """
+    overall = pd.DataFrame({"stat": list(report["overall"]),
+                            "value": list(report["overall"].values())})
+    questions = pd.DataFrame.from_dict(
+        {question: {key: value for key, value in question_report.items() if key != "counts"}
+         for question, question_report in report["questions"].items()},
+        orient="index")
+    questions.index.name = "question"
+    answers = pd.concat(
+        [pd.DataFrame({"question": question,
+                       "answer": question_report["counts"].index.to_numpy(dtype=object),
+                       "count": question_report["counts"].to_numpy()})
+         for question, question_report in report["questions"].items()],
+        ignore_index=True)
+    return {"overall": overall, "questions": questions.reset_index(), "answers": answers}
+
+
+def report_to_dict(report):
+    """ Returns a copy of a report with each question's counts turned from
+    a Series into a plain dictionary of answer: count (most popular first),
+    so the whole thing can go straight into json.dump.
+    """
+    return {
+        "overall": dict(report["overall"]),
+        "questions": {
+            question: {key: ({answer: int(count) for answer, count in value.items()}
+                             if key == "counts" else value)
+                       for key, value in question_report.items()}
+            for question, question_report in report["questions"].items()
+        },
+    }
+
+
+def save_report(report, formats=("json",), base_name="contest_report"):
+    """ Saves a report from reporting_operations in each of the given
+    formats, so the numbers for the slides and the spreadsheet don't have
+    to be copied off of the screen:
+        - "json": the whole report in one file (see report_to_dict)
+        - "parquet": one file for each of the tables from report_tables,
+          e.g. contest_report_answers.parquet (needs pyarrow)
+        - "xlsx": a workbook with a sheet for each of the overall and
+          question tables, then a sheet with the answer counts for each
+          question (needs openpyxl)
+    A format whose module isn't installed is skipped with a notice. Returns
+    a list of the files written.
+    """
+    written = []
+    tables = None
+    for report_format in formats:
+        if report_format not in REPORT_FORMATS:
+            logger.warning(f"NOTICE: Unknown report format '{report_format}', skipping it")
+            continue
+        module_name = REPORT_FORMATS[report_format]
+        if module_name is not None and importlib.util.find_spec(module_name) is None:
+            logger.warning(f"NOTICE: Saving the report to {report_format} needs {module_name}, which is not installed, skipping it")
+            continue
+        if report_format == "json":
+            report_path = f"{base_name}.json"
+            with open(report_path, "w", encoding="utf-8") as report_file:
+                json.dump(report_to_dict(report), report_file, indent=2)
+            written.append(report_path)
+            continue
+        if tables is None:
+            tables = report_tables(report)
+        if report_format == "parquet":
+            for table_name, table in tables.items():
+                report_path = f"{base_name}_{table_name}.parquet"
+                table.to_parquet(report_path, engine="pyarrow", index=False)
+                written.append(report_path)
+        else:
+            report_path = f"{base_name}.xlsx"
+            with pd.ExcelWriter(report_path, engine="openpyxl") as writer:
+                tables["overall"].to_excel(writer, sheet_name="Overall", index=False)
+                tables["questions"].to_excel(writer, sheet_name="Questions", index=False)
+                for question, question_report in report["questions"].items():
+                    question_report["counts"].to_frame().to_excel(writer, sheet_name=f"Question {question[1:]}")
+            written.append(report_path)
+    for report_path in written:
+        logger.info(f"The report has been saved in the file '{report_path}'.")
+    return written
+
+
+def save_to_csv(df, csv_path='contest_entries_clean.csv'):
     """This function saves the provided cleaned, standardized
-    dataframe to a .csv file. 
+    dataframe to a .csv file (contest_entries_clean.csv, unless
+    another csv_path is given).
     """
     # Save the dataframe to a .csv file
-    print("********** SAVING DATAFRAME TO SPREADSHEET (.CSV) **********")
-    print("The complete standardized dataframe of entries and their answers will be saved to .csv.")
-    print("This will allow for exploration in a spreadsheet with Excel, Google Sheets, etc.")
-    df.to_csv('contest_entries_clean.csv')
-    print("This data has been saved in the file 'contest_entries_clean.csv'.")
-    print("Thank you!")
-
-
-def main():
-    print("Please provide the relative path to the html page you wish to scrape.")
-    print("This page's comments will be scraped for entries to the 2021-22 Down Goes Brown Prediction Contest.")
-    source_html = input("Path to .html: ")
-    authors, comments = entry_scraper(source_html)
-    major_surgery_count, authors, comments = comment_fixer(authors, comments)
-    df = generate_dataframe(authors, comments)
-    df, minor_surgery_count = dataframe_fixer(df)
-    df = standardization_operations(df, authors)
-    reporting_operations(df, minor_surgery_count, major_surgery_count)
-    save_to_csv(df)
+    logger.info("********** SAVING DATAFRAME TO SPREADSHEET (.CSV) **********")
+    logger.info("The complete standardized dataframe of entries and their answers will be saved to .csv.")
+    logger.info("This will allow for exploration in a spreadsheet with Excel, Google Sheets, etc.")
+    df.to_csv(csv_path)
+    logger.info(f"This data has been saved in the file '{csv_path}'.")
+    logger.info("Thank you!")
+
+
+def categorize_answers(df):
+    """ Returns a copy of a standardized dataframe with every answer column
+    turned into a pandas Categorical. All of the columns for a question
+    share the same (sorted) categories, so the same answer has the same
+    code in every column of that question. Blanks stay as NaN.
+    """
+    df = df.copy()
+    for columns in QUESTION_COLUMNS.values():
+        answers = df[columns].to_numpy(dtype=object)
+        categories = sorted(pd.unique(answers[pd.notna(answers)]))
+        answer_type = pd.CategoricalDtype(categories)
+        for column in columns:
+            df[column] = df[column].astype(answer_type)
+    return df
+
+
+def categorical_operations(df):
+    """ Once the answers are standardized, each answer column only holds a
+    few dozen different answers, repeated over and over. This function
+    turns every answer column into a pandas Categorical (see
+    categorize_answers), with the columns for each question sharing the
+    same categories, which takes far less memory and makes counting and
+    comparing answers quicker. Returns the converted dataframe, and a
+    dictionary with its memory use (by memory_usage(deep=True)) in bytes
+    "before" and "after" converting, and the bytes "saved".
+    """
+    logger.info("********** CONVERTING ANSWERS TO CATEGORIES **********")
+    memory_before = int(df.memory_usage(deep=True).sum())
+    df = categorize_answers(df)
+    memory_after = int(df.memory_usage(deep=True).sum())
+    memory_report = {"before": memory_before, "after": memory_after, "saved": memory_before - memory_after}
+    logger.info(f"The dataframe used {memory_before / (1024 * 1024):.2f} MB before converting, "
+                f"and {memory_after / (1024 * 1024):.2f} MB after.")
+    logger.info(f"Converting saved {memory_report['saved'] / (1024 * 1024):.2f} MB "
+                f"({memory_report['saved'] / memory_before * 100 if memory_before else 0:.1f}% of the dataframe).")
+    return df, memory_report
+
+
+# Formats that export_entries can write, along with the module each one needs
+EXPORT_FORMATS = {
+    "csv": None,
+    "parquet": "pyarrow",
+    "feather": "pyarrow",
+}
+
+
+def export_entries(df, formats=("csv",), base_name="contest_entries_clean"):
+    """ Saves the cleaned, standardized dataframe in each of the given
+    formats. "csv" is written by save_to_csv, exactly as it always has
+    been. "parquet" and "feather" are columnar formats (both need pyarrow)
+    that keep the answer columns dictionary-encoded (see
+    categorize_answers), which makes for much smaller files that load
+    without re-parsing any text; see load_entries. Feather files are left
+    uncompressed so they can be memory-mapped. A format whose module isn't
+    installed is skipped with a notice. Returns a list of the files written.
+    """
+    written = []
+    columnar = None
+    for export_format in formats:
+        if export_format not in EXPORT_FORMATS:
+            logger.warning(f"NOTICE: Unknown export format '{export_format}', skipping it")
+            continue
+        module_name = EXPORT_FORMATS[export_format]
+        if module_name is not None and importlib.util.find_spec(module_name) is None:
+            logger.warning(f"NOTICE: Saving to {export_format} needs {module_name}, which is not installed, skipping it")
+            continue
+        if export_format == "csv":
+            save_to_csv(df, f"{base_name}.csv")
+            written.append(f"{base_name}.csv")
+            continue
+        if columnar is None:
+            columnar = categorize_answers(df)
+        export_path = f"{base_name}.{export_format}"
+        if export_format == "parquet":
+            columnar.to_parquet(export_path, engine="pyarrow")
+        else:
+            # Feather can't store an index, so the comment IDs are saved as a column
+            columnar.reset_index().to_feather(export_path, compression="uncompressed")
+        logger.info(f"This data has also been saved in the file '{export_path}'.")
+        written.append(export_path)
+    return written
+
+
+def load_entries(entries_path):
+    """ Loads a dataframe saved by export_entries, from a .parquet,
+    .feather or .csv file. Parquet and Feather files are memory-mapped and
+    come back with their categorical answer columns (and, for Feather, the
+    comment IDs put back as the index).
+    """
+    if entries_path.endswith(".csv"):
+        return pd.read_csv(entries_path, index_col=0, dtype=object)
+    if entries_path.endswith(".parquet"):
+        import pyarrow.parquet
+        return pyarrow.parquet.read_table(entries_path, memory_map=True).to_pandas()
+    import pyarrow.feather
+    df = pyarrow.feather.read_table(entries_path, memory_map=True).to_pandas()
+    index_column = df.columns[0]
+    if index_column != "author":
+        df = df.set_index(index_column)
+        if index_column == "index":
+            df.index.name = None
+    return df
+
+
+# How far process_page takes each page, in order: "scrape" just saves the scraped comments,
+# "standardize" saves the fixed and standardized entries, and "score" does everything
+# (the report, the answer index, and scores if there's an answer key)
+PIPELINE_STAGES = ["scrape", "standardize", "score"]
+# Exit codes for main
+EXIT_OK = 0
+# At least one page couldn't be processed
+EXIT_FAILED = 1
+# Bad arguments, or no pages to process (argparse also exits with 2)
+EXIT_USAGE = 2
+# Every page was processed, but some fixes in the fix ledger no longer match their entries
+EXIT_STALE_FIXES = 3
+
+
+def parse_args(argv=None):
+    """ Reads the command line arguments for main (from sys.argv, unless a
+    list of arguments is given). Run with --help to see them all.
+    """
+    arg_parser = argparse.ArgumentParser(
+        description="Scrapes, fixes, standardizes, reports on and scores the entries to the "
+                    "2021-22 Down Goes Brown Prediction Contest from saved copies of the contest page.",
+        epilog=f"Exit codes: {EXIT_OK} everything worked, {EXIT_FAILED} a page couldn't be processed, "
+               f"{EXIT_USAGE} bad arguments or no pages, {EXIT_STALE_FIXES} some fixes in the fix ledger "
+               "no longer match their entries.")
+    arg_parser.add_argument("pages", nargs="*",
+                            help="saved .html pages to scrape, or glob patterns matching them (e.g. 'pages/*.html'). "
+                                 "If none are given, you'll be asked for one.")
+    arg_parser.add_argument("-o", "--output-dir", default=".",
+                            help="where to save everything (default: the current directory). With more than one "
+                                 "page, each page gets its own folder in here, named after the page")
+    arg_parser.add_argument("--formats", nargs="+", choices=list(EXPORT_FORMATS), default=["csv", "parquet", "feather"],
+                            help="formats to save the standardized entries in (default: all of them)")
+    arg_parser.add_argument("--report-formats", nargs="+", choices=list(REPORT_FORMATS),
+                            default=["json", "parquet", "xlsx"],
+                            help="formats to save the report in (default: all of them)")
+    arg_parser.add_argument("--through", choices=PIPELINE_STAGES, default="score",
+                            help="how far to take each page: just scrape its comments, go through standardization, "
+                                 "or go all the way through the report and scoring (the default)")
+    arg_parser.add_argument("--answer-key",
+                            help="a .json answer key (see load_answer_key) to score the entries against")
+    arg_parser.add_argument("-j", "--workers", type=int, default=1,
+                            help="number of processes to read comments with (default: 1)")
+    arg_parser.add_argument("--parser", default="html.parser",
+                            help="BeautifulSoup parser to scrape with (default: html.parser)")
+    arg_parser.add_argument("--streaming", action="store_true",
+                            help="read each page in chunks as it's scraped, rather than all at once")
+    arg_parser.add_argument("--build-ledger", action="store_true",
+                            help="build the fix ledger (fix_ledger.json next to this script) from the page with "
+                                 "the hand-written fixers, and use it from then on. Only for the 2021-22 page, "
+                                 "which the fixers were written for")
+    arg_parser.add_argument("--cache", default=STAGE_CACHE_PATH,
+                            help="stage cache file (default: stage_cache.sqlite next to this script). "
+                                 "Use :memory: to not keep one")
+    arg_parser.add_argument("--warnings-file",
+                            help="one file to write every page's SNITCHING and INTERPRETATION warnings to "
+                                 f"(default: {WARNINGS_FILE_NAME} in each page's output folder). "
+                                 "Each warning says which page it came from either way")
+    arg_parser.add_argument("--profile", nargs="?", const="full", choices=["full", "light"],
+                            help="measure the time and memory each stage takes, and save it to "
+                                 "contest_profile.json alongside everything else. 'light' skips tracemalloc, "
+                                 "which slows everything down (a lot, for scraping) but measures Python's own "
+                                 "memory use")
+    verbosity = arg_parser.add_mutually_exclusive_group()
+    verbosity.add_argument("-q", "--quiet", action="store_true", help="only show warnings and errors")
+    verbosity.add_argument("-v", "--verbose", action="store_true",
+                           help="show every entry and fix as it's handled")
+    args = arg_parser.parse_args(argv)
+    if args.workers < 1:
+        arg_parser.error("--workers must be at least 1")
+    if args.answer_key is not None and args.through != "score":
+        arg_parser.error("--answer-key only makes sense with --through score")
+    return args
+
+
+def expand_pages(patterns):
+    """ Expands each of the given pages or glob patterns into the pages
+    they match (in sorted order, without repeats). Returns the list of
+    pages, and a list of any patterns that didn't match anything.
+    """
+    pages = []
+    unmatched = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern))
+        else:
+            matches = [pattern] if os.path.exists(pattern) else []
+        if not matches:
+            unmatched.append(pattern)
+        pages.extend(match for match in matches if match not in pages)
+    return pages, unmatched
+
+
+# What profile_stage records for each stage of the pipeline, in the order they're shown
+PROFILE_COLUMNS = ["stage", "wall_seconds", "cpu_seconds", "peak_rss_mb", "tracemalloc_peak_mb",
+                   "rows_in", "rows_out"]
+
+
+def peak_rss_mb(reset=False):
+    """ Returns the most memory (resident set size, in MB) this process has
+    held at once. On Linux, reset=True starts the count over, so the next
+    call gives the peak since the reset. Elsewhere it can't be reset, and is
+    the peak since the process started. NaN if it can't be found at all.
+    """
+    if os.path.exists("/proc/self/clear_refs"):
+        with contextlib.suppress(OSError):
+            if reset:
+                with open("/proc/self/clear_refs", "w") as clear_refs:
+                    clear_refs.write("5")
+            with open("/proc/self/status") as status:
+                for line in status:
+                    if line.startswith("VmHWM:"):
+                        return int(line.split()[1]) / 1024
+    if resource is None:
+        return np.nan
+    # ru_maxrss is in bytes on macOS, and kB everywhere else
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / 1024 ** 2 if sys.platform == "darwin" else max_rss / 1024
+
+
+def children_cpu_seconds():
+    """ Returns the CPU time used by all of the finished worker processes
+    (e.g. from generate_dataframe or simulate_seasons), or 0 if it can't be
+    found.
+    """
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+@contextlib.contextmanager
+def profile_stage(profile, stage, rows_in=None):
+    """ Measures whatever runs inside the with block as one stage of the
+    pipeline, and adds a row for it to profile (a list, see PROFILE_COLUMNS):
+    wall and CPU time (the CPU time includes worker processes that finish
+    during the stage), peak RSS and the peak memory seen by tracemalloc,
+    and the number of rows that went in and came out. Yields the row, so
+    "rows_out" can be filled in once it's known. If profile is None,
+    nothing is measured.
+
+    The tracemalloc peak is only measured if tracemalloc is already running
+    (NaN otherwise). It only sees memory allocated through Python (which
+    includes numpy and pandas), and it slows everything down a lot while
+    it's running, parsing HTML most of all, so times taken with it on are
+    only good for comparing against each other.
+    """
+    row = {"stage": stage, "rows_in": rows_in, "rows_out": None}
+    if profile is None:
+        yield row
+        return
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+    peak_rss_mb(reset=True)
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time() + children_cpu_seconds()
+    try:
+        yield row
+    finally:
+        row["wall_seconds"] = time.perf_counter() - wall_start
+        row["cpu_seconds"] = time.process_time() + children_cpu_seconds() - cpu_start
+        row["peak_rss_mb"] = peak_rss_mb()
+        row["tracemalloc_peak_mb"] = tracemalloc.get_traced_memory()[1] / 1024 ** 2 if tracing else np.nan
+        profile.append(row)
+
+
+def profile_table(profile):
+    """ Returns the rows from profile_stage as a dataframe, with a "total"
+    row on the end (total times, and the highest peaks).
+    """
+    table = pd.DataFrame(profile, columns=PROFILE_COLUMNS)
+    # Row counts can be missing (e.g. nothing goes into entry_scraper), so they're nullable integers
+    table[["rows_in", "rows_out"]] = table[["rows_in", "rows_out"]].astype("Int64")
+    total = {"stage": "total",
+             "wall_seconds": table["wall_seconds"].sum(),
+             "cpu_seconds": table["cpu_seconds"].sum(),
+             "peak_rss_mb": table["peak_rss_mb"].max(),
+             "tracemalloc_peak_mb": table["tracemalloc_peak_mb"].max()}
+    return pd.concat([table, pd.DataFrame([total])], ignore_index=True)
+
+
+def save_profile(profile, profile_path):
+    """ Prints a summary table of the rows from profile_stage, and saves
+    them to profile_path as a .json list with one object per stage (plus
+    the total).
+    """
+    table = profile_table(profile)
+    logger.info("********** STAGE PROFILE **********")
+    shown = table.astype({"rows_in": object, "rows_out": object}).fillna({"rows_in": "", "rows_out": ""})
+    logger.info(shown.to_string(index=False, float_format=lambda x: f"{x:.2f}"))
+    table.to_json(profile_path, orient="records", indent=2)
+    logger.info(f"This profile has been saved in the file '{profile_path}'.")
+
+
+def process_page(source_html, output_dir, args):
+    """ Runs one saved page through the whole pipeline, as far as
+    args.through (see PIPELINE_STAGES and parse_args), saving everything
+    into output_dir. Returns the fixes from the fix ledger that no longer
+    matched their entries (an empty list if there were none, or if the
+    hand-written fixers were used instead).
+
+    With args.profile, each stage is measured (see profile_stage), and the
+    results are printed and saved to contest_profile.json in output_dir.
+    tracemalloc runs the whole time for a "full" profile, but not for a
+    "light" one, which keeps the times true to an unprofiled run.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    profile = [] if args.profile else None
+    if args.profile == "full":
+        tracemalloc.start()
+    try:
+        return run_stages(source_html, output_dir, args, profile)
+    finally:
+        if args.profile == "full":
+            tracemalloc.stop()
+        if profile:
+            save_profile(profile, os.path.join(output_dir, "contest_profile.json"))
+
+
+def run_stages(source_html, output_dir, args, profile=None):
+    """ Does the work for process_page, measuring each stage into profile
+    (see profile_stage) if it's given.
+    """
+    with profile_stage(profile, "entry_scraper") as stage:
+        authors, comments, comment_ids, scrape_report = entry_scraper(
+            source_html, streaming=args.streaming, parser=args.parser)
+        stage["rows_out"] = len(comments)
+    if args.through == "scrape":
+        comments_path = os.path.join(output_dir, "contest_comments.csv")
+        with profile_stage(profile, "save_comments", len(comments)) as stage:
+            pd.DataFrame({"author": authors, "comment": comments},
+                         index=pd.Index(comment_ids, name="comment_id")).to_csv(comments_path)
+            stage["rows_out"] = len(comments)
+        logger.info(f"The scraped comments have been saved in the file '{comments_path}'.")
+        return []
+    if args.build_ledger:
+        with profile_stage(profile, "build_fix_ledger", len(comments)):
+            build_fix_ledger(authors, comments)
+    stale_fixes = []
+    # Rows parsed and standardized on earlier runs are kept here, so only new or edited comments are redone.
+    # It's closed even if a stage raises, since main carries on with the next page
+    with contextlib.closing(open_stage_cache(args.cache)) as cache:
+        # Use the fix ledger if it's been built, otherwise fall back on the hand-written fixers
+        if os.path.exists(FIX_LEDGER_PATH):
+            ledger = load_fix_ledger(FIX_LEDGER_PATH)
+            with profile_stage(profile, "apply_comment_ledger", len(comments)) as stage:
+                major_surgery_count, authors, comments, entry_keys, stale_fixes = apply_comment_ledger(
+                    authors, comments, ledger)
+                stage["rows_out"] = len(comments)
+            with profile_stage(profile, "generate_dataframe", len(comments)) as stage:
+                df, parse_summary = cached_generate_dataframe(authors, comments, cache, workers=args.workers,
+                                                              comment_ids=comment_ids)
+                stage["rows_out"] = len(df)
+            with profile_stage(profile, "apply_dataframe_ledger", len(df)) as stage:
+                df, minor_surgery_count, stale_cell_fixes = apply_dataframe_ledger(df, ledger, entry_keys)
+                stage["rows_out"] = len(df)
+            stale_fixes += stale_cell_fixes
+            if stale_fixes:
+                logger.warning(f"WARNING: {len(stale_fixes)} fixes in the ledger no longer match their entries, "
+                               "see above")
+        else:
+            with profile_stage(profile, "comment_fixer", len(comments)) as stage:
+                major_surgery_count, authors, comments = comment_fixer(authors, comments)
+                stage["rows_out"] = len(comments)
+            with profile_stage(profile, "generate_dataframe", len(comments)) as stage:
+                df, parse_summary = cached_generate_dataframe(authors, comments, cache, workers=args.workers,
+                                                              comment_ids=comment_ids)
+                stage["rows_out"] = len(df)
+            with profile_stage(profile, "dataframe_fixer", len(df)) as stage:
+                df, minor_surgery_count = dataframe_fixer(df)
+                stage["rows_out"] = len(df)
+        with profile_stage(profile, "standardization_operations", len(df)) as stage:
+            df, standardize_summary = cached_standardization_operations(df, cache)
+            stage["rows_out"] = len(df)
+    logger.info("********** STAGE CACHE SUMMARY **********")
+    for stage_name, stage_summary in [("parse", parse_summary), ("standardize", standardize_summary)]:
+        logger.info(f"{stage_name}: {stage_summary['hits']} rows reused, {stage_summary['misses']} rows redone")
+    with profile_stage(profile, "categorical_operations", len(df)) as stage:
+        df, memory_report = categorical_operations(df)
+        stage["rows_out"] = len(df)
+    entries_base = os.path.join(output_dir, "contest_entries_clean")
+    if args.through == "standardize":
+        with profile_stage(profile, "export_entries", len(df)) as stage:
+            export_entries(df, formats=args.formats, base_name=entries_base)
+            stage["rows_out"] = len(df)
+        return stale_fixes
+    with profile_stage(profile, "reporting_operations", len(df)) as stage:
+        report = reporting_operations(df, minor_surgery_count, major_surgery_count)
+        save_report(report, formats=args.report_formats, base_name=os.path.join(output_dir, "contest_report"))
+        stage["rows_out"] = len(df)
+    with profile_stage(profile, "export_entries", len(df)) as stage:
+        export_entries(df, formats=args.formats, base_name=entries_base)
+        stage["rows_out"] = len(df)
+    index_path = os.path.join(output_dir, "contest_entries_index.npz")
+    with profile_stage(profile, "save_answer_index", len(df)) as stage:
+        save_answer_index(build_answer_index(df), index_path, df["author"])
+        stage["rows_out"] = len(df)
+    logger.info(f"An index of who picked each answer has been saved in the file '{index_path}'.")
+    if args.answer_key is None:
+        logger.info("No answer key was given (see --answer-key), so the entries haven't been scored.")
+        return stale_fixes
+    scores_path = os.path.join(output_dir, "contest_scores.csv")
+    with profile_stage(profile, "score_entries", len(df)) as stage:
+        scores = score_entries(df, load_answer_key(args.answer_key))
+        scores.insert(0, "author", df["author"].astype(object))
+        scores.sort_values("total", ascending=False, kind="stable").to_csv(scores_path)
+        stage["rows_out"] = len(scores)
+    logger.info(f"The scores have been saved in the file '{scores_path}'.")
+    return stale_fixes
+
+
+def main(argv=None):
+    """ Runs the pipeline over every page given on the command line (see
+    parse_args), and returns an exit code: EXIT_OK if everything worked,
+    EXIT_FAILED if any page couldn't be processed (the others still are),
+    EXIT_USAGE if there were no pages to process, or EXIT_STALE_FIXES if
+    the fix ledger had fixes that no longer matched their entries.
+    """
+    args = parse_args(argv)
+    log_level = logging.DEBUG if args.verbose else logging.INFO
+    configure_logging(level=log_level, quiet=args.quiet)
+    patterns = args.pages
+    if not patterns:
+        if not sys.stdin.isatty():
+            logger.error("ERROR: No pages were given to scrape (see --help)")
+            return EXIT_USAGE
+        logger.info("Please provide the relative path to the html page you wish to scrape.")
+        logger.info("This page's comments will be scraped for entries to the 2021-22 Down Goes Brown Prediction Contest.")
+        patterns = [input("Path to .html: ")]
+    pages, unmatched = expand_pages(patterns)
+    for pattern in unmatched:
+        logger.error(f"ERROR: No pages found for '{pattern}'")
+    if unmatched or not pages:
+        return EXIT_USAGE
+    exit_code = EXIT_OK
+    for page_number, source_html in enumerate(pages):
+        output_dir = args.output_dir
+        if len(pages) > 1:
+            output_dir = os.path.join(output_dir, os.path.splitext(os.path.basename(source_html))[0])
+        os.makedirs(output_dir, exist_ok=True)
+        # Each page's warnings go in its own folder, or all together (one page after another) in --warnings-file
+        if args.warnings_file is None:
+            configure_logging(level=log_level, quiet=args.quiet, page=source_html,
+                              warnings_path=os.path.join(output_dir, WARNINGS_FILE_NAME))
+        else:
+            configure_logging(level=log_level, quiet=args.quiet, page=source_html,
+                              warnings_path=args.warnings_file, append=page_number > 0)
+        if len(pages) > 1:
+            logger.info(f"********** PROCESSING {source_html} **********")
+        try:
+            stale_fixes = process_page(source_html, output_dir, args)
+        except Exception:
+            logger.exception(f"ERROR: Could not process '{source_html}'")
+            exit_code = EXIT_FAILED
+            continue
+        if stale_fixes and exit_code == EXIT_OK:
+            exit_code = EXIT_STALE_FIXES
+    return exit_code
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
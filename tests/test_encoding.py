@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import DGB2021entries as contest
+
+
+@pytest.fixture(scope="module")
+def standardized():
+    """ A small standardized frame, from synthetic entries run through the
+    same parse and standardize steps as a real page.
+    """
+    authors, comments = contest.synthetic_entries(300, seed=7)
+    return contest.standardization_operations(contest.generate_dataframe(authors, comments))
+
+
+@pytest.fixture(scope="module")
+def answer_key(standardized):
+    """ A sample key: every third answer given to each question is right,
+    and question 10 is worth 5 points with a 5 point penalty, like the
+    real contest.
+    """
+    answer_key = {}
+    for question, columns in contest.QUESTION_COLUMNS.items():
+        answers = standardized[columns].to_numpy(dtype=object)
+        given = sorted(pd.unique(answers[pd.notna(answers)]))
+        points, penalty = (5, 5) if question == "q10" else (1, 0)
+        answer_key[question] = {"answers": set(given[::3]), "points": points, "penalty": penalty}
+    return answer_key
+
+
+def answer_sets(df):
+    return [[frozenset(row[pd.notna(row)]) for row in df[columns].to_numpy(dtype=object)]
+            for columns in contest.QUESTION_COLUMNS.values()]
+
+
+def test_decode_gives_back_every_answer(standardized):
+    bits, layout = contest.encode_entries(standardized)
+    decoded = contest.decode_entries(bits, layout, index=standardized.index)
+    assert list(decoded.columns) == list(standardized.columns[1:])
+    assert answer_sets(decoded) == answer_sets(standardized)
+
+
+def test_decode_with_a_fixed_vocabulary(standardized):
+    # Answers nobody gave are kept in the vocabulary, and answers missing from it are added
+    vocabularies = {"q1": ["zzz", "col"], "q8": []}
+    bits, layout = contest.encode_entries(standardized, vocabularies)
+    assert layout["q1"][1][:2] == ["zzz", "col"]
+    decoded = contest.decode_entries(bits, layout, index=standardized.index)
+    assert answer_sets(decoded) == answer_sets(standardized)
+
+
+def test_bitset_scores_match_score_entries(standardized, answer_key):
+    bits, layout = contest.encode_entries(standardized)
+    scores = contest.score_bitsets(bits, layout, answer_key, index=standardized.index)
+    expected = contest.score_entries(standardized, answer_key)
+    assert list(scores.columns) == list(expected.columns)
+    for column in expected.columns:
+        np.testing.assert_array_equal(scores[column].to_numpy(), expected[column].to_numpy())
+
+
+def test_repeated_picks_count_once(answer_key):
+    columns = [column for columns in contest.QUESTION_COLUMNS.values() for column in columns]
+    df = pd.DataFrame(np.nan, index=range(2), columns=["author"] + columns, dtype=object)
+    df["author"] = ["Entrant 0", "Entrant 1"]
+    right_answer = sorted(answer_key["q1"]["answers"])[0]
+    df.loc[0, ["q1a1", "q1a2"]] = right_answer
+    df.loc[1, "q1a1"] = right_answer
+    bits, layout = contest.encode_entries(df)
+    scores = contest.score_bitsets(bits, layout, answer_key)
+    assert scores["q1_points"].tolist() == contest.score_entries(df, answer_key)["q1_points"].tolist() == [1, 1]
+
+
+def test_check_entry_encoding(standardized, answer_key):
+    results = contest.check_entry_encoding(standardized, answer_key)
+    assert (results["entries_changed"] == 0).all()
+    assert results["scores_match"].all()
@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+import DGB2021entries as contest
+
+PAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pages", "comments.html")
+BACKENDS = list(contest.PARSER_BACKENDS) + ["stream"]
+
+
+def extract(parser):
+    """ Pulls (authors, comments, comment IDs) out of the test page with one
+    backend, the way entry_scraper would.
+    """
+    if parser == "stream":
+        found = list(contest.stream_comments(PAGE))
+        return tuple([x[i] for x in found] for i in range(3))
+    with open(PAGE, "r", encoding="utf8") as page:
+        return contest.extract_comments(page.read(), parser)
+
+
+def skip_if_missing(parser):
+    if parser != "stream" and contest.available_parser(parser) != parser:
+        pytest.skip(f"{parser} isn't installed")
+
+
+def test_html_parser_reads_the_page():
+    authors, comments, comment_ids = extract("html.parser")
+    assert authors == ["Julian M", "Emma G", "Kevin A", "Kevin A"]
+    assert comments[0].startswith("1. veg, col, nyi, tbl, tor")
+    assert comments[1].startswith("1. tbl & col & veg")
+    # The reply's script isn't part of its text
+    assert comments[2] == "good luck everyone!"
+    # IDs come from the comment's own element, never the shared "comment-list" wrapper
+    assert comment_ids[:3] == ["comment-1001", "1002", "comment-1003"]
+    assert comment_ids[3].startswith("c") and comment_ids[3] != "comment-list"
+
+
+@pytest.mark.parametrize("parser", BACKENDS)
+def test_backend_matches_html_parser(parser):
+    skip_if_missing(parser)
+    authors, comments, comment_ids = extract(parser)
+    expected_authors, expected_comments, expected_ids = extract("html.parser")
+    assert authors == expected_authors
+    assert comments == expected_comments
+    assert comment_ids == expected_ids
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64])
+def test_stream_matches_across_chunk_sizes(chunk_size):
+    found = list(contest.stream_comments(PAGE, chunk_size=chunk_size))
+    assert tuple([x[i] for x in found] for i in range(3)) == extract("html.parser")
+
+
+def test_compare_parser_backends():
+    results = contest.compare_parser_backends(PAGE)
+    assert results["matches_html_parser"].all()
+    assert (results["comments"] == 4).all()
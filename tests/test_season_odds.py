@@ -0,0 +1,51 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import DGB2021entries as contest
+
+
+def entries_frame(picks):
+    """ A dataframe of blank entries with every answer column, filled in
+    with picks, a list of {column: answer} for each entry.
+    """
+    columns = [column for columns in contest.QUESTION_COLUMNS.values() for column in columns]
+    df = pd.DataFrame(np.nan, index=range(len(picks)), columns=["author"] + columns, dtype=object)
+    df["author"] = [f"Entrant {i}" for i in range(len(picks))]
+    for row, entry_picks in enumerate(picks):
+        for column, answer in entry_picks.items():
+            df.at[row, column] = answer
+    return df
+
+
+def write_odds(tmp_path, odds):
+    odds_path = tmp_path / "odds.json"
+    odds_path.write_text(json.dumps(odds), encoding="utf8")
+    return str(odds_path)
+
+
+@pytest.mark.parametrize("question, likely, unlikely", [
+    ("q2", "tor", "ari"),  # playoff odds, but q2 is teams to miss the playoffs
+    ("q3", "cooper", "tocchet"),  # firing odds, but q3 is coaches to keep their jobs
+])
+def test_odds_against_questions_are_flipped(tmp_path, question, likely, unlikely):
+    odds_path = write_odds(tmp_path, {question: {"odds": {likely: 0.95, unlikely: 0.05}}})
+    season_odds = contest.load_season_odds(odds_path)
+    assert season_odds[question]["probabilities"] == pytest.approx([0.05, 0.95])
+
+    column = contest.QUESTION_COLUMNS[question][0]
+    df = entries_frame([{column: likely}, {column: unlikely}])
+    projection = contest.simulate_seasons(df, season_odds, simulations=4000, workers=1, seed=0)
+    # Whoever picked the team likely to make the playoffs (or the coach likely to be
+    # fired) is the one who should be losing
+    assert projection.loc[1, "expected_score"] == pytest.approx(0.95, abs=0.02)
+    assert projection.loc[0, "expected_score"] == pytest.approx(0.05, abs=0.02)
+    assert projection.loc[1, "win_probability"] > projection.loc[0, "win_probability"]
+
+
+def test_odds_for_questions_are_not_flipped(tmp_path):
+    odds_path = write_odds(tmp_path, {"q1": {"odds": {"tor": 0.95, "ari": 0.05}}})
+    season_odds = contest.load_season_odds(odds_path)
+    assert season_odds["q1"]["probabilities"] == pytest.approx([0.95, 0.05])